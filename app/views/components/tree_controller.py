@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Callable
+from typing import Any, Callable
 
 from PySide6.QtCore import QByteArray, Qt
 from PySide6.QtWidgets import QHeaderView, QTreeView
@@ -254,11 +254,24 @@ class TreeController:
         model, proxy = build_model(groups)
         if proxy is not None:
             proxy.setParent(self.tree)
+            # Install the proxy with sorting off so setModel doesn't sort it
+            # by the header's stale indicator, then point the indicator at the
+            # preserved sort state and re-enable — setSortingEnabled(True)
+            # performs exactly one sort. Calling sortByColumn with sorting on
+            # sorted the fresh proxy twice.
+            sorting_enabled = self.tree.isSortingEnabled()
+            self.tree.setSortingEnabled(False)
             self.tree.setModel(proxy)
             self._proxy = proxy
             self._model = model
-            # Preserve the current sort order instead of resetting to default
-            self.tree.sortByColumn(self._current_sort_column, self._current_sort_order)
+            if sorting_enabled:
+                self.tree.header().setSortIndicator(
+                    self._current_sort_column, self._current_sort_order
+                )
+                self.tree.setSortingEnabled(True)
+            else:
+                # Preserve the current sort order instead of resetting to default
+                self.tree.sortByColumn(self._current_sort_column, self._current_sort_order)
         else:
             self.tree.setModel(model)
             self._proxy = None
@@ -280,7 +293,22 @@ class TreeController:
         if old_model is not None and old_model is not model:
             old_model.deleteLater()
 
-        # Expand all first so content-based width accounts for children
+        # Expand + auto-size run as one batch with viewport updates
+        # suspended: on a large manifest the expand and the per-column
+        # ResizeToContents passes would otherwise each schedule a repaint
+        # of the whole tree. A single update lands when re-enabled.
+        updates_enabled = self.tree.updatesEnabled()
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self._expand_and_autosize_columns()
+        finally:
+            self.tree.setUpdatesEnabled(updates_enabled)
+
+    def _expand_and_autosize_columns(self) -> None:
+        """Expand every group, then size columns to their contents."""
+        # Expand all first so content-based width accounts for children.
+        # One recursive expandAll() — never a per-group expand() loop, which
+        # relayouts the view once per row.
         try:
             self.tree.expandAll()
         except Exception:
@@ -352,6 +380,7 @@ class TreeController:
                         selected_items.append({"type": "group", "group_number": group_number})
         except Exception as e:
             logger.error("Error gathering selected items: {}", e)
+        logger.debug("Gathered {} selected tree items", len(selected_items))
         return selected_items
 
     def get_file_path_from_index(self, index) -> str | None:
@@ -412,21 +441,19 @@ class TreeController:
                 # This is a group row - try to get group number from SORT_ROLE first
                 group_index = model.index(idx.row(), COL_GROUP, idx.parent())
 
-                # Try SORT_ROLE first (most reliable)
+                # Try SORT_ROLE first (most reliable). No per-index debug
+                # logging here or below: this runs once per selected group
+                # row, and get_selected_items logs one aggregate line instead.
                 group_num = model.data(group_index, SORT_ROLE)
                 if group_num is not None:
-                    logger.debug("Got group number from SORT_ROLE: {}", group_num)
                     return int(group_num)
 
                 # Fallback to parsing display text
                 group_text = model.data(group_index, Qt.DisplayRole)
-                logger.debug("Group text from index: '{}'", group_text)
 
                 if group_text and isinstance(group_text, str) and group_text.startswith("Group "):
                     try:
-                        group_num = int(group_text.split(" ")[1])
-                        logger.debug("Extracted group number from text: {}", group_num)
-                        return group_num
+                        return int(group_text.split(" ")[1])
                     except (IndexError, ValueError) as e:
                         logger.error("Failed to parse group number from '{}': {}", group_text, e)
                 else:
@@ -465,26 +492,24 @@ class TreeController:
 
         Skips post-rebuild side effects (restore_column_state,
         reconnect_selection_handler, expandAll, ResizeToContents) that are
-        only needed when the model is fully replaced.  Group-level
-        SORT_ROLE aggregates are NOT updated here — that would require
-        reading all sibling rows.  set_decision_by_regex stays on the
-        full-rebuild path for exactly this reason.
+        only needed when the model is fully replaced.
+
+        Display text and SORT_ROLE go through one ``setItemData`` call per
+        cell, and the per-cell ``dataChanged`` signals are folded into one
+        role-hinted emission per group (see :meth:`_set_file_cells`).
+        Group-level SORT_ROLE aggregates are NOT updated here — that would
+        require reading all sibling rows.  set_decision_by_regex stays on
+        the full-rebuild path for exactly this reason.
         """
-        model = self._model
-        if model is None:
-            return
-        for g_i, m_i, decision in changes:
-            try:
-                group_item = model.item(g_i, COL_GROUP)
-                if group_item is None:
-                    continue
-                action_item = group_item.child(m_i, COL_ACTION)
-                if action_item is None:
-                    continue
-                action_item.setText(_action_display(decision))
-                action_item.setData(_DECISION_SORT.get(decision, 3), SORT_ROLE)
-            except Exception as exc:
-                logger.error("update_decision_cells failed at ({}, {}): {}", g_i, m_i, exc)
+        self._set_file_cells(
+            changes,
+            COL_ACTION,
+            lambda decision: {
+                Qt.DisplayRole: _action_display(decision),
+                SORT_ROLE: _DECISION_SORT.get(decision, 3),
+            },
+            "update_decision_cells",
+        )
 
     def update_lock_cells(
         self, changes: list[tuple[int, int, bool]]
@@ -495,21 +520,57 @@ class TreeController:
         Same incremental pattern as :meth:`update_decision_cells` — no full
         rebuild, no expandAll, no ResizeToContents.
         """
+        self._set_file_cells(
+            changes,
+            COL_LOCK,
+            lambda locked: {
+                Qt.DisplayRole: _lock_display(locked),
+                SORT_ROLE: 1 if locked else 0,
+            },
+            "update_lock_cells",
+        )
+
+    def _set_file_cells(
+        self,
+        changes: list[tuple[int, int, Any]],
+        column: int,
+        item_data: Callable[[Any], dict[int, Any]],
+        caller: str,
+    ) -> None:
+        """Write ``item_data(value)`` into ``column`` of each changed file row.
+
+        The model's signals are blocked while the cells are written, then
+        one ``dataChanged`` per group spans the touched member rows. A
+        bulk multi-select over N rows used to emit N signals, each making
+        the dynamic-sort proxy re-evaluate and the view schedule a repaint.
+        """
         model = self._model
-        if model is None:
+        if model is None or not changes:
             return
-        for g_i, m_i, locked in changes:
-            try:
-                group_item = model.item(g_i, COL_GROUP)
-                if group_item is None:
-                    continue
-                lock_item = group_item.child(m_i, COL_LOCK)
-                if lock_item is None:
-                    continue
-                lock_item.setText(_lock_display(locked))
-                lock_item.setData(1 if locked else 0, SORT_ROLE)
-            except Exception as exc:
-                logger.error("update_lock_cells failed at ({}, {}): {}", g_i, m_i, exc)
+        spans: dict[int, tuple[int, int]] = {}
+        blocked = model.blockSignals(True)
+        try:
+            for g_i, m_i, value in changes:
+                try:
+                    group_item = model.item(g_i, COL_GROUP)
+                    if group_item is None:
+                        continue
+                    cell = group_item.child(m_i, column)
+                    if cell is None:
+                        continue
+                    model.setItemData(cell.index(), item_data(value))
+                    lo, hi = spans.get(g_i, (m_i, m_i))
+                    spans[g_i] = (min(lo, m_i), max(hi, m_i))
+                except Exception as exc:
+                    logger.error("{} failed at ({}, {}): {}", caller, g_i, m_i, exc)
+        finally:
+            model.blockSignals(blocked)
+        roles = [int(Qt.DisplayRole), SORT_ROLE]
+        for g_i, (lo, hi) in spans.items():
+            parent = model.index(g_i, COL_GROUP)
+            model.dataChanged.emit(
+                model.index(lo, column, parent), model.index(hi, column, parent), roles
+            )
 
     def remove_rows(self, paths_to_remove: set[str]) -> None:
         """Incrementally remove file rows whose PATH_ROLE is in ``paths_to_remove``.
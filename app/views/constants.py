@@ -41,6 +41,12 @@ DEFAULT_THUMB_SIZE: int = 512  # overridable by settings.json
 GRID_MIN_THUMB_PX: int = 200
 GRID_SPACING_PX: int = 4
 GRID_MARGIN_RATIO: float = 0.05  # left/right and top/bottom
+PREVIEW_RESIZE_DEBOUNCE_MS: int = 50  # coalesce splitter-drag resize bursts
+GRID_MAX_VIDEO_PLAYERS: int = 4  # live players per grid; further tile clicks are refused
+# Decoded grid thumbnails kept across group selections (LRU, both caps apply)
+GRID_PIXMAP_CACHE_MAX_ENTRIES: int = 512
+GRID_PIXMAP_CACHE_BYTES: int = 96 * 1024 * 1024
+GRID_PIXMAP_CACHE_BUCKET_PX: int = 32
 
 
 def headers() -> list[str]:
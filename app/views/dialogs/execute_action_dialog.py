@@ -1082,13 +1082,12 @@ class ExecuteActionDialog(QDialog):
           * ``__cmp__:OP:VALUE`` — threshold comparison (#209)
           * ``__top_n__:N:asc|desc`` — top/bottom N within group (#209)
           * anything else — case-insensitive regex against the field
-            value from ``_get_record_field``.
+            value from ``_record_field_getter``.
 
         Raises :class:`re.error` on an invalid regex; raises
         :class:`ValueError` on a malformed numeric pattern. Caller
         catches and surfaces a localized message.
         """
-        import re as _re
         from app.views.dialogs.select_dialog import (
             PATTERN_CMP_PREFIX,
             PATTERN_TOP_N_PREFIX,
@@ -1097,7 +1096,7 @@ class ExecuteActionDialog(QDialog):
             select_paths_by_threshold,
             select_paths_top_n,
         )
-        from app.views.handlers.file_operations import _get_record_field
+        from app.views.handlers.file_operations import regex_matched_paths
 
         if pattern.startswith(PATTERN_CMP_PREFIX):
             decoded = decode_cmp_pattern(pattern)
@@ -1113,14 +1112,7 @@ class ExecuteActionDialog(QDialog):
                 raise ValueError(pattern)
             n, order = decoded
             return select_paths_top_n(self._groups, field, n, order)
-        rx = _re.compile(pattern, _re.IGNORECASE)
-        out: list[str] = []
-        for group in self._groups:
-            for rec in getattr(group, "items", []):
-                value = _get_record_field(rec, field)
-                if value is not None and rx.search(value):
-                    out.append(rec.file_path)
-        return out
+        return regex_matched_paths(self._groups, field, pattern)
 
     def _set_decision_by_regex(self, field: str, pattern: str, new_decision: str) -> None:
         """Find all file rows where field matches pattern and route by action.
@@ -1524,18 +1516,21 @@ class ExecuteActionDialog(QDialog):
         # defensive — it's a no-op when no media is loaded.
         if self._preview is not None:
             self._preview.release_file_handles()
+        delete_paths: list[str] = []
         for group in self._groups:
             for rec in getattr(group, "items", []):
                 if not in_scope(rec):
                     continue
                 decision = getattr(rec, "user_decision", "") or ""
                 if decision == "delete":
-                    self._delete_file(rec.file_path)
+                    delete_paths.append(rec.file_path)
                     executed_in_scope.append((group, rec))
                 elif decision == IGNORE_DECISION:
                     deferred_ignore_paths.append(rec.file_path)
                     executed_in_scope.append((group, rec))
 
+        self._delete_files(delete_paths)
+
         # #505 — write the delete audit CSV for the files this pass
         # actually removed. The UI delete path previously logged nothing,
         # so the documented per-Execute-Action audit trail was missing.
@@ -1639,6 +1634,41 @@ class ExecuteActionDialog(QDialog):
         except Exception as exc:  # never let audit logging block execute
             logger.warning("Failed to write delete audit log: {}", exc)
 
+    def _delete_files(self, paths: list[str]) -> None:
+        """Trash ``paths`` through the shared batched recycle loop.
+
+        Existing files go to ``send2trash`` in chunks via
+        :func:`infrastructure.delete_service.recycle_in_batches` — on
+        Windows every call pays a fixed shell/COM setup cost, which
+        dominates when a pass deletes thousands of files. A lone path,
+        or one a failed batch left behind, goes through ``_delete_file``
+        so per-path reasons still reach ``_failed_paths``.
+        """
+        if len(paths) == 1:
+            self._delete_file(paths[0])
+            return
+        try:
+            import send2trash
+            from infrastructure.delete_service import recycle_in_batches
+        except ImportError:
+            for path in paths:
+                self._delete_file(path)
+            return
+        present: list[str] = []
+        for path in paths:
+            if os.path.exists(path):
+                present.append(path)
+            else:
+                self._missing_paths.append(path)
+                logger.warning("File not found, skipping delete: {}", path)
+        recycle_in_batches(
+            present,
+            path_of=lambda path: path,
+            batch_trash=send2trash.send2trash,
+            trash_one=self._delete_file,
+            on_trashed=self._record_deleted,
+        )
+
     def _delete_file(self, path: str) -> None:
         if not os.path.exists(path):
             self._missing_paths.append(path)
@@ -1650,12 +1680,16 @@ class ExecuteActionDialog(QDialog):
                 send2trash.send2trash(path)
             except ImportError:
                 os.remove(path)
-            self.deleted_paths.append(path)
-            logger.info("Deleted file: {}", path)
         except Exception as exc:
             logger.warning("Failed to delete {}: {}", path, exc)
             self._failed_paths.append((path, _decode_winerror(exc)))
             return
+        self._record_deleted(path)
+
+    def _record_deleted(self, path: str) -> None:
+        """Book a trashed ``path`` into ``deleted_paths`` and the manifest."""
+        self.deleted_paths.append(path)
+        logger.info("Deleted file: {}", path)
         # D7: write outcome='deleted' immediately after the trash succeeds.
         # Fail-loud: on DB failure the row stays outcome='' (reappears on
         # next load) which is the intended self-heal for disk-deleted-but-
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import operator
 import re
 from datetime import datetime
 from typing import Any, Callable
 
 from loguru import logger
 
-from PySide6.QtCore import QPoint, QRect, Qt, QTimer, Signal
+from PySide6.QtCore import QObject, QPoint, QRect, QRunnable, Qt, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QFont, QGuiApplication, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QButtonGroup,
@@ -85,6 +86,12 @@ _FIELD_LABEL_KEYS: dict[str, str] = {
 # build_match_fn's sample_cap; matched count is the full total.
 MatchFn = Callable[[str, str], tuple[int, int, list[tuple[str, str]]]]
 
+# Record count at which the live regex preview runs its match_fn on a
+# worker thread instead of inline in the debounce slot. Below it the scan
+# finishes well inside one frame and the synchronous path (which every
+# existing caller and test relies on) is kept.
+_ASYNC_PREVIEW_MIN_RECORDS = 5000
+
 # #396 dropped the Simple/Regex mode toggle. Both sections are always
 # visible in the same view, sharing self.regex as the single source of
 # truth (Simple inputs write through to regex; regex reverse-parses
@@ -201,39 +208,41 @@ PATTERN_CMP_PREFIX = "__cmp__:"
 PATTERN_TOP_N_PREFIX = "__top_n__:"
 
 
-def _numeric_value_for(field: str, rec: Any, group: Any) -> float | None:
-    """Return the comparable numeric value of ``field`` for ``rec``.
-
-    For date fields the datetime is converted to a POSIX timestamp so
-    threshold comparisons stay in floats. Returns ``None`` when the
-    attribute is missing or unset — caller skips such records (same
-    semantics as ``_get_record_field`` returning ``None``).
-    """
-    if field == "Size (Bytes)":
-        val = getattr(rec, "file_size_bytes", None)
+def _attr_float(attr: str) -> Callable[[Any, Any], float | None]:
+    def _read(rec: Any, _group: Any) -> float | None:
+        val = getattr(rec, attr, None)
         return float(val) if val is not None else None
-    if field == "Group Count":
-        items = getattr(group, "items", None)
-        return float(len(items)) if items is not None else None
-    if field == "Similarity":
-        val = getattr(rec, "hamming_distance", None)
-        return float(val) if val is not None else None
-    if field == "Score":
-        val = getattr(rec, "score", None)
-        return float(val) if val is not None else None
-    if field == "Creation Date":
-        d = getattr(rec, "creation_date", None)
-        try:
-            return d.timestamp() if d is not None else None
-        except Exception:
-            return None
-    if field == "Shot Date":
-        d = getattr(rec, "shot_date", None)
+    return _read
+
+
+def _attr_timestamp(attr: str) -> Callable[[Any, Any], float | None]:
+    def _read(rec: Any, _group: Any) -> float | None:
+        d = getattr(rec, attr, None)
         try:
             return d.timestamp() if d is not None else None
         except Exception:
             return None
-    return None
+    return _read
+
+
+def _group_count(_rec: Any, group: Any) -> float | None:
+    items = getattr(group, "items", None)
+    return float(len(items)) if items is not None else None
+
+
+# Field name → ``(rec, group) → float | None`` reader. Resolved once per
+# scan by the threshold / top-N selectors instead of re-comparing the
+# field name for every record. Date fields read as POSIX timestamps so
+# threshold comparisons stay in floats; a reader returns ``None`` when
+# the attribute is missing or unset and the selectors skip that record.
+_NUMERIC_READERS: dict[str, Callable[[Any, Any], float | None]] = {
+    "Size (Bytes)": _attr_float("file_size_bytes"),
+    "Group Count": _group_count,
+    "Similarity": _attr_float("hamming_distance"),
+    "Score": _attr_float("score"),
+    "Creation Date": _attr_timestamp("creation_date"),
+    "Shot Date": _attr_timestamp("shot_date"),
+}
 
 
 def _parse_threshold(field: str, text: str) -> float | None:
@@ -241,7 +250,7 @@ def _parse_threshold(field: str, text: str) -> float | None:
 
     Pure numeric fields accept a float. Date fields accept ISO ``YYYY-MM-DD``
     (or ``YYYY-MM-DD HH:MM:SS``) and we convert to a timestamp so the
-    threshold matches ``_numeric_value_for``'s float-of-timestamp form.
+    threshold matches the ``_NUMERIC_READERS`` float-of-timestamp form.
     Returns ``None`` for unparseable input — the caller treats this as
     a zero-match condition (same as an invalid regex in the existing flow).
     """
@@ -262,15 +271,14 @@ def _parse_threshold(field: str, text: str) -> float | None:
         return None
 
 
-def _cmp_apply(value: float, op: str, threshold: float) -> bool:
-    """Evaluate ``value <op> threshold``. Unknown op → False (defensive)."""
-    if op == ">":  return value > threshold
-    if op == ">=": return value >= threshold
-    if op == "<":  return value < threshold
-    if op == "<=": return value <= threshold
-    if op == "==": return value == threshold
-    if op == "!=": return value != threshold
-    return False
+_CMP_FUNCS: dict[str, Callable[[float, float], bool]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
 
 
 def select_paths_by_threshold(
@@ -279,20 +287,24 @@ def select_paths_by_threshold(
     """Return file_paths from ``groups`` whose ``field`` value passes ``op threshold``.
 
     Records whose numeric value is missing (None) are skipped — same
-    rule as the regex flow, which skips fields ``_get_record_field``
-    returns None for. Order is group-then-record so the caller's
+    rule as the regex flow, which skips fields the ``_record_field_getter``
+    reader returns None for. Order is group-then-record so the caller's
     truncated lock-confirm list reads as user tree order.
     """
     threshold = _parse_threshold(field, threshold_text)
     if threshold is None:
         return []
+    reader = _NUMERIC_READERS.get(field)
+    cmp = _CMP_FUNCS.get(op)
+    if reader is None or cmp is None:
+        return []
     matched: list[str] = []
     for group in groups:
         for rec in getattr(group, "items", []):
-            val = _numeric_value_for(field, rec, group)
+            val = reader(rec, group)
             if val is None:
                 continue
-            if _cmp_apply(val, op, threshold):
+            if cmp(val, threshold):
                 matched.append(rec.file_path)
     return matched
 
@@ -313,14 +325,15 @@ def select_paths_top_n(
     When a group has fewer than N rankable records, all of its rankable
     records are selected — Top 3 of a 2-row group selects both rows.
     """
-    if n <= 0 or order not in ("asc", "desc"):
+    reader = _NUMERIC_READERS.get(field)
+    if n <= 0 or order not in ("asc", "desc") or reader is None:
         return []
     matched: list[str] = []
     reverse = (order == "desc")
     for group in groups:
         ranked: list[tuple[float, str]] = []
         for rec in getattr(group, "items", []):
-            val = _numeric_value_for(field, rec, group)
+            val = reader(rec, group)
             if val is None:
                 continue
             ranked.append((val, rec.file_path))
@@ -358,7 +371,8 @@ def _select_top_n_with_metadata(
     shape because :meth:`ExecuteActionDialog._matched_paths_for_pattern`
     only needs paths to encode the ``__top_n__:`` pseudo-pattern.
     """
-    if n <= 0 or order not in ("asc", "desc"):
+    reader = _NUMERIC_READERS.get(field)
+    if n <= 0 or order not in ("asc", "desc") or reader is None:
         return []
     out: list[tuple[int, str, float]] = []
     reverse = (order == "desc")
@@ -366,7 +380,7 @@ def _select_top_n_with_metadata(
         group_no = getattr(group, "group_number", None) or group_idx
         ranked: list[tuple[float, str]] = []
         for rec in getattr(group, "items", []):
-            val = _numeric_value_for(field, rec, group)
+            val = reader(rec, group)
             if val is None:
                 continue
             ranked.append((val, rec.file_path))
@@ -554,6 +568,41 @@ def _try_parse_simple(pattern: str) -> tuple[str, str] | None:
     return ("contains", text)
 
 
+class _PreviewMatchTask(QRunnable):
+    """QRunnable that runs a live-preview ``match_fn`` off the UI thread.
+
+    Emits ``receiver._previewMatched(generation, (pattern, result))``
+    on completion; the receiver drops results whose generation is no
+    longer current (the user kept typing). Mirrors ``_ResolutionTask``
+    in ``app/views/image_tasks.py``: emit failures after the dialog
+    is gone are swallowed.
+    """
+
+    def __init__(
+        self, *, match_fn: MatchFn, field: str, pattern: str, generation: int,
+        receiver: QObject,
+    ) -> None:
+        super().__init__()
+        self._match_fn = match_fn
+        self._field = field
+        self._pattern = pattern
+        self._generation = generation
+        self._receiver = receiver
+
+    def run(self) -> None:  # type: ignore[override]
+        try:
+            result = self._match_fn(self._field, self._pattern)
+        except Exception as ex:
+            logger.error("Preview match failed: {}", ex)
+            result = (0, 0, [])
+        try:
+            self._receiver._previewMatched.emit(  # type: ignore[attr-defined]
+                self._generation, (self._pattern, result)
+            )
+        except Exception:  # pragma: no cover - best effort
+            pass
+
+
 class _MatchHighlightDelegate(QStyledItemDelegate):
     """Render preview-list rows with the regex match span emboldened.
 
@@ -668,6 +717,8 @@ class ActionDialog(QDialog):
     """
 
     setActionRequested = Signal(str, str, str)  # field, regex, action_value
+    # Internal: (generation, (pattern, match_fn result)) from _PreviewMatchTask.
+    _previewMatched = Signal(int, object)
 
     def __init__(
         self,
@@ -712,6 +763,19 @@ class ActionDialog(QDialog):
         # "Applied to N rows" in the match counter. None when no preview
         # has run yet (i.e. match_fn is None — flat layout never tracks).
         self._last_matched_count: int | None = None
+        # Large manifests run the regex preview on a worker thread (see
+        # _ASYNC_PREVIEW_MIN_RECORDS). Each refresh bumps the generation
+        # so a result that lands after newer input is dropped;
+        # ``_preview_pending`` marks a result still in flight. The pool has
+        # one thread and is cleared before each start, so at most one scan
+        # runs and one waits: queued-but-superseded scans are dropped
+        # rather than competing with the UI thread for the GIL.
+        self._record_count = sum(len(getattr(g, "items", [])) for g in self._groups)
+        self._preview_pool = QThreadPool(self)
+        self._preview_pool.setMaxThreadCount(1)
+        self._preview_generation = 0
+        self._preview_pending = False
+        self._previewMatched.connect(self._on_preview_matched)
         # C13 from #349 (Wave 8): the splitter exists only when match_fn
         # is supplied. Promote it to self._splitter so `done()` can save
         # its state — pre-Wave-8 it was a local variable and the handle
@@ -1811,6 +1875,10 @@ class ActionDialog(QDialog):
         if self._match_fn is None:
             return
 
+        # Any refresh supersedes a worker-thread result still in flight.
+        self._preview_generation += 1
+        self._preview_pending = False
+
         if self._field_panel_is_numeric():
             self._refresh_numeric_preview()
             return
@@ -1829,7 +1897,58 @@ class ActionDialog(QDialog):
             rx = None
 
         field = self._current_field()
-        matched, total, samples = self._match_fn(field, pattern)
+        if self._record_count >= _ASYNC_PREVIEW_MIN_RECORDS:
+            # Counter / list keep showing the previous result until the
+            # worker reports back; keystrokes stay responsive meanwhile.
+            self._preview_pending = True
+            self._preview_pool.clear()
+            self._preview_pool.start(
+                _PreviewMatchTask(
+                    match_fn=self._match_fn,
+                    field=field,
+                    pattern=pattern,
+                    generation=self._preview_generation,
+                    receiver=self,
+                )
+            )
+            return
+        self._show_preview_result(rx, self._match_fn(field, pattern))
+
+    def _on_preview_matched(self, generation: int, payload: object) -> None:
+        """Apply a worker-thread preview result if it is still current."""
+        if generation != self._preview_generation:
+            return
+        self._preview_pending = False
+        pattern, result = payload  # type: ignore[misc]
+        try:
+            rx = re.compile(pattern, re.IGNORECASE) if pattern else None
+        except re.error:
+            rx = None
+        self._show_preview_result(rx, result)
+
+    def _settle_pending_preview(self) -> None:
+        """Replace an in-flight worker preview with a synchronous one.
+
+        Apply's delete-confirm gate quotes ``_last_matched_count``; with
+        a result still in flight that count belongs to an older pattern.
+        """
+        if not self._preview_pending:
+            return
+        self._preview_generation += 1  # drop the in-flight result
+        self._preview_pending = False
+        pattern = self._build_pattern()
+        try:
+            rx = re.compile(pattern, re.IGNORECASE) if pattern else None
+        except re.error:
+            return
+        self._show_preview_result(rx, self._match_fn(self._current_field(), pattern))
+
+    def _show_preview_result(
+        self,
+        rx: re.Pattern[str] | None,
+        result: tuple[int, int, list[tuple[str, str]]],
+    ) -> None:
+        matched, total, samples = result
         # B9 (Wave 9b-trim): track for the post-Apply counter flash.
         self._last_matched_count = matched
 
@@ -1958,6 +2077,7 @@ class ActionDialog(QDialog):
         if self._field_panel_is_numeric():
             pattern = self._build_numeric_pattern()
         else:
+            self._settle_pending_preview()
             pattern = self._build_pattern()
         idx = self._action_combo.currentIndex()
         _label, value = self._decisions[idx]
@@ -2206,6 +2326,8 @@ class ActionDialog(QDialog):
         # it here makes the timer a plain child QObject, safe to destroy.
         if hasattr(self, "_preview_timer"):
             self._preview_timer.stop()
+        # Orphan any worker-thread preview still running.
+        self._preview_generation += 1
         super().done(result)
 
 
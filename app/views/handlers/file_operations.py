@@ -33,24 +33,30 @@ MANIFEST_FILE_FILTER = "SQLite Files (*.sqlite *.db);;All Files (*)"
 # Resolution is a composite of pixel_width × pixel_height — the attr
 # mapping below points at pixel_width as a placeholder so the dict
 # lookup succeeds; the actual rendering is handled inline in
-# _get_record_field. Score's numeric ranking goes through the
-# numeric-condition panel (`_numeric_value_for`); the mapping below
+# _record_field_getter. Score's numeric ranking goes through the
+# numeric-condition panel (`_NUMERIC_READERS`); the mapping below
 # is only consulted on the regex fallback path. #238.
 _FIELD_TO_ATTR: dict[str, str] = {
-    "File Name":     "file_path",      # basename extracted in _get_record_field
+    "File Name":     "file_path",      # basename extracted in _record_field_getter
     "Folder":        "folder_path",
     "Action":        "user_decision",
-    "Lock":          "is_locked",      # bool → "Locked"/"" in _get_record_field (#182)
+    "Lock":          "is_locked",      # bool → "Locked"/"" in _record_field_getter (#182)
     "Size (Bytes)":  "file_size_bytes",
     "Creation Date": "creation_date",
     "Shot Date":     "shot_date",
     "Score":         "score",          # float ∈ [0, 1]; None for passenger MOVs (#238)
-    "Resolution":    "pixel_width",    # placeholder; rendered as "WxH" in _get_record_field (#238)
+    "Resolution":    "pixel_width",    # placeholder; rendered as "WxH" in _record_field_getter (#238)
 }
 
 
-def _get_record_field(rec: Any, field: str) -> str | None:
-    """Return the string value of a record's field, or None if unavailable.
+def _record_field_getter(field: str) -> Callable[[Any], str | None] | None:
+    """Return a ``rec → str | None`` reader for ``field``, or None for an
+    unknown field.
+
+    The reader returns the record's field value as a string, or None
+    when the attribute is unset. The per-field branching is resolved
+    once here, so a loop over thousands of records pays one closure
+    call per record instead of re-dispatching on ``field`` each time.
 
     The ``Lock`` field maps a boolean ``is_locked`` to the string
     ``"Locked"`` (truthy) or ``""`` (falsy) so users can regex-match
@@ -61,10 +67,10 @@ def _get_record_field(rec: Any, field: str) -> str | None:
 
     The ``Resolution`` field formats ``pixel_width × pixel_height``
     using the same ``×`` (U+00D7) glyph the tree's COL_RESOLUTION cell
-    uses (see ``tree_model_builder.build_model``). Returns None when
-    either dimension is missing — matches the tree's empty-cell
-    rendering for that case. Users regex-match ``^1920×1080$`` style
-    (#238).
+    uses (see ``tree_model_builder.build_model``). The reader returns
+    None when either dimension is missing — matches the tree's
+    empty-cell rendering for that case. Users regex-match
+    ``^1920×1080$`` style (#238).
     """
     from pathlib import Path
 
@@ -72,21 +78,52 @@ def _get_record_field(rec: Any, field: str) -> str | None:
     if attr is None:
         return None
     if field == "Resolution":
-        px_w = getattr(rec, "pixel_width", None)
-        px_h = getattr(rec, "pixel_height", None)
-        if not px_w or not px_h:
-            return None
-        return f"{px_w}×{px_h}"
-    val = getattr(rec, attr, None)
+        def _resolution(rec: Any) -> str | None:
+            px_w = getattr(rec, "pixel_width", None)
+            px_h = getattr(rec, "pixel_height", None)
+            if not px_w or not px_h:
+                return None
+            return f"{px_w}×{px_h}"
+        return _resolution
     if field == "Lock":
         # bool conversion explicitly — getattr can return False which
         # is not None and shouldn't short-circuit to "None" via str().
-        return "Locked" if bool(val) else ""
-    if val is None:
-        return None
+        return lambda rec: "Locked" if bool(getattr(rec, attr, None)) else ""
     if field == "File Name":
-        return Path(str(val)).name
-    return str(val)
+        def _file_name(rec: Any) -> str | None:
+            val = getattr(rec, attr, None)
+            return None if val is None else Path(str(val)).name
+        return _file_name
+
+    def _plain(rec: Any) -> str | None:
+        val = getattr(rec, attr, None)
+        return None if val is None else str(val)
+    return _plain
+
+
+def regex_matched_paths(groups: list, field: str, pattern: str) -> list[str]:
+    """Return the file_paths whose ``field`` value matches ``pattern``
+    (case-insensitive ``search``), in tree order (group-then-record).
+
+    Shared by both ``_matched_paths_for_pattern`` implementations
+    (main-window handler and :class:`ExecuteActionDialog`). The regex
+    is compiled and the field reader resolved once; the loop itself
+    only calls the bound ``search`` and the reader per record.
+
+    Raises :class:`re.error` on an invalid pattern.
+    """
+    search = re.compile(pattern, re.IGNORECASE).search
+    read = _record_field_getter(field)
+    if read is None:
+        return []
+    out: list[str] = []
+    append = out.append
+    for group in groups:
+        for rec in getattr(group, "items", []):
+            value = read(rec)
+            if value is not None and search(value):
+                append(rec.file_path)
+    return out
 
 
 def _decision_display_label(decision: str) -> str:
@@ -146,21 +183,22 @@ def build_match_fn(
         from pathlib import Path
 
         try:
-            rx = re.compile(pattern, re.IGNORECASE)
+            search = re.compile(pattern, re.IGNORECASE).search
         except re.error:
             total = sum(len(g.items) for g in groups)
             return (0, total, [])
 
+        read = _record_field_getter(field) or (lambda rec: None)
         matched = 0
         total = 0
         samples: list[tuple[str, str]] = []
         for grp in groups:
             for rec in grp.items:
                 total += 1
-                value = _get_record_field(rec, field)
+                value = read(rec)
                 if value is None:
                     continue
-                if rx.search(value):
+                if search(value):
                     matched += 1
                     if len(samples) < sample_cap:
                         path_val = getattr(rec, "file_path", None)
@@ -931,6 +969,34 @@ class FileOperationsHandler:
         self._mark_dirty()
         self._refresh_after_remove(paths)
 
+    def _apply_record_field(
+        self, items: list[dict], attr: str, value: Any
+    ) -> tuple[dict[str, Any], list[tuple[int, int, Any]]]:
+        """Write ``value`` to ``attr`` on every file item's in-memory record.
+
+        Shared body of :meth:`set_decision` (``user_decision``) and
+        :meth:`set_locked_state` (``is_locked``). Returns ``(batch,
+        changes)``: ``batch`` maps every file path to ``value`` for the
+        SQLite write — including paths no longer in ``vm.groups`` — and
+        ``changes`` lists the ``(group_idx, member_idx, value)`` coords
+        that were actually updated, for the incremental tree patch.
+        """
+        batch: dict[str, Any] = {}
+        changes: list[tuple[int, int, Any]] = []
+        path_index = self._get_path_index()
+        groups = self.vm.groups
+        for item in items:
+            if item.get("type") != "file":
+                continue
+            file_path = item["path"]
+            coords = path_index.get(file_path)
+            if coords is not None:
+                g_i, m_i = coords
+                setattr(groups[g_i].items[m_i], attr, value)
+                changes.append((g_i, m_i, value))
+            batch[file_path] = value
+        return batch, changes
+
     def set_decision(
         self,
         items: list[dict],
@@ -956,20 +1022,7 @@ class FileOperationsHandler:
         manifest_path = getattr(self, "_manifest_path", None)
         if not manifest_path:
             return
-        batch: dict[str, str] = {}
-        # changes: list of (group_idx, member_idx, new_decision) for incremental update
-        changes: list[tuple[int, int, str]] = []
-        path_index = self._get_path_index()
-        for item in items:
-            if item.get("type") != "file":
-                continue
-            file_path = item["path"]
-            coords = path_index.get(file_path)
-            if coords is not None:
-                g_i, m_i = coords
-                self.vm.groups[g_i].items[m_i].user_decision = new_decision
-                changes.append((g_i, m_i, new_decision))
-            batch[file_path] = new_decision
+        batch, changes = self._apply_record_field(items, "user_decision", new_decision)
         if batch:
             from infrastructure.manifest_repository import ManifestRepository
             ManifestRepository().batch_update_decisions(manifest_path, batch)
@@ -1011,20 +1064,7 @@ class FileOperationsHandler:
         manifest_path = getattr(self, "_manifest_path", None)
         if not manifest_path:
             return
-        batch: dict[str, bool] = {}
-        # lock_changes: list of (group_idx, member_idx, locked) for incremental update
-        lock_changes: list[tuple[int, int, bool]] = []
-        path_index = self._get_path_index()
-        for item in items:
-            if item.get("type") != "file":
-                continue
-            file_path = item["path"]
-            coords = path_index.get(file_path)
-            if coords is not None:
-                g_i, m_i = coords
-                self.vm.groups[g_i].items[m_i].is_locked = locked
-                lock_changes.append((g_i, m_i, locked))
-            batch[file_path] = locked
+        batch, lock_changes = self._apply_record_field(items, "is_locked", locked)
         if batch:
             from infrastructure.manifest_repository import ManifestRepository
             ManifestRepository().batch_update_lock_state(manifest_path, batch)
@@ -1365,13 +1405,12 @@ class FileOperationsHandler:
           * ``__cmp__:OP:VALUE`` — threshold comparison (#209)
           * ``__top_n__:N:asc|desc`` — top/bottom N within group (#209)
           * anything else — case-insensitive regex against the field
-            value from :func:`_get_record_field`.
+            value from :func:`_record_field_getter`.
 
         Raises :class:`re.error` on an invalid regex; raises
         :class:`ValueError` on a malformed numeric pattern. Caller
         catches and surfaces a localized message.
         """
-        import re as _re
         # Lazy imports: select_dialog is a view module; importing it
         # at module top would pull Qt widgets into the handler import
         # graph. Same pattern as ExecuteActionDialog uses.
@@ -1398,14 +1437,7 @@ class FileOperationsHandler:
                 raise ValueError(pattern)
             n, order = decoded
             return select_paths_top_n(self.vm.groups, field, n, order)
-        rx = _re.compile(pattern, _re.IGNORECASE)
-        out: list[str] = []
-        for group in self.vm.groups:
-            for rec in group.items:
-                value = _get_record_field(rec, field)
-                if value is not None and rx.search(value):
-                    out.append(rec.file_path)
-        return out
+        return regex_matched_paths(self.vm.groups, field, pattern)
 
     def execute_action(self, selected_only: bool = False) -> None:
         """Open the Execute Action review dialog and run planned operations.
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import os
 from typing import Any
 
 from PySide6.QtCore import QObject, QRunnable, QThreadPool
 from loguru import logger
 
 from app.views.image_tasks_helpers import make_grid_token, make_single_token
+from app.views.media_utils import is_video
 
 # Cached viewport cap — computed once on first call, then reused.
 _VIEWPORT_CAP: int | None = None
 
+# Concurrent grid-thumbnail image decodes. A large group queues one task
+# per tile; more parallel decoders than this only contend for disk I/O.
+_GRID_THUMB_THREADS = 4
+
 
 def _compute_viewport_cap() -> int:
     """Return the viewport cap for single-image previews.
@@ -110,8 +116,8 @@ class ImageTaskRunner:
     """Dispatches image load tasks to the global thread pool.
 
     Tokens use the canonical format defined in
-    :mod:`app.views.image_tasks_helpers`. Their classification on the
-    receiver side lives in :func:`app.views.preview_pane_helpers.classify_image_token`.
+    :mod:`app.views.image_tasks_helpers`; ``PreviewPane.on_image_loaded``
+    routes each result by exact token match.
     """
 
     def __init__(self, *, service: Any, receiver: QObject) -> None:
@@ -122,6 +128,15 @@ class ImageTaskRunner:
         # the runner, so it self-registers in its ``__init__``.
         self._resolution_receiver: QObject | None = None
         self._pool = QThreadPool.globalInstance()
+        # Grid thumbnails run on their own bounded pools so a large group
+        # cannot saturate the global pool (single preview, resolution
+        # reads): image decodes are capped at _GRID_THUMB_THREADS, and
+        # video frame extraction (a media-pipeline open per file) is
+        # serialised.
+        self._thumb_pool = QThreadPool()
+        self._thumb_pool.setMaxThreadCount(min(_GRID_THUMB_THREADS, os.cpu_count() or 1))
+        self._video_thumb_pool = QThreadPool()
+        self._video_thumb_pool.setMaxThreadCount(1)
 
     def set_resolution_receiver(self, receiver: QObject) -> None:
         """Register the receiver for off-thread resolution reads.
@@ -164,9 +179,14 @@ class ImageTaskRunner:
         self._pool.start(task)
         return token
 
-    def request_grid_thumbnail(self, path: str, thumb_side: int) -> str:
-        """Request a grid thumbnail for `path` with given `thumb_side`. Returns token."""
-        token = make_grid_token(path, thumb_side)
+    def request_grid_thumbnail(self, path: str, thumb_side: int, generation: int = 0) -> str:
+        """Request a grid thumbnail for `path` with given `thumb_side`. Returns token.
+
+        `generation` is the caller's grid build, carried in the token.
+        Runs on the bounded thumbnail pool for images, the single-thread
+        video pool for videos — never on the global pool.
+        """
+        token = make_grid_token(path, thumb_side, generation)
         if self._service is None:
             return token
         task = _ImageTask(
@@ -177,5 +197,5 @@ class ImageTaskRunner:
             receiver=self._receiver,
             token=token,
         )
-        self._pool.start(task)
+        (self._video_thumb_pool if is_video(path) else self._thumb_pool).start(task)
         return token
@@ -18,15 +18,18 @@ What lives here:
 * :func:`make_single_token` — ``(path, side) → "single|{path}|{side}"``.
   Side is always 0 in production today; kept as a parameter so the
   token shape stays uniform with :func:`make_grid_token`.
-* :func:`make_grid_token` — ``(path, thumb_side) → "grid|{path}|{thumb_side}"``.
-
-The token format is consumed by
-:func:`app.views.preview_pane_helpers.classify_image_token` (which
-peels off the ``"single"`` / ``"grid"`` prefix). A divergence between
-producer and consumer would silently drop every in-flight image
-load — invisible at runtime because the task still runs, just the
-result has nowhere to land. These helpers + the consumer's classifier
-test pin both ends.
+* :func:`make_grid_token` — ``(path, thumb_side, generation) →
+  "grid|{generation}|{path}|{thumb_side}"``.
+* :func:`token_side` — the inverse for the trailing side segment,
+  ``"grid|…|{thumb_side}" → thumb_side``.
+
+``PreviewPane.on_image_loaded`` routes a result by exact token match:
+a lookup in its grid-label registry, else a comparison with the
+current single-preview token. The ``"single"`` / ``"grid"`` prefixes
+keep the two token spaces disjoint. A divergence between the token the
+pane registered and the one the task emits would silently drop every
+in-flight image load — invisible at runtime because the task still
+runs, just the result has nowhere to land.
 """
 
 from __future__ import annotations
@@ -40,21 +43,42 @@ def make_single_token(path: str, side: int = 0) -> str:
     format is uniform with :func:`make_grid_token`.
 
     Failure mode: a refactor that changed the separator (e.g. to
-    ``:`` or ``-``) would still classify as "single" in
-    ``classify_image_token`` (which only inspects the first
-    segment), but the path-with-colon parsing on Windows would
+    ``:`` or ``-``) would still route by exact match, but
+    :func:`token_side`'s path-with-colon parsing on Windows would
     break — silent regression.
     """
     return f"single|{path}|{side}"
 
 
-def make_grid_token(path: str, thumb_side: int) -> str:
+def make_grid_token(path: str, thumb_side: int, generation: int = 0) -> str:
     """Format the token for a grid-thumbnail request.
 
     ``thumb_side`` is the requested edge length in pixels (the
     grid view scales every cell to a single max side). Kept as
     an int so callers can't accidentally pass a float and produce
-    ``"grid|p.jpg|256.0"`` — which would compare unequal to the
+    ``"grid|0|p.jpg|256.0"`` — which would compare unequal to the
     int-formatted version in any cached-token lookup.
+
+    ``generation`` is the grid build the request belongs to: the same
+    path and side requested by a later build get a different token, so
+    a result still in flight from the earlier one matches nothing.
+    """
+    return f"grid|{generation}|{path}|{thumb_side}"
+
+
+def token_side(token: str) -> int:
+    """Return the side encoded in a single / grid token, or ``0``.
+
+    Splits on the LAST ``|`` so a path containing a pipe still
+    parses. Used by ``PreviewPane.on_image_loaded`` to file a decoded
+    thumbnail under the size it was requested at — by the time the
+    result arrives the grid may have been resized.
+
+    Failure mode: splitting on the first ``|`` (as the classifier
+    does) would return the path, fail the ``int()`` and file every
+    thumbnail under side 0, so no cache lookup would ever hit.
     """
-    return f"grid|{path}|{thumb_side}"
+    try:
+        return int(token.rsplit("|", 1)[1])
+    except (IndexError, ValueError):
+        return 0
@@ -1,5 +1,6 @@
 """Media type detection and utility functions for video support."""
 
+from functools import lru_cache
 import os
 from pathlib import Path
 
@@ -30,8 +31,16 @@ def format_duration(milliseconds: int) -> str:
     """
     if milliseconds < 0:
         return "--:--"
+    return _format_seconds(milliseconds // 1000)
 
-    total_seconds = milliseconds // 1000
+
+@lru_cache(maxsize=16384)
+def _format_seconds(total_seconds: int) -> str:
+    """MM:SS or HH:MM:SS for whole seconds.
+
+    Cached: playback positions tick many times a second per player, but
+    the text only changes once a second.
+    """
     hours, remainder = divmod(total_seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from PySide6.QtCore import QEvent, QObject, Qt, Signal
+from PySide6.QtCore import QEvent, QObject, Qt, QTimer, Signal
 from PySide6.QtGui import QImageReader, QPixmap
 from PySide6.QtWidgets import QGridLayout, QLabel, QScrollArea, QVBoxLayout, QWidget
 from loguru import logger
@@ -10,22 +10,34 @@ from loguru import logger
 from app.views.constants import (
     DEFAULT_THUMB_SIZE,
     GRID_MARGIN_RATIO,
+    GRID_MAX_VIDEO_PLAYERS,
     GRID_MIN_THUMB_PX,
+    GRID_PIXMAP_CACHE_BUCKET_PX,
+    GRID_PIXMAP_CACHE_BYTES,
+    GRID_PIXMAP_CACHE_MAX_ENTRIES,
     GRID_SPACING_PX,
+    PREVIEW_RESIZE_DEBOUNCE_MS,
 )
 from app.views.image_tasks import ImageTaskRunner
+from app.views.image_tasks_helpers import make_grid_token, token_side
 from app.views.media_utils import is_video, normalize_windows_path
 from app.views.preview_pane_helpers import (
+    BoundedLRUCache,
     aspect_bucket_from_resolution,
     attach_resolutions,
     build_info_rows,
-    classify_image_token,
     compute_fit_width,
     compute_grid_geometry,
+    compute_visible_tile_count,
+    fits_box,
     format_info_html,
     format_resolution_string,
     get_file_size_bytes,
+    needs_grid_relayout,
+    needs_thumbnail_redecode,
     normalize_grid_items,
+    thumb_side_bucket,
+    visible_tile_range,
 )
 from app.views.widgets.group_media_controller import GroupMediaController
 from app.views.widgets.video_player import VideoPlayerWidget
@@ -33,6 +45,29 @@ from infrastructure.i18n import t
 
 _RAW_EXTENSIONS = frozenset((".dng", ".cr2", ".cr3", ".nef", ".arw", ".raf", ".rw2"))
 
+# Grid tile placeholder per cell side, shared by every tile of that size.
+# A splitter drag walks through many sides; only the last few are kept.
+_PLACEHOLDER_CACHE: dict[int, QPixmap] = {}
+_PLACEHOLDER_CACHE_MAX = 4
+
+
+def _placeholder_pixmap(side: int) -> QPixmap:
+    """Return the flat gray square shown in a grid tile until its
+    thumbnail arrives.
+
+    Replaces the per-tile "Loading…" text: a shared pixmap needs no
+    text layout per label, and every tile of a grid paints the same
+    implicitly-shared QPixmap.
+    """
+    pm = _PLACEHOLDER_CACHE.get(side)
+    if pm is None:
+        if len(_PLACEHOLDER_CACHE) >= _PLACEHOLDER_CACHE_MAX:
+            _PLACEHOLDER_CACHE.clear()
+        pm = QPixmap(side, side)
+        pm.fill(Qt.darkGray)
+        _PLACEHOLDER_CACHE[side] = pm
+    return pm
+
 
 def _raw_sensor_dims(path: str) -> tuple[int, int]:
     """Return (width, height) from rawpy metadata for RAW/DNG files, or (0, 0).
@@ -51,6 +86,44 @@ def _raw_sensor_dims(path: str) -> tuple[int, int]:
     return 0, 0
 
 
+def _read_image_dims(path: str) -> tuple[int, int]:
+    """Return (width, height) for an image file, or (0, 0) on failure.
+
+    Same reader cascade as :func:`_read_resolution` (rawpy for RAW,
+    QImageReader header read, PIL fallback). ``canRead()`` gates the
+    QImageReader probe so formats Qt has no plugin for fall straight
+    through to PIL instead of paying for a failed ``size()`` call.
+    """
+    ext = path.lower().rsplit(".", 1)[-1] if "." in path else ""
+    if f".{ext}" in _RAW_EXTENSIONS:
+        w, h = _raw_sensor_dims(path)
+        if w > 0 and h > 0:
+            return w, h
+    try:
+        r = QImageReader(path)
+        if r.canRead():
+            sz = r.size()
+            w, h = sz.width(), sz.height()
+            if w > 0 and h > 0:
+                return w, h
+    except Exception:
+        pass
+    try:
+        from PIL import Image
+        try:
+            from pillow_heif import register_heif_opener
+            register_heif_opener()
+        except ImportError:
+            pass
+        with Image.open(path) as img:
+            w, h = img.size
+            if w > 0 and h > 0:
+                return w, h
+    except Exception:
+        pass
+    return 0, 0
+
+
 def _read_resolution(path: str) -> str | None:
     """Return "W×H" pixel dimensions for an image file, or None on failure.
 
@@ -175,8 +248,37 @@ class PreviewPane(QWidget):
         self._grid_labels: dict[str, QLabel] = {}
         self._grid_container: QWidget | None = None
         self._grid_layout: QGridLayout | None = None
+        # Grid tiles as parallel columns, in display order: the path and
+        # is-video flag every per-tile pass reads, plus the display-only
+        # (path, name, folder, size, creation, shot, resolution) tuple that
+        # feeds the tile's info label.
+        self._grid_paths: list[str] = []
+        self._grid_is_video: list[bool] = []
         self._grid_items: list[tuple[str, str, str, str, str, str, str]] = []
+        # Built tiles, in ``_grid_items`` order: the thumbnail label, the
+        # info label under it and the token of its latest thumbnail
+        # request. A tile has no container widget of its own — both labels
+        # sit directly in ``_grid_layout`` (see ``_place_grid_tile``).
+        # Kept so a resize can re-place and re-size tiles instead of
+        # rebuilding them.
+        self._grid_tile_labels: list[QLabel] = []
+        self._grid_info_labels: list[QLabel] = []
+        self._grid_tile_tokens: list[str] = []
+        # Decoded thumbnail per token, unscaled, so a resize rescales in
+        # memory instead of re-decoding from disk.
+        self._grid_pixmaps: dict[str, QPixmap] = {}
+        self._grid_cols: int = 0
+        self._grid_thumb_side: int = 0
+        # Decoded thumbnails keyed by (path, bucketed side); unlike
+        # ``_grid_pixmaps`` this survives clear(), so returning to a group
+        # paints its tiles synchronously without a decode round-trip.
+        self._thumb_cache = BoundedLRUCache(
+            GRID_PIXMAP_CACHE_MAX_ENTRIES, GRID_PIXMAP_CACHE_BYTES
+        )
         self._single_pm: QPixmap | None = None
+        # (pixmap, target width) of the last single-image fit; resize
+        # events that change neither skip the rescale.
+        self._single_fit: tuple[QPixmap, int] | None = None
 
         # Video support
         self._single_video_player: VideoPlayerWidget | None = None
@@ -184,6 +286,24 @@ class PreviewPane(QWidget):
         self._grid_media_controller: GroupMediaController | None = None
         self._grid_pending_video_labels: dict[str, QLabel] = {}
         self._grid_all_players_ready: bool = False
+        # Bumped on every grid (re)build and on clear(); deferred tile
+        # batches and thumbnail tokens carry the value they were issued
+        # under and are dropped when it no longer matches.
+        self._grid_build_generation: int = 0
+        # Per-path sort/display metadata for the most recent grid, keyed by
+        # the group's path set: re-showing the same group (decision edits,
+        # re-selection) skips the header reads and stat calls.
+        self._grid_meta_key: frozenset[str] | None = None
+        self._grid_dims_cache: dict[str, tuple[int, int]] = {}
+        self._grid_size_cache: dict[str, int] = {}
+        self._grid_info_cache: dict[tuple[str, ...], str] = {}
+
+        # Resize events arrive in bursts while a splitter is dragged; the
+        # grid relayout / single-image refit runs once the burst settles.
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(PREVIEW_RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._on_resize_settled)
 
         # Track preview viewport resizes to keep fit-on-width accurate
         try:
@@ -191,6 +311,10 @@ class PreviewPane(QWidget):
             self.preview_area.installEventFilter(self)
         except Exception:
             pass
+        # Grid thumbnails are requested as their tiles scroll into view.
+        self.preview_area.verticalScrollBar().valueChanged.connect(
+            lambda _value: self._request_visible_thumbnails()
+        )
 
     # Public API
     def show_single(self, path: str, info: dict | None = None) -> None:
@@ -283,46 +407,35 @@ class PreviewPane(QWidget):
         # Normalize paths; read image dimensions once per image (header-only) for both
         # aspect-ratio sort and resolution display — avoids double QImageReader opens.
         # Tuple layout: (path, name, folder, size_txt, creation_txt, shot_txt, resolution)
-        # resolution is "W*H" for images, "" for videos.
-        def _image_dims(path: str) -> tuple[int, int]:
-            ext = path.lower().rsplit(".", 1)[-1] if "." in path else ""
-            if f".{ext}" in _RAW_EXTENSIONS:
-                w, h = _raw_sensor_dims(path)
-                if w > 0 and h > 0:
-                    return w, h
-            try:
-                sz = QImageReader(path).size()
-                w, h = sz.width(), sz.height()
-                if w > 0 and h > 0:
-                    return w, h
-            except Exception:
-                pass
-            try:
-                from PIL import Image
-                try:
-                    from pillow_heif import register_heif_opener
-                    register_heif_opener()
-                except ImportError:
-                    pass
-                with Image.open(path) as img:
-                    w, h = img.size
-                    if w > 0 and h > 0:
-                        return w, h
-            except Exception:
-                pass
-            return 0, 0
-
+        # resolution is "W*H" for images, "" for videos. ``is_video`` is evaluated once
+        # per path here into a parallel column; every later site reads the column.
         normalized = normalize_grid_items(items, normalize_windows_path)
-        result = attach_resolutions(normalized, _image_dims, is_video)
-
-        # Videos first by aspect (landscape→square→portrait), then larger first; images after.
-        videos = [it for it in result if is_video(it[0])]
-        images = [it for it in result if not is_video(it[0])]
-
-        videos.sort(
-            key=lambda it: (aspect_bucket_from_resolution(it[6]), -get_file_size_bytes(it[0]))
+        paths = [it[0] for it in normalized]
+        flags = [is_video(p) for p in paths]
+        video_flags = dict(zip(paths, flags, strict=True))
+        dims_cache, sizes_cache = self._grid_meta_for(frozenset(paths))
+
+        def _cached_dims(path: str) -> tuple[int, int]:
+            dims = dims_cache.get(path)
+            if dims is None:
+                dims = dims_cache[path] = _read_image_dims(path)
+            return dims
+
+        result = attach_resolutions(normalized, _cached_dims, video_flags.__getitem__)
+
+        # Videos first by aspect (landscape→square→portrait), then larger first; images
+        # after. The order is computed on indices and applied to each column once.
+        video_idx = [i for i, v in enumerate(flags) if v]
+        for i in video_idx:
+            if paths[i] not in sizes_cache:
+                sizes_cache[paths[i]] = get_file_size_bytes(paths[i])
+        video_idx.sort(
+            key=lambda i: (aspect_bucket_from_resolution(result[i][6]), -sizes_cache[paths[i]])
         )
-        self._grid_items = videos + images
+        order = video_idx + [i for i, v in enumerate(flags) if not v]
+        self._grid_paths = [paths[i] for i in order]
+        self._grid_is_video = [flags[i] for i in order]
+        self._grid_items = [result[i] for i in order]
 
         self._grid_container = QWidget()
         self._grid_layout = QGridLayout(self._grid_container)
@@ -334,86 +447,12 @@ class PreviewPane(QWidget):
         self._grid_pending_video_labels = {}
         self._grid_all_players_ready = False
 
-        # Check if any items are videos
-        has_videos = any(is_video(it[0]) for it in self._grid_items)
-
-        for i, it in enumerate(self._grid_items):
-            p, name, folder, size_txt, creation_txt, shot_txt, res = it
-            r, c = divmod(i, cols)
-            tile = QWidget()
-            v = QVBoxLayout(tile)
-            v.setContentsMargins(0, 0, 0, 0)
-
-            if is_video(p):
-                # Video tile: thumbnail + click to play
-                img_lbl = QLabel(t("preview.loading"))
-                img_lbl.setFixedSize(thumb_side, thumb_side)
-                img_lbl.setAlignment(Qt.AlignCenter)
-                img_lbl.setStyleSheet("background-color: black;")
-
-                # Bind with default args to capture current locals
-                def _make_click_handler(
-                    _path=p,
-                    _tile=tile,
-                    _v=v,
-                    _img=img_lbl,
-                    _name=name,
-                    _folder=folder,
-                    _size=size_txt,
-                ):
-                    return lambda e: self._on_video_tile_clicked(
-                        _path, _tile, _v, _img, _name, _folder, _size
-                    )
+        has_videos = bool(video_idx)
 
-                img_lbl.mousePressEvent = _make_click_handler()
-                v.addWidget(img_lbl)
-                self._grid_pending_video_labels[p] = img_lbl
-
-                tile_rows = build_info_rows(
-                    name=name,
-                    folder=folder,
-                    size_txt=size_txt,
-                    creation_txt=creation_txt,
-                    shot_txt=shot_txt,
-                    duration_unknown=True,
-                )
-                info = QLabel(format_info_html(tile_rows))
-                info.setTextFormat(Qt.RichText)
-                info.setWordWrap(True)
-                v.addWidget(info)
-                info.setObjectName("info_label")
-
-                self._grid_layout.addWidget(tile, r, c)
-                token = self._runner.request_grid_thumbnail(p, thumb_side)
-                self._grid_labels[token] = img_lbl
-            else:
-                # Image tile
-                img_lbl = QLabel(t("preview.loading"))
-                img_lbl.setFixedSize(thumb_side, thumb_side)
-                img_lbl.setAlignment(Qt.AlignCenter)
-
-                # Double-click on a grid image tile → open full-res viewer
-                def _make_dblclick_handler(_path=p):
-                    return lambda e: self.requestFullRes.emit(_path)
-
-                img_lbl.mouseDoubleClickEvent = _make_dblclick_handler()
-                v.addWidget(img_lbl)
-                tile_rows = build_info_rows(
-                    name=name,
-                    folder=folder,
-                    size_txt=size_txt,
-                    creation_txt=creation_txt,
-                    shot_txt=shot_txt,
-                    resolution=res,
-                )
-                info = QLabel(format_info_html(tile_rows))
-                info.setTextFormat(Qt.RichText)
-                info.setWordWrap(True)
-                info.setObjectName("info_label")
-                v.addWidget(info)
-                self._grid_layout.addWidget(tile, r, c)
-                token = self._runner.request_grid_thumbnail(p, thumb_side)
-                self._grid_labels[token] = img_lbl
+        # Only the tiles that fit in the viewport are built before we
+        # return; the rest follow in deferred batches (see
+        # ``_start_grid_build``) so selecting a large group paints at once.
+        self._start_grid_build(cols, thumb_side)
 
         self._preview_layout.addWidget(self._grid_container)
 
@@ -458,18 +497,28 @@ class PreviewPane(QWidget):
             self._grid_media_controller = None
 
         # Clean up grid container
+        self._grid_build_generation += 1
         if self._grid_container is not None:
             self._preview_layout.removeWidget(self._grid_container)
             self._grid_container.deleteLater()
             self._grid_container = None
             self._grid_layout = None
         self._grid_labels.clear()
+        self._grid_paths = []
+        self._grid_is_video = []
         self._grid_items = []
+        self._grid_info_labels = []
+        self._grid_tile_labels = []
+        self._grid_tile_tokens = []
+        self._grid_pixmaps = {}
+        self._grid_cols = 0
+        self._grid_thumb_side = 0
         self._single_info_label.clear()
         self._single_info_label.setVisible(False)
         self._single_label.clear()
         self._single_label.setVisible(False)
         self._single_pm = None
+        self._single_fit = None
         self._single_label_path = None
         self._single_info_payload = None
 
@@ -547,25 +596,12 @@ class PreviewPane(QWidget):
 
     def on_image_loaded(self, token: str, path: str, image: Any) -> None:
         try:
-            kind = classify_image_token(token)
-            if kind == "single":
-                if token != self._current_single_token:
-                    return
-                if image is None:
-                    self._single_label.setText(t("preview.failed"))
-                    return
-                pm = QPixmap.fromImage(image)
-                if pm.isNull():
-                    self._single_label.setText(t("preview.failed"))
-                    return
-                self._single_pm = pm
-                self._apply_single_pixmap_fit()
-                self._single_label.setText("")
-            elif kind == "grid":
-                lbl = self._grid_labels.get(token)
-                if not lbl:
-                    return
-
+            # Grid results dominate (one per tile), and ``_grid_labels``
+            # only holds tokens of the live grid build — the generation is
+            # part of the token — so a single lookup both routes a result
+            # and drops a stale one before any pixmap conversion.
+            lbl = self._grid_labels.get(token)
+            if lbl is not None:
                 # Update thumbnail
                 if image is None:
                     lbl.setText(t("preview.failed"))
@@ -574,14 +610,27 @@ class PreviewPane(QWidget):
                 if pm.isNull():
                     lbl.setText(t("preview.failed"))
                     return
-                lbl.setPixmap(
-                    pm.scaled(
-                        lbl.width(), lbl.height(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-                    )
+                self._grid_pixmaps[token] = pm
+                self._thumb_cache.put(
+                    (path, thumb_side_bucket(token_side(token), GRID_PIXMAP_CACHE_BUCKET_PX)),
+                    pm,
+                    pm.width() * pm.height() * pm.depth() // 8,
                 )
+                lbl.setPixmap(self._fit_pixmap(pm, lbl.width(), lbl.height()))
                 lbl.setText("")
 
                 # Remove misleading duration auto-update here; duration is updated by player when playing
+            elif token == self._current_single_token:
+                if image is None:
+                    self._single_label.setText(t("preview.failed"))
+                    return
+                pm = QPixmap.fromImage(image)
+                if pm.isNull():
+                    self._single_label.setText(t("preview.failed"))
+                    return
+                self._single_pm = pm
+                self._apply_single_pixmap_fit()
+                self._single_label.setText("")
 
         except Exception as ex:  # pragma: no cover - UI best effort
             logger.error("Update preview failed: {}", ex)
@@ -589,9 +638,8 @@ class PreviewPane(QWidget):
     def _on_video_tile_clicked(
         self,
         path: str,
-        tile: QWidget,
-        layout: QVBoxLayout,
         thumbnail_label: QLabel,
+        info_label: QLabel,
         name: str,
         folder: str,
         size_txt: str,
@@ -600,23 +648,29 @@ class PreviewPane(QWidget):
         if path in self._grid_video_players:
             # Already playing, do nothing or toggle
             return
+        # Each player holds a media pipeline and a video surface; past the
+        # cap the tile keeps its thumbnail rather than stopping a player
+        # the user already started.
+        if len(self._grid_video_players) >= GRID_MAX_VIDEO_PLAYERS:
+            size_value = t("preview.info_size_value", bytes=size_txt)
+            limit = t("preview.video_player_limit", n=GRID_MAX_VIDEO_PLAYERS)
+            info_label.setText(f"{name}\n{folder}\n{size_value}\n{limit}")
+            return
 
-        # Replace thumbnail with video player
+        # Replace thumbnail with video player in the same grid cell
+        layout = self._grid_layout
+        row, col = layout.getItemPosition(layout.indexOf(thumbnail_label))[:2]
         layout.removeWidget(thumbnail_label)
         thumbnail_label.hide()
 
         # Create video player
         try:
-            video_player = VideoPlayerWidget(path, tile)
-            layout.addWidget(video_player)
+            video_player = VideoPlayerWidget(path, self._grid_container)
+            layout.addWidget(video_player, row, col)
 
             # Update info label to show controls
-            info_label = tile.findChild(QLabel, "info_label")
-            if info_label:
-                size_value = t("preview.info_size_value", bytes=size_txt)
-                info_label.setText(
-                    f"{name}\n{folder}\n{size_value}\n{t('preview.click_to_pause')}"
-                )
+            size_value = t("preview.info_size_value", bytes=size_txt)
+            info_label.setText(f"{name}\n{folder}\n{size_value}\n{t('preview.click_to_pause')}")
 
             self._grid_video_players[path] = video_player
 
@@ -635,14 +689,12 @@ class PreviewPane(QWidget):
         except Exception as ex:
             logger.error("Failed to load video {}: {}", path, ex)
             # Restore thumbnail on error
-            layout.addWidget(thumbnail_label)
+            layout.addWidget(thumbnail_label, row, col)
             thumbnail_label.show()
-            info_label = tile.findChild(QLabel, "info_label")
-            if info_label:
-                size_value = t("preview.info_size_value", bytes=size_txt)
-                info_label.setText(
-                    f"{name}\n{folder}\n{size_value}\n{t('preview.video_not_available')}"
-                )
+            size_value = t("preview.info_size_value", bytes=size_txt)
+            info_label.setText(
+                f"{name}\n{folder}\n{size_value}\n{t('preview.video_not_available')}"
+            )
 
         # If all videos in view have been instantiated, start group autoplay
         self._try_group_autoplay()
@@ -656,15 +708,19 @@ class PreviewPane(QWidget):
         """
 
     def _try_group_autoplay(self) -> None:
-        """If all visible videos have players, autoplay all via controller."""
-        if not self._grid_items:
+        """If all visible videos have players, autoplay all via controller.
+
+        A group with more videos than ``GRID_MAX_VIDEO_PLAYERS`` counts as
+        ready once the cap is reached: no further player can be built.
+        """
+        if not self._grid_paths:
             return
         pending = [
-            it[0]
-            for it in self._grid_items
-            if is_video(it[0]) and it[0] not in self._grid_video_players
+            p
+            for p, is_vid in zip(self._grid_paths, self._grid_is_video, strict=True)
+            if is_vid and p not in self._grid_video_players
         ]
-        if pending:
+        if pending and len(self._grid_video_players) < GRID_MAX_VIDEO_PLAYERS:
             return
         if self._grid_all_players_ready:
             return
@@ -729,110 +785,27 @@ class PreviewPane(QWidget):
     # Qt events
     def resizeEvent(self, event) -> None:  # type: ignore[override]
         super().resizeEvent(event)
+        # (Re)start the debounce: only the last event of a burst does work.
+        self._resize_timer.start()
+
+    def _fit_pixmap(self, pm: QPixmap, width: int, height: int) -> QPixmap:
+        """``pm`` aspect-fit into ``width × height``; ``pm`` itself when a
+        decode at the tile side already fits (see :func:`fits_box`)."""
+        if fits_box(pm.width(), pm.height(), width, height):
+            return pm
+        return pm.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    def _on_resize_settled(self) -> None:
         if self._grid_container is not None and self._grid_layout is not None and self._grid_items:
-            # rebuild grid with new geometry
-            self._preview_layout.removeWidget(self._grid_container)
-            self._grid_container.deleteLater()
-            self._grid_container = QWidget()
-            self._grid_layout = QGridLayout(self._grid_container)
-            self._grid_layout.setSpacing(GRID_SPACING_PX)
+            # Keep the built tiles: re-place / re-size them only when the
+            # geometry moved enough to matter (see needs_grid_relayout).
             self._apply_grid_margins()
             cols, thumb_side = self._compute_grid_geometry()
-            self._grid_labels = {}
-
-            # Check if any items are videos for controller
-            has_videos = any(is_video(it[0]) for it in self._grid_items)
-
-            for i, it in enumerate(self._grid_items):
-                p, name, folder, size_txt, creation_txt, shot_txt, res = it
-                r, c = divmod(i, cols)
-                tile = QWidget()
-                v = QVBoxLayout(tile)
-                v.setContentsMargins(0, 0, 0, 0)
-
-                if is_video(p):
-                    # Video tile
-                    img_lbl = QLabel(t("preview.loading"))
-                    img_lbl.setFixedSize(thumb_side, thumb_side)
-                    img_lbl.setAlignment(Qt.AlignCenter)
-                    img_lbl.setStyleSheet("background-color: black;")
-
-                    def _make_click_handler2(
-                        _path=p,
-                        _tile=tile,
-                        _v=v,
-                        _img=img_lbl,
-                        _name=name,
-                        _folder=folder,
-                        _size=size_txt,
-                    ):
-                        return lambda e: self._on_video_tile_clicked(
-                            _path, _tile, _v, _img, _name, _folder, _size
-                        )
-
-                    img_lbl.mousePressEvent = _make_click_handler2()
-                    v.addWidget(img_lbl)
-
-                    extra = []
-                    if creation_txt:
-                        extra.append(f"{t('preview.info_created')}: {creation_txt}")
-                    if shot_txt:
-                        extra.append(f"{t('preview.info_shot')}: {shot_txt}")
-                    extra_txt = ("\n" + "\n".join(extra)) if extra else ""
-                    size_value = t("preview.info_size_value", bytes=size_txt)
-                    duration_unknown = t("preview.info_duration_unknown")
-                    duration_label = t("preview.info_duration")
-                    info = QLabel(
-                        f"{name}\n{folder}\n{size_value}{extra_txt}\n"
-                        f"({duration_label}: {duration_unknown})"
-                    )
-                    info.setWordWrap(True)
-                    info.setObjectName("info_label")
-                    v.addWidget(info)
-
-                    self._grid_layout.addWidget(tile, r, c)
-                    token = self._runner.request_grid_thumbnail(p, thumb_side)
-                    self._grid_labels[token] = img_lbl
-                else:
-                    # Image tile — resolution comes from cached _grid_items, no extra I/O
-                    img_lbl = QLabel(t("preview.loading"))
-                    img_lbl.setFixedSize(thumb_side, thumb_side)
-                    img_lbl.setAlignment(Qt.AlignCenter)
-                    v.addWidget(img_lbl)
-                    extra = []
-                    if creation_txt:
-                        extra.append(f"{t('preview.info_created')}: {creation_txt}")
-                    if shot_txt:
-                        extra.append(f"{t('preview.info_shot')}: {shot_txt}")
-                    extra_txt = ("\n" + "\n".join(extra)) if extra else ""
-                    res_txt = f"\n{res}" if res else ""
-                    size_value = t("preview.info_size_value", bytes=size_txt)
-                    info = QLabel(f"{name}\n{folder}\n{size_value}{res_txt}{extra_txt}")
-                    info.setWordWrap(True)
-                    info.setObjectName("info_label")
-                    v.addWidget(info)
-                    self._grid_layout.addWidget(tile, r, c)
-                    token = self._runner.request_grid_thumbnail(p, thumb_side)
-                    self._grid_labels[token] = img_lbl
-
-            self._preview_layout.addWidget(self._grid_container)
-
-            # Add group controller if videos are present
-            if has_videos:
-                if self._grid_media_controller is None:
-                    self._grid_media_controller = GroupMediaController(self._preview_container)
-                    self._preview_layout.addWidget(self._grid_media_controller)
-                    # Re-register existing players
-                    for player in self._grid_video_players.values():
-                        self._grid_media_controller.register_player(player)
-                # After rebuild, attempt autoplay if all are ready
-                self._try_group_autoplay()
-            elif self._grid_media_controller is not None:
-                # Remove controller if no videos
-                self._preview_layout.removeWidget(self._grid_media_controller)
-                self._grid_media_controller.cleanup()
-                self._grid_media_controller.deleteLater()
-                self._grid_media_controller = None
+            if needs_grid_relayout(self._grid_cols, self._grid_thumb_side, cols, thumb_side):
+                self._relayout_grid(cols, thumb_side)
+            else:
+                # A taller viewport can uncover tiles without a relayout.
+                self._request_visible_thumbnails()
         else:
             self._apply_single_pixmap_fit()
 
@@ -840,12 +813,281 @@ class PreviewPane(QWidget):
         try:
             if event and event.type() == QEvent.Resize:
                 if obj is self.preview_area or obj is self.preview_area.viewport():
-                    self._apply_single_pixmap_fit()
+                    self._resize_timer.start()
         except Exception:
             pass
         return super().eventFilter(obj, event)
 
     # internals
+    def _grid_meta_for(
+        self, paths: frozenset[str]
+    ) -> tuple[dict[str, tuple[int, int]], dict[str, int]]:
+        """Return the (dims, file size) caches for the grid over ``paths``.
+
+        Only the last group is remembered — a different path set drops
+        these caches (and the info-HTML cache) so they never grow past
+        one group's worth of entries.
+        """
+        if paths != self._grid_meta_key:
+            self._grid_meta_key = paths
+            self._grid_dims_cache = {}
+            self._grid_size_cache = {}
+            self._grid_info_cache = {}
+        return self._grid_dims_cache, self._grid_size_cache
+
+    def _start_grid_build(self, cols: int, thumb_side: int) -> None:
+        """Build the tiles that fit in the viewport now, defer the rest.
+
+        The first batch is sized by :func:`compute_visible_tile_count`;
+        each later batch is the same size and runs on its own event-loop
+        turn, so a 500-item group costs one screenful of widget
+        construction before the pane paints instead of 500 tiles.
+        Bumping ``_grid_build_generation`` orphans any batch still queued,
+        and any thumbnail still decoding, from a previous grid.
+        """
+        self._grid_build_generation += 1
+        self._grid_cols = cols
+        self._grid_thumb_side = thumb_side
+        batch = compute_visible_tile_count(
+            viewport_height=self.preview_area.viewport().height(),
+            cell_size=thumb_side,
+            spacing=GRID_SPACING_PX,
+            cols=cols,
+        )
+        self._build_grid_tiles(0, batch)
+        if batch < len(self._grid_items):
+            self._schedule_grid_batch(batch, batch)
+
+    def _schedule_grid_batch(self, start: int, batch: int) -> None:
+        generation = self._grid_build_generation
+        QTimer.singleShot(
+            0,
+            self,
+            lambda: self._build_deferred_grid_batch(generation, start, batch),
+        )
+
+    def _build_deferred_grid_batch(self, generation: int, start: int, batch: int) -> None:
+        # Stale batch: clear() / a rebuild replaced the grid after this
+        # batch was queued. Its tiles would land in a dead container.
+        if generation != self._grid_build_generation or self._grid_layout is None:
+            return
+        stop = start + batch
+        self._build_grid_tiles(start, stop)
+        if stop < len(self._grid_items):
+            self._schedule_grid_batch(stop, batch)
+
+    def _build_grid_tiles(self, start: int, stop: int) -> None:
+        # Geometry is read per batch, not captured at scheduling time, so
+        # tiles built after a resize land at the current cols / size.
+        cols, thumb_side = self._grid_cols, self._grid_thumb_side
+        for i in range(start, min(stop, len(self._grid_items))):
+            self._build_grid_tile(i, cols, thumb_side)
+        self._request_visible_thumbnails()
+
+    def _build_grid_tile(self, i: int, cols: int, thumb_side: int) -> None:
+        p = self._grid_paths[i]
+        name, folder, size_txt = self._grid_items[i][1:4]
+        parent = self._grid_container
+        info = QLabel(parent)
+        info.setTextFormat(Qt.RichText)
+        info.setWordWrap(True)
+        info.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        info.setObjectName("info_label")
+
+        img_lbl = QLabel(parent)
+        img_lbl.setFixedSize(thumb_side, thumb_side)
+        img_lbl.setPixmap(_placeholder_pixmap(thumb_side))
+        img_lbl.setAlignment(Qt.AlignCenter)
+
+        if self._grid_is_video[i]:
+            # Video tile: thumbnail + click to play
+            img_lbl.setStyleSheet("background-color: black;")
+
+            # Bind with default args to capture current locals
+            def _make_click_handler(
+                _path=p,
+                _img=img_lbl,
+                _info=info,
+                _name=name,
+                _folder=folder,
+                _size=size_txt,
+            ):
+                return lambda e: self._on_video_tile_clicked(
+                    _path, _img, _info, _name, _folder, _size
+                )
+
+            img_lbl.mousePressEvent = _make_click_handler()
+            self._grid_pending_video_labels[p] = img_lbl
+        else:
+            # Double-click on a grid image tile → open full-res viewer
+            def _make_dblclick_handler(_path=p):
+                return lambda e: self.requestFullRes.emit(_path)
+
+            img_lbl.mouseDoubleClickEvent = _make_dblclick_handler()
+        info.setText(self._grid_info_html(i))
+        self._place_grid_tile(i, img_lbl, info, cols)
+        # Cached thumbnails paint now; the rest are requested by
+        # _request_visible_thumbnails once the tile is on screen.
+        token = self._request_tile_thumbnail(p, thumb_side, img_lbl, cached_only=True)
+        self._grid_tile_labels.append(img_lbl)
+        self._grid_info_labels.append(info)
+        self._grid_tile_tokens.append(token)
+
+    def _grid_info_html(self, i: int) -> str:
+        """Return the info-label HTML for grid tile ``i``, built once.
+
+        Keyed by the tile's item tuple (every input to the text, the path
+        fixing the video flag), in a cache that lives as long as
+        ``_grid_meta_for``'s: re-showing the same group reuses the strings
+        instead of re-rendering the table.
+        """
+        it = self._grid_items[i]
+        html = self._grid_info_cache.get(it)
+        if html is None:
+            _p, name, folder, size_txt, creation_txt, shot_txt, res = it
+            if self._grid_is_video[i]:
+                rows = build_info_rows(
+                    name=name,
+                    folder=folder,
+                    size_txt=size_txt,
+                    creation_txt=creation_txt,
+                    shot_txt=shot_txt,
+                    duration_unknown=True,
+                )
+            else:
+                rows = build_info_rows(
+                    name=name,
+                    folder=folder,
+                    size_txt=size_txt,
+                    creation_txt=creation_txt,
+                    shot_txt=shot_txt,
+                    resolution=res,
+                )
+            html = self._grid_info_cache[it] = format_info_html(rows)
+        return html
+
+    def _place_grid_tile(self, i: int, top: QWidget, info: QLabel, cols: int) -> None:
+        """Put tile ``i`` at its cell: ``top`` (thumbnail or video player)
+        on grid row ``2*r``, its info label on ``2*r + 1``.
+
+        Tiles have no per-tile QWidget + QVBoxLayout wrapper — two
+        labels placed straight into ``_grid_layout`` halve the QObjects
+        per tile, and a relayout is two ``addWidget`` calls.
+        """
+        r, c = divmod(i, cols)
+        self._grid_layout.addWidget(top, 2 * r, c)
+        self._grid_layout.addWidget(info, 2 * r + 1, c)
+
+    def _relayout_grid(self, cols: int, thumb_side: int) -> None:
+        """Move the built tiles to a new column count / cell size.
+
+        Tiles are detached from the layout (not deleted) and re-added
+        at their new ``(row, col)``; thumbnails are rescaled from the
+        cached decode. Only a tile whose cell outgrew its decode (see
+        :func:`needs_thumbnail_redecode`) queues a new thumbnail
+        request. Tiles still waiting on a deferred batch are built at
+        the new geometry when their batch runs.
+        """
+        self._grid_cols = cols
+        self._grid_thumb_side = thumb_side
+        layout = self._grid_layout
+        while layout.count():
+            layout.takeAt(0)
+        # The label lists are appended together per built tile. _grid_paths
+        # covers the whole group, so it runs ahead while batches are pending.
+        tiles = zip(self._grid_tile_labels, self._grid_info_labels, strict=True)
+        for i, (lbl, info) in enumerate(tiles):
+            # A started video player took over its thumbnail's cell.
+            top = self._grid_video_players.get(self._grid_paths[i], lbl)
+            self._place_grid_tile(i, top, info, cols)
+            self._resize_grid_tile(i, thumb_side)
+        self._request_visible_thumbnails()
+
+    def _resize_grid_tile(self, i: int, thumb_side: int) -> None:
+        lbl = self._grid_tile_labels[i]
+        lbl.setFixedSize(thumb_side, thumb_side)
+        token = self._grid_tile_tokens[i]
+        pm = self._grid_pixmaps.get(token)
+        if pm is None:
+            # Still loading (or not yet requested): the decode is scaled to
+            # the label's new size when it lands. A failed tile keeps its text.
+            if not lbl.text():
+                lbl.setPixmap(_placeholder_pixmap(thumb_side))
+            return
+        lbl.setPixmap(self._fit_pixmap(pm, thumb_side, thumb_side))
+        if needs_thumbnail_redecode(max(pm.width(), pm.height()), thumb_side):
+            # The upscaled pixmap stays up as a placeholder until the
+            # sharper decode lands under the new token.
+            self._grid_labels.pop(token, None)
+            self._grid_pixmaps.pop(token, None)
+            self._grid_tile_tokens[i] = self._request_tile_thumbnail(
+                self._grid_paths[i], thumb_side, lbl
+            )
+
+    def _request_visible_thumbnails(self) -> None:
+        """Queue decodes for built tiles in (or just below) the viewport.
+
+        ``_build_grid_tile`` only paints cache hits; a tile whose token
+        is still ``""`` gets its request here once
+        :func:`visible_tile_range` puts it on screen. Runs after each
+        build batch, after a resize and on every vertical scroll, so a
+        long group never decodes the tiles nobody scrolls to.
+        """
+        labels = self._grid_tile_labels
+        if self._grid_container is None or not labels:
+            return
+        cols, thumb_side = self._grid_cols, self._grid_thumb_side
+        # Row pitch from the laid-out tiles once there are two rows; the
+        # thumbnail-only estimate is shorter, so it errs towards more tiles.
+        row_px = thumb_side + GRID_SPACING_PX
+        if len(labels) > cols:
+            pitch = labels[cols].y() - labels[0].y()
+            if pitch > 0:
+                row_px = pitch
+        start, stop = visible_tile_range(
+            scroll_y=(
+                self.preview_area.verticalScrollBar().value()
+                - self._grid_container.y()
+                - labels[0].y()
+            ),
+            viewport_height=self.preview_area.viewport().height(),
+            row_px=row_px,
+            cols=cols,
+            count=len(labels),
+        )
+        # Runs on every scroll step: bind the per-tile lookups once.
+        tokens, paths = self._grid_tile_tokens, self._grid_paths
+        request = self._request_tile_thumbnail
+        for i in range(start, stop):
+            if not tokens[i]:
+                tokens[i] = request(paths[i], thumb_side, labels[i])
+
+    def _request_tile_thumbnail(
+        self, path: str, thumb_side: int, lbl: QLabel, *, cached_only: bool = False
+    ) -> str:
+        """Show ``path``'s thumbnail in ``lbl``; return the tile's token.
+
+        A hit in ``_thumb_cache`` is painted synchronously and no task
+        is queued; a miss queues a decode whose result
+        ``on_image_loaded`` routes back through ``_grid_labels`` — or,
+        with ``cached_only``, returns ``""`` and queues nothing.
+        """
+        generation = self._grid_build_generation
+        token = make_grid_token(path, thumb_side, generation)
+        pm = self._thumb_cache.get(
+            (path, thumb_side_bucket(thumb_side, GRID_PIXMAP_CACHE_BUCKET_PX))
+        )
+        if pm is not None:
+            self._grid_pixmaps[token] = pm
+            lbl.setPixmap(self._fit_pixmap(pm, thumb_side, thumb_side))
+            lbl.setText("")
+        elif cached_only:
+            return ""
+        else:
+            token = self._runner.request_grid_thumbnail(path, thumb_side, generation)
+        self._grid_labels[token] = lbl
+        return token
+
     def _apply_grid_margins(self) -> None:
         if self._grid_layout is None:
             return
@@ -881,6 +1123,10 @@ class PreviewPane(QWidget):
             vp = self.preview_area.viewport()
             pm = self._single_pm
             target_w = compute_fit_width(pm.width(), vp.width())
+            last = self._single_fit
+            if last is not None and last[0] is pm and last[1] == target_w:
+                return
+            self._single_fit = (pm, target_w)
             if pm.width() != target_w:
                 scaled = pm.scaledToWidth(target_w, Qt.SmoothTransformation)
                 self._single_label.setPixmap(scaled)
@@ -2,8 +2,8 @@
 :class:`app.views.preview_pane.PreviewPane`.
 
 Extracted so the load-bearing decision logic (info-row build,
-grid geometry, fit-to-window math, aspect-bucket sorting, token
-routing, HTML formatting) is unit-testable against plain Python
+grid geometry, fit-to-window math, aspect-bucket sorting, HTML
+formatting) is unit-testable against plain Python
 without cascade-importing the Qt media stack.
 
 Same extraction pattern previously used by ``action_handlers.py``
@@ -26,19 +26,30 @@ What lives here:
 * :func:`compute_grid_geometry` — viewport-width × max-thumb-size
   → ``(cols, cell_size)`` packing math; the core layout decision
   for the grid view.
+* :func:`compute_visible_tile_count` — viewport-height × cell size
+  → number of tiles worth building before ``show_grid`` returns.
+* :func:`visible_tile_range` — scroll offset × viewport height →
+  index range of tiles whose thumbnails are worth requesting now.
+* :func:`needs_grid_relayout` — old vs new ``(cols, cell_size)`` →
+  whether a resize must re-place / re-size the existing grid tiles.
+* :func:`needs_thumbnail_redecode` — decoded pixmap side vs new
+  cell size → whether rescaling the cached pixmap is too blurry.
+* :func:`thumb_side_bucket` — round a cell size to the grid pixmap
+  cache's bucket so near-identical geometries share entries.
+* :class:`BoundedLRUCache` — entry- and cost-capped LRU map backing
+  the grid pixmap cache.
+* :func:`fits_box` — whether a pixmap already is its aspect-fit
+  scale into a box, so the rescale can be skipped.
 * :func:`compute_fit_width` — pixmap × viewport → scaled-target-width
   with positive-only guard. Used by ``_apply_single_pixmap_fit``
   to fit-on-width without distorting.
-* :func:`classify_image_token` — ``"single|…" → "single"``,
-  ``"grid|…" → "grid"``, anything else → ``None``. Used by
-  ``on_image_loaded`` to route decoded thumbnails to the right
-  display surface.
 """
 
 from __future__ import annotations
 
 import os
-from typing import Any, Callable, Iterable
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable
 
 
 # RAW formats whose dims must be read via rawpy (Qt's QImageReader
@@ -186,10 +197,17 @@ def compute_grid_geometry(
     and a per-cell ``thumb_size_max`` ceiling. Returns ``(cols,
     cell_size)``.
 
-    Iterates from 1 column upward; stops when the per-cell size
-    would drop below ``min_px``. Cell size is clamped to
-    ``thumb_size_max``. The starting state is ``(1, min_px)`` so a
-    pathologically narrow viewport still returns something usable.
+    The cell is the full width capped at ``thumb_size_max``; when the
+    cap binds, the column count is however many capped cells (plus
+    ``spacing`` gutters) fit: ``(width + spacing) // (max_px +
+    spacing)``, capped at 63. A viewport narrower than ``min_px``
+    (or a cap below it) returns ``(1, min_px)`` so a pathologically
+    narrow viewport still gets something usable.
+
+    Closed form of the original per-column scan (1..63 columns,
+    keeping the last column count whose capped cell tied the best
+    one); runs on every settled resize, so it is O(1) instead of up to
+    63 divisions.
 
     Pulled from :meth:`PreviewPane._compute_grid_geometry`. Pure
     math — the original method just reads ``viewport.width()`` and
@@ -197,32 +215,217 @@ def compute_grid_geometry(
 
     Failure modes:
 
-    * A refactor that drops the ``< min_px`` break condition would
-      compute cells smaller than the legibility floor, producing
-      unreadable thumbnails on narrow viewports.
-    * A refactor that drops the ``min(cell, max_px)`` clamp would
-      let a wide viewport produce ENORMOUS single-column thumbnails
-      that overflow the scroll area.
-    * The "non-strict ``>=``" comparison on ``cand >= best_cell``
-      is intentional — it lets MORE columns win on a tie. A refactor
-      to strict ``>`` would prefer the FIRST tied option (1 column)
-      over later options (2, 3, ...) — visibly wrong on viewports
-      that pack evenly into multiple columns at the max cell size.
+    * A refactor that drops the ``< min_px`` fallback would compute
+      cells smaller than the legibility floor, producing unreadable
+      thumbnails on narrow viewports.
+    * A refactor that drops the ``max_px`` clamp would let a wide
+      viewport produce ENORMOUS single-column thumbnails that overflow
+      the scroll area.
+    * Packing as many columns as fit at the capped size is
+      intentional — more columns win over a single oversized column on
+      viewports that pack evenly into several cells at the max size.
     """
     width = max(1, viewport_width)
     max_px = thumb_size_max if thumb_size_max > 0 else 600
-    best_cols = 1
-    best_cell = min_px
-    for cols in range(1, 64):
-        total_spacing = spacing * (cols - 1)
-        cell = (width - total_spacing) // cols
-        if cell < min_px:
-            break
-        cand = min(cell, max_px)
-        if cand >= best_cell:
-            best_cell = cand
-            best_cols = cols
-    return best_cols, best_cell
+    if width < min_px or max_px < min_px:
+        return 1, min_px
+    if width < max_px:
+        return 1, width
+    return min(63, (width + spacing) // (max_px + spacing)), max_px
+
+
+def fits_box(width: int, height: int, box_w: int, box_h: int) -> bool:
+    """Return whether a ``width × height`` image already is what an
+    aspect-preserving scale into ``box_w × box_h`` would produce: it
+    fits, and touches the box on at least one side.
+
+    Grid thumbnails are decoded at the tile's side
+    (``QImageReader.setScaledSize``), so the arriving image normally
+    satisfies this and the label can show it without another
+    full-image rescale.
+
+    Failure mode: dropping the "touches one side" half would skip the
+    upscale of a small decode, leaving a postage-stamp thumbnail in a
+    large tile.
+    """
+    if width <= 0 or height <= 0:
+        return False
+    return width <= box_w and height <= box_h and (width == box_w or height == box_h)
+
+
+def compute_visible_tile_count(
+    viewport_height: int,
+    cell_size: int,
+    spacing: int,
+    cols: int,
+) -> int:
+    """Return how many grid tiles fit in one viewport-height of rows,
+    plus one lookahead row.
+
+    Used by :meth:`PreviewPane.show_grid` to size the synchronous
+    first batch of tile construction — the tiles the user can see
+    are built before ``show_grid`` returns, the remainder is built
+    in deferred batches of the same size on later event-loop turns.
+
+    Each row is assumed to be ``cell_size + spacing`` tall. Real
+    tiles are taller (the info label sits under the thumbnail), so
+    this over-estimates the visible row count — erring towards
+    building one row too many rather than leaving a visible hole.
+
+    Failure mode: a refactor that drops the ``+ 1`` lookahead row
+    would leave the partially-visible bottom row blank until the
+    first deferred batch lands — a visible flicker on every group
+    selection.
+    """
+    row_px = max(1, cell_size + spacing)
+    rows = max(0, viewport_height) // row_px + 1
+    return max(1, rows * max(1, cols))
+
+
+def visible_tile_range(
+    scroll_y: int,
+    viewport_height: int,
+    row_px: int,
+    cols: int,
+    count: int,
+) -> tuple[int, int]:
+    """Return the ``[start, stop)`` tile indices on screen, plus one
+    lookahead row below.
+
+    Used by :meth:`PreviewPane._request_visible_thumbnails` so only the
+    tiles the user can see (or is about to scroll to) queue a decode.
+    ``scroll_y`` is the viewport's top edge in grid-container
+    coordinates; ``row_px`` is the pitch of one tile row (thumbnail
+    plus info label).
+
+    Failure mode: a refactor that drops the lookahead row leaves the
+    row just below the fold showing "Loading…" on every small scroll,
+    because its request only goes out once it is already visible.
+    """
+    row_px = max(1, row_px)
+    cols = max(1, cols)
+    top = max(0, scroll_y)
+    first_row = top // row_px
+    last_row = (top + max(0, viewport_height)) // row_px + 1
+    return min(count, first_row * cols), min(count, (last_row + 1) * cols)
+
+
+def needs_grid_relayout(
+    old_cols: int,
+    old_cell_size: int,
+    cols: int,
+    cell_size: int,
+    min_grow_px: int = 16,
+) -> bool:
+    """Return whether a resize has to touch the existing grid tiles.
+
+    Used by :meth:`PreviewPane.resizeEvent` to skip the per-tile
+    re-place / re-size pass on resize ticks that don't matter. A
+    column-count change always relayouts; so does any shrink of the
+    cell size, because tiles keep their fixed size and the scroll
+    area's horizontal bar is off — an un-shrunk row would be clipped
+    at the right edge. Growth below ``min_grow_px`` only leaves a
+    sliver of slack to the right and is skipped.
+
+    Failure mode: a refactor that applies the threshold symmetrically
+    (``abs(delta) < min_grow_px``) would let a slowly narrowing
+    window clip up to ``min_grow_px - 1`` pixels off every column.
+    """
+    if cols != old_cols:
+        return True
+    grow = cell_size - old_cell_size
+    return not (0 <= grow < min_grow_px)
+
+
+def needs_thumbnail_redecode(
+    pixmap_side: int,
+    cell_size: int,
+    max_upscale: float = 1.25,
+) -> bool:
+    """Return whether a grid tile needs a fresh thumbnail decode after
+    its cell grew to ``cell_size``.
+
+    ``pixmap_side`` is the longer edge of the already-decoded
+    thumbnail. Shrinking (and mild growth) is served by scaling that
+    pixmap in memory; only upscaling it by more than ``max_upscale``
+    — where the blur becomes visible — pays for another decode.
+
+    Failure mode: a refactor that re-decodes on every size change
+    puts one background decode per tile back on every resize tick,
+    the cost the tile-preserving resize exists to avoid.
+    """
+    if pixmap_side <= 0:
+        return True
+    return cell_size > pixmap_side * max_upscale
+
+
+def thumb_side_bucket(cell_size: int, step: int = 32) -> int:
+    """Round ``cell_size`` to the nearest multiple of ``step`` (min ``step``).
+
+    Cache key component for :class:`PreviewPane`'s decoded-thumbnail
+    cache: two grids whose cells differ by a few pixels (a slightly
+    different splitter position) share entries instead of each
+    paying for its own decode.
+
+    Failure mode: floor division instead of rounding would file a
+    223px request under 192 — a decode ~15% smaller than the cell,
+    upscaled and visibly soft.
+    """
+    step = max(1, step)
+    return max(step, int(round(cell_size / step)) * step)
+
+
+class BoundedLRUCache:
+    """LRU map capped by entry count AND total caller-supplied cost.
+
+    Backs the preview grid's decoded-pixmap cache; ``cost`` is the
+    pixmap's byte size, so a few huge thumbnails can't pin hundreds
+    of megabytes under an entry-count cap alone. Main-thread only —
+    unlike ``ImageService``'s ``_ByteBudgetLRUCache`` no worker
+    thread touches it, so there is no lock.
+
+    Failure mode: a ``get`` that forgets ``move_to_end`` degrades to
+    FIFO — the tiles of the group the user keeps returning to are
+    evicted first.
+    """
+
+    def __init__(self, max_entries: int, max_cost: int) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._max_cost = max(1, int(max_cost))
+        self._data: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._total_cost = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        self._data.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any, cost: int) -> None:
+        old = self._data.pop(key, None)
+        if old is not None:
+            self._total_cost -= old[1]
+        cost = max(0, int(cost))
+        self._data[key] = (value, cost)
+        self._total_cost += cost
+        # Never evict the entry just inserted, even if it alone is over budget.
+        while len(self._data) > 1 and (
+            len(self._data) > self._max_entries or self._total_cost > self._max_cost
+        ):
+            _, (_, evicted_cost) = self._data.popitem(last=False)
+            self._total_cost -= evicted_cost
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._total_cost = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def total_cost(self) -> int:
+        return self._total_cost
 
 
 def compute_fit_width(pixmap_width: int, viewport_width: int) -> int:
@@ -327,31 +530,3 @@ def attach_resolutions(
             res = ""
         out.append((p, it[1], it[2], it[3], it[4], it[5], res))
     return out
-
-
-def classify_image_token(token: str) -> str | None:
-    """Route a decoded-thumbnail token to the right display surface.
-
-    Tokens follow the convention ``"<surface>|<payload>"``:
-
-    * ``"single|<path>"`` → returns ``"single"`` — display in the
-      large single-preview area.
-    * ``"grid|<path>"`` → returns ``"grid"`` — display in the
-      corresponding grid-tile label (looked up by full token).
-    * Anything else → ``None`` (ignore — defensive against
-      malformed payloads from a future runner change).
-
-    Pulled from :meth:`PreviewPane.on_image_loaded`. The owner's
-    2026-05-16 comment specifically called out the
-    "token-mismatch race" failure mode (an in-flight thumbnail
-    arriving after the user clicked away to a different file). The
-    classification step is the front edge of the routing — without
-    it, a renamed token prefix silently drops every load.
-    """
-    if not isinstance(token, str):
-        return None
-    if token.startswith("single|"):
-        return "single"
-    if token.startswith("grid|"):
-        return "grid"
-    return None
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import math
 from collections.abc import Iterable
-from pathlib import Path
+from datetime import datetime
+from os.path import basename
 
 from PySide6.QtCore import QSortFilterProxyModel, Qt
 from PySide6.QtGui import QStandardItem, QStandardItemModel
@@ -24,6 +25,7 @@ from app.views.constants import (
     SORT_ROLE,
     headers,
 )
+from core.models import PhotoGroup
 from infrastructure.i18n import t
 from scanner.phash_distance import hamming_distance as _phash_hamming
 
@@ -71,7 +73,7 @@ def _lock_display(is_locked: bool) -> str:
     Empty for unlocked rows so the column reads as visually quiet at
     the typical state (very few rows locked at any time). Sortable via
     SORT_ROLE on the same column (0 / 1). Searchable as the string
-    ``"Locked"`` (see :func:`_get_record_field` in file_operations).
+    ``"Locked"`` (see :func:`_record_field_getter` in file_operations).
     """
     return _LOCK_GLYPH if is_locked else ""
 
@@ -248,6 +250,37 @@ def _pick_ref_winner(items_list: Iterable[object]) -> object | None:
 _UNSCORED_SORT_VALUE: float = -1.0
 
 
+def _sort_timestamp(dt: datetime | None) -> int | None:
+    """Whole-second epoch timestamp for a date column's SORT_ROLE.
+
+    ``None`` for a missing date and for one the platform cannot convert
+    (``datetime.timestamp`` raises ``OSError`` on Windows for naive
+    dates before 1970, ``OverflowError`` out of range) — the one call in
+    ``build_model``'s row loop that can fail on well-formed records.
+    """
+    if dt is None:
+        return None
+    try:
+        return int(dt.timestamp())
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+# Template every cell is cloned from. ``clone()`` is a single C++ copy
+# that carries the non-editable flag along, cheaper than constructing an
+# item and then clearing its editable flag through a second binding call.
+_CELL_TEMPLATE = QStandardItem()
+_CELL_TEMPLATE.setEditable(False)
+
+
+def _cell(text: str = "") -> QStandardItem:
+    """A new non-editable cell showing ``text`` (blank by default)."""
+    item = _CELL_TEMPLATE.clone()
+    if text:
+        item.setText(text)
+    return item
+
+
 def _score_display(score: float | None) -> str:
     """Format a score for the COL_SCORE cell.
 
@@ -262,145 +295,125 @@ def _score_display(score: float | None) -> str:
 
 
 def build_model(
-    groups: Iterable[object],
+    groups: Iterable[PhotoGroup],
 ) -> tuple[QStandardItemModel, QSortFilterProxyModel | None]:
     """Builds the tree model and a proxy for sorting with roles.
 
     Returns (model, proxy). Proxy can be None on failure.
 
     Args:
-        groups: Iterable of group objects with ``items`` and
-            ``group_number``.
+        groups: Iterable of :class:`PhotoGroup`; fields are read directly,
+            so duck-typed stand-ins must carry every field the rows show.
     """
     model = QStandardItemModel()
     model.setHorizontalHeaderLabels(headers())
 
+    # Track Qt heap QStandardItem count for memory_probe (no-op when probe
+    # disabled). Resolved once per build: where ``scripts`` is not shipped
+    # the import would otherwise fail — and raise — once per file row.
+    try:
+        from scripts.memory_probe import _ENABLED as probe_enabled  # type: ignore[import]
+        from scripts.memory_probe import track_qt_alloc  # type: ignore[import]
+    except ImportError:
+        probe_enabled = False
+
+    # Localized Action-column labels, resolved once per distinct decision
+    # per build rather than through a translator lookup on every file row.
+    decision_labels: dict[str, str] = {}
+
+    # Date-cell texts, formatted once per distinct timestamp per build:
+    # copies in a duplicate group usually share their shot date, and
+    # bulk-copied files their creation time.
+    date_texts: dict[datetime, str] = {}
+
+    def date_text(dt: datetime | None) -> str:
+        if dt is None:
+            return ""
+        text = date_texts.get(dt)
+        if text is None:
+            text = date_texts[dt] = dt.strftime("%Y-%m-%d %H:%M:%S")
+        return text
+
     for g in groups:
-        group_number = int(getattr(g, "group_number", 0) or 0)
-        items_list = getattr(g, "items", []) or []
+        group_number = g.group_number
+        items_list = g.items
 
         # Col 0 at group row: "Group N" label
-        group_item = QStandardItem(t("tree.group_label", n=group_number))
-        group_item.setEditable(False)
+        group_item = _cell(t("tree.group_label", n=group_number))
 
         group_count_val = len(items_list)
         group_row = [
             group_item,                              # COL_GROUP      (0)
-            QStandardItem(""),                       # COL_ACTION     (1) — decision at file level
-            QStandardItem(""),                       # COL_SCORE      (2) — group level empty; sort role = max
-            QStandardItem(""),                       # COL_LOCK       (3) — lock at file level
-            QStandardItem(""),                       # COL_NAME       (4)
-            QStandardItem(""),                       # COL_FOLDER     (5)
-            QStandardItem(""),                       # COL_SIZE_BYTES (6)
-            QStandardItem(str(group_count_val)),     # COL_GROUP_COUNT (7)
-            QStandardItem(""),                       # COL_CREATION_DATE (8)
-            QStandardItem(""),                       # COL_SHOT_DATE  (9)
-            QStandardItem(""),                       # COL_RESOLUTION (10) — group level empty
+            _cell(),                                 # COL_ACTION     (1) — decision at file level
+            _cell(),                                 # COL_SCORE      (2) — group level empty; sort role = max
+            _cell(),                                 # COL_LOCK       (3) — lock at file level
+            _cell(),                                 # COL_NAME       (4)
+            _cell(),                                 # COL_FOLDER     (5)
+            _cell(),                                 # COL_SIZE_BYTES (6)
+            _cell(str(group_count_val)),             # COL_GROUP_COUNT (7)
+            _cell(),                                 # COL_CREATION_DATE (8)
+            _cell(),                                 # COL_SHOT_DATE  (9)
+            _cell(),                                 # COL_RESOLUTION (10) — group level empty
         ]
-        for it in group_row:
-            it.setEditable(False)
+
+        # Per-file sort columns, derived once per record and shared by the
+        # group aggregates below and the file-row loop — the dates via one
+        # timestamp conversion each. ``basename`` is a string split; a
+        # ``Path`` per record would parse every component just for the name.
+        names = [basename(it.file_path) for it in items_list]
+        creation_keys = [_sort_timestamp(it.creation_date) for it in items_list]
+        shot_keys = [_sort_timestamp(it.shot_date) for it in items_list]
+        megapixels = [(it.pixel_width or 0) * (it.pixel_height or 0) for it in items_list]
 
         # Group-level SORT_ROLE: aggregate across all files so that sorting a column
         # reorders groups by their "best" file's value (first file after in-group sort).
         # Min-priority wins for ranked fields (delete=1 < keep=2 < ""=3); max wins for size.
-        try:
-            group_row[COL_GROUP].setData(group_number, SORT_ROLE)
-        except Exception:
-            pass
-        try:
-            group_row[COL_ACTION].setData(
-                min((_DECISION_SORT.get(getattr(it, "user_decision", ""), 3)
-                     for it in items_list),
-                    default=3),
-                SORT_ROLE,
-            )
-        except Exception:
-            pass
-        try:
-            # Group-level Lock sort: max wins (any locked row makes the
-            # group "locked-tier") so groups containing a locked row
-            # sort together when the user clicks the Lock column header.
-            group_row[COL_LOCK].setData(
-                max(
-                    (1 if getattr(it, "is_locked", False) else 0
-                     for it in items_list),
-                    default=0,
-                ),
-                SORT_ROLE,
-            )
-        except Exception:
-            pass
-        try:
-            group_row[COL_NAME].setData(
-                min((Path(getattr(it, "file_path", "")).name.lower() for it in items_list),
-                    default=""),
-                SORT_ROLE,
-            )
-        except Exception:
-            pass
-        try:
-            group_row[COL_FOLDER].setData(
-                min((str(getattr(it, "folder_path", "")).lower() for it in items_list),
-                    default=""),
-                SORT_ROLE,
-            )
-        except Exception:
-            pass
-        try:
-            group_row[COL_SIZE_BYTES].setData(
-                max((int(getattr(it, "file_size_bytes", 0) or 0) for it in items_list),
-                    default=0),
-                SORT_ROLE,
-            )
-        except Exception:
-            pass
-        try:
-            group_row[COL_GROUP_COUNT].setData(int(group_count_val), SORT_ROLE)
-        except Exception:
-            pass
-        try:
-            cd_timestamps = [
-                int(cd.timestamp())
-                for it in items_list
-                if (cd := getattr(it, "creation_date", None)) is not None
-            ]
-            group_row[COL_CREATION_DATE].setData(min(cd_timestamps, default=0), SORT_ROLE)
-        except Exception:
-            pass
-        try:
-            sd_timestamps = [
-                int(sd.timestamp())
-                for it in items_list
-                if (sd := getattr(it, "shot_date", None)) is not None
-            ]
-            group_row[COL_SHOT_DATE].setData(min(sd_timestamps, default=0), SORT_ROLE)
-        except Exception:
-            pass
-        try:
-            megapixels = [
-                (getattr(it, "pixel_width", None) or 0) * (getattr(it, "pixel_height", None) or 0)
-                for it in items_list
-            ]
-            group_row[COL_RESOLUTION].setData(max(megapixels, default=0), SORT_ROLE)
-        except Exception:
-            pass
-        try:
-            # Group-level Score sort: max score across files in the group.
-            # Unscored rows (score is None) contribute the sentinel so a
-            # group containing only unscored rows sorts to the bottom under
-            # descending order, like its individual rows do.
-            file_scores = [
-                getattr(it, "score", None) for it in items_list
-            ]
-            real_scores = [s for s in file_scores if s is not None]
-            group_row[COL_SCORE].setData(
-                max(real_scores) if real_scores else _UNSCORED_SORT_VALUE,
-                SORT_ROLE,
-            )
-        except Exception:
-            pass
-
-        model.appendRow(group_row)
+        group_row[COL_GROUP].setData(group_number, SORT_ROLE)
+        group_row[COL_ACTION].setData(
+            min((_DECISION_SORT.get(it.user_decision, 3)
+                 for it in items_list),
+                default=3),
+            SORT_ROLE,
+        )
+        # Group-level Lock sort: max wins (any locked row makes the
+        # group "locked-tier") so groups containing a locked row
+        # sort together when the user clicks the Lock column header.
+        group_row[COL_LOCK].setData(
+            max(
+                (1 if it.is_locked else 0
+                 for it in items_list),
+                default=0,
+            ),
+            SORT_ROLE,
+        )
+        # Text keys keep their original case — the proxy compares them
+        # case-insensitively — so the min is picked the same way.
+        group_row[COL_NAME].setData(min(names, key=str.lower, default=""), SORT_ROLE)
+        group_row[COL_FOLDER].setData(
+            min((it.folder_path for it in items_list), key=str.lower, default=""), SORT_ROLE
+        )
+        group_row[COL_SIZE_BYTES].setData(
+            max((it.file_size_bytes for it in items_list),
+                default=0),
+            SORT_ROLE,
+        )
+        group_row[COL_GROUP_COUNT].setData(group_count_val, SORT_ROLE)
+        group_row[COL_CREATION_DATE].setData(
+            min((ts for ts in creation_keys if ts is not None), default=0), SORT_ROLE
+        )
+        group_row[COL_SHOT_DATE].setData(
+            min((ts for ts in shot_keys if ts is not None), default=0), SORT_ROLE
+        )
+        group_row[COL_RESOLUTION].setData(max(megapixels, default=0), SORT_ROLE)
+        # Group-level Score sort: max score across files in the group.
+        # Unscored rows (score is None) contribute the sentinel so a
+        # group containing only unscored rows sorts to the bottom under
+        # descending order, like its individual rows do.
+        real_scores = [it.score for it in items_list if it.score is not None]
+        group_row[COL_SCORE].setData(
+            max(real_scores) if real_scores else _UNSCORED_SORT_VALUE,
+            SORT_ROLE,
+        )
 
         # #241 — exactly one row per group earns the "Ref" label; the
         # rest of any Ref-tier rows render as "—". Compute the winner
@@ -413,28 +426,24 @@ def build_model(
         # scanner's anchor (which may differ when #241's score-aware
         # tie-break picks a different Ref-tier row).
         ref_winner = _pick_ref_winner(items_list)
-        ref_winner_phash = (
-            getattr(ref_winner, "phash", None) if ref_winner is not None else None
-        )
-
-        for p in items_list:
-            name = Path(getattr(p, "file_path", "")).name
-            folder = getattr(p, "folder_path", "")
-            size_num = int(getattr(p, "file_size_bytes", 0) or 0)
-            shot_dt = getattr(p, "shot_date", None)
-            creation_dt = getattr(p, "creation_date", None)
-            shot_txt = shot_dt.strftime("%Y-%m-%d %H:%M:%S") if shot_dt else ""
-            creation_txt = creation_dt.strftime("%Y-%m-%d %H:%M:%S") if creation_dt else ""
-            px_w = getattr(p, "pixel_width", None)
-            px_h = getattr(p, "pixel_height", None)
+        ref_winner_phash = ref_winner.phash if ref_winner is not None else None
+
+        for p, name, creation_key, shot_key, resolution_mp in zip(
+            items_list, names, creation_keys, shot_keys, megapixels, strict=True
+        ):
+            folder = p.folder_path
+            size_num = p.file_size_bytes
+            shot_txt = date_text(p.shot_date)
+            creation_txt = date_text(p.creation_date)
+            px_w = p.pixel_width
+            px_h = p.pixel_height
             resolution_txt = f"{px_w}×{px_h}" if px_w and px_h else ""
-            resolution_mp = (px_w or 0) * (px_h or 0)
-            score_val = getattr(p, "score", None)
+            score_val = p.score
             score_txt = _score_display(score_val)
 
             # Col 0 at file row: similarity % for duplicates, "Ref" for
             # the per-group winner, "—" for sibling Ref-tier rows (#241).
-            file_action = getattr(p, "action", "") or ""
+            file_action = p.action
             file_match = _file_similarity(
                 file_action,
                 p,
@@ -446,31 +455,29 @@ def build_model(
             # Lock state moved to its own COL_LOCK column in #182 so the
             # Action column stays sortable / searchable as just the
             # decision label — no 🔒 prefix.
-            item_decision = getattr(p, "user_decision", "") or ""
-            item_locked = bool(getattr(p, "is_locked", False))
+            item_decision = p.user_decision
+            item_locked = p.is_locked
+            decision_label = decision_labels.get(item_decision)
+            if decision_label is None:
+                decision_label = decision_labels[item_decision] = _action_display(item_decision)
 
             child_row = [
-                QStandardItem(file_match),                       # COL_GROUP      (0) — similarity
-                QStandardItem(_action_display(item_decision)),   # COL_ACTION     (1) — localized decision label
-                QStandardItem(score_txt),                        # COL_SCORE      (2)
-                QStandardItem(_lock_display(item_locked)),       # COL_LOCK       (3) — 🔒 glyph or empty
-                QStandardItem(name),                             # COL_NAME       (4)
-                QStandardItem(folder),                           # COL_FOLDER     (5)
-                QStandardItem(str(size_num)),        # COL_SIZE_BYTES (6)
-                QStandardItem(""),                   # COL_GROUP_COUNT (7) — group level only
-                QStandardItem(creation_txt),         # COL_CREATION_DATE (8)
-                QStandardItem(shot_txt),             # COL_SHOT_DATE  (9)
-                QStandardItem(resolution_txt),       # COL_RESOLUTION (10)
+                _cell(file_match),                   # COL_GROUP      (0) — similarity
+                _cell(decision_label),               # COL_ACTION     (1) — localized decision label
+                _cell(score_txt),                    # COL_SCORE      (2)
+                _cell(_lock_display(item_locked)),   # COL_LOCK       (3) — 🔒 glyph or empty
+                _cell(name),                         # COL_NAME       (4)
+                _cell(folder),                       # COL_FOLDER     (5)
+                _cell(str(size_num)),                # COL_SIZE_BYTES (6)
+                _cell(),                             # COL_GROUP_COUNT (7) — group level only
+                _cell(creation_txt),                 # COL_CREATION_DATE (8)
+                _cell(shot_txt),                     # COL_SHOT_DATE  (9)
+                _cell(resolution_txt),               # COL_RESOLUTION (10)
             ]
 
-            # Track Qt heap QStandardItem count for memory_probe (no-op when probe disabled).
-            try:
-                from scripts.memory_probe import track_qt_alloc, _ENABLED  # type: ignore[import]
-                if _ENABLED:
-                    for _it in child_row:
-                        track_qt_alloc("QStandardItem", _it)
-            except ImportError:
-                pass
+            if probe_enabled:
+                for _it in child_row:
+                    track_qt_alloc("QStandardItem", _it)
 
             # #536 Direction A — for a passenger row (the starred "N*%" cell,
             # i.e. a Ref-tier non-winner), set a tooltip naming the nearest
@@ -485,71 +492,38 @@ def build_model(
                         t(
                             "tree.similarity_passenger_tooltip",
                             pct=round((64 - near_h) / 64 * 100),
-                            name=Path(getattr(near_item, "file_path", "")).name,
+                            name=basename(near_item.file_path),
                         )
                     )
 
-            try:
-                child_row[COL_GROUP].setData(_ACTION_SORT.get(file_action, 1), SORT_ROLE)
-            except Exception:
-                pass
-            try:
-                child_row[COL_ACTION].setData(_DECISION_SORT.get(item_decision, 3), SORT_ROLE)
-            except Exception:
-                pass
-            try:
-                # Boolean sort key: 0=unlocked, 1=locked. Ascending puts
-                # unlocked first; descending puts locked first.
-                child_row[COL_LOCK].setData(1 if item_locked else 0, SORT_ROLE)
-            except Exception:
-                pass
-            try:
-                child_row[COL_NAME].setData(str(name).lower(), SORT_ROLE)
-            except Exception:
-                pass
-            try:
-                child_row[COL_FOLDER].setData(str(folder).lower(), SORT_ROLE)
-            except Exception:
-                pass
-            try:
-                child_row[COL_SIZE_BYTES].setData(int(size_num), SORT_ROLE)
-            except Exception:
-                pass
-            try:
-                child_row[COL_CREATION_DATE].setData(
-                    int(creation_dt.timestamp()) if creation_dt else 0, SORT_ROLE
-                )
-            except Exception:
-                pass
-            try:
-                child_row[COL_SHOT_DATE].setData(
-                    int(shot_dt.timestamp()) if shot_dt else 0, SORT_ROLE
-                )
-            except Exception:
-                pass
-            try:
-                child_row[COL_RESOLUTION].setData(resolution_mp, SORT_ROLE)
-            except Exception:
-                pass
-            try:
-                # Score sort: float when present, sentinel _UNSCORED_SORT_VALUE
-                # (-1.0) when None so unscored rows sort below real-score rows
-                # under descending order.
-                child_row[COL_SCORE].setData(
-                    float(score_val) if score_val is not None else _UNSCORED_SORT_VALUE,
-                    SORT_ROLE,
-                )
-            except Exception:
-                pass
-            try:
-                child_row[COL_NAME].setData(getattr(p, "file_path", ""), PATH_ROLE)
-            except Exception:
-                pass
-
-            for it in child_row:
-                it.setEditable(False)
+            child_row[COL_GROUP].setData(_ACTION_SORT.get(file_action, 1), SORT_ROLE)
+            child_row[COL_ACTION].setData(_DECISION_SORT.get(item_decision, 3), SORT_ROLE)
+            # Boolean sort key: 0=unlocked, 1=locked. Ascending puts
+            # unlocked first; descending puts locked first.
+            child_row[COL_LOCK].setData(1 if item_locked else 0, SORT_ROLE)
+            child_row[COL_NAME].setData(name, SORT_ROLE)
+            child_row[COL_FOLDER].setData(folder, SORT_ROLE)
+            child_row[COL_SIZE_BYTES].setData(size_num, SORT_ROLE)
+            child_row[COL_CREATION_DATE].setData(creation_key or 0, SORT_ROLE)
+            child_row[COL_SHOT_DATE].setData(shot_key or 0, SORT_ROLE)
+            child_row[COL_RESOLUTION].setData(resolution_mp, SORT_ROLE)
+            # Score sort: float when present, sentinel _UNSCORED_SORT_VALUE
+            # (-1.0) when None so unscored rows sort below real-score rows
+            # under descending order.
+            child_row[COL_SCORE].setData(
+                float(score_val) if score_val is not None else _UNSCORED_SORT_VALUE,
+                SORT_ROLE,
+            )
+            child_row[COL_NAME].setData(p.file_path, PATH_ROLE)
+
             group_item.appendRow(child_row)
 
+        # Attach the group only once its children are in place: appending
+        # to an item that has no model yet is plain list growth, while each
+        # append under a model-owned item runs a rowsAboutToBeInserted /
+        # rowsInserted round. One insert per group instead of one per file.
+        model.appendRow(group_row)
+
     # Install proxy for numeric/text sort with roles
     try:
         proxy = QSortFilterProxyModel()
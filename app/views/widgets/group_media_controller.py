@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QMetaObject, QObject, Qt, Signal
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QPushButton,
@@ -42,6 +42,14 @@ class GroupMediaController(QWidget):
         super().__init__(parent)
 
         self._players: list[VideoPlayerWidget] = []
+        # Connection handles per registered player: unregistering drops
+        # exactly these links, without a by-slot search per signal.
+        self._connections: dict[VideoPlayerWidget, list[QMetaObject.Connection]] = {}
+        # Last reported playing flag per player, and how many are set:
+        # a state change adjusts the count by the one transition instead
+        # of re-probing every player.
+        self._player_playing: dict[VideoPlayerWidget, bool] = {}
+        self._playing_count = 0
         self._master_duration = 0
         self._master_position = 0
         self._is_playing = False
@@ -111,17 +119,25 @@ class GroupMediaController(QWidget):
         """
         if player not in self._players:
             self._players.append(player)
-
-            # Connect to player's signals for UI updates
-            player.durationChanged.connect(self._on_player_duration_changed)
-            player.positionChanged.connect(self._on_player_position_changed)
-            player.stateChanged.connect(self._on_player_state_changed)
-
-            # Connect controller signals to player
-            self.playRequested.connect(player.play)
-            self.pauseRequested.connect(player.pause)
-            self.positionRequested.connect(player.set_position)
-            self.volumeRequested.connect(player.set_volume)
+            # A player can already be running when it is registered (a
+            # grid tile clicked before group autoplay registers it).
+            playing = bool(player.is_playing())
+            self._player_playing[player] = playing
+            if playing:
+                self._playing_count += 1
+            self._connections[player] = [
+                # Connect to player's signals for UI updates
+                player.durationChanged.connect(self._on_player_duration_changed),
+                player.positionChanged.connect(self._on_player_position_changed),
+                player.stateChanged.connect(
+                    lambda state, _p=player: self._on_player_state_changed(_p, state)
+                ),
+                # Connect controller signals to player
+                self.playRequested.connect(player.play),
+                self.pauseRequested.connect(player.pause),
+                self.positionRequested.connect(player.set_position),
+                self.volumeRequested.connect(player.set_volume),
+            ]
 
     def unregister_player(self, player: VideoPlayerWidget) -> None:
         """Unregister a video player.
@@ -131,21 +147,13 @@ class GroupMediaController(QWidget):
         """
         if player in self._players:
             self._players.remove(player)
+            if self._player_playing.pop(player, False):
+                self._playing_count -= 1
 
-            # Disconnect signals
-            for fn in (
-                lambda: player.durationChanged.disconnect(self._on_player_duration_changed),
-                lambda: player.positionChanged.disconnect(self._on_player_position_changed),
-                lambda: player.stateChanged.disconnect(self._on_player_state_changed),
-                lambda: self.playRequested.disconnect(player.play),
-                lambda: self.pauseRequested.disconnect(player.pause),
-                lambda: self.positionRequested.disconnect(player.set_position),
-                lambda: self.volumeRequested.disconnect(player.set_volume),
-            ):
-                try:
-                    fn()
-                except (TypeError, RuntimeError):
-                    pass
+            # Disconnect by handle: a link already broken (the player's
+            # C++ side deleted first) just reports False rather than raising.
+            for conn in self._connections.pop(player, ()):
+                QObject.disconnect(conn)
 
     def _toggle_playback(self) -> None:
         """Toggle play/pause for all registered players."""
@@ -195,11 +203,14 @@ class GroupMediaController(QWidget):
             self._progress_slider.setValue(position)
             self._update_current_time(position)
 
-    def _on_player_state_changed(self, state: Any) -> None:
+    def _on_player_state_changed(self, player: VideoPlayerWidget, state: Any) -> None:
         """Handle state change from a player."""
+        playing = player.is_playing()
+        if playing != self._player_playing.get(player, False):
+            self._player_playing[player] = playing
+            self._playing_count += 1 if playing else -1
         # Update master playing state based on majority
-        playing_count = sum(1 for p in self._players if p.is_playing())
-        self._is_playing = is_majority_playing(playing_count, len(self._players))
+        self._is_playing = is_majority_playing(self._playing_count, len(self._players))
         self._update_play_button()
 
     def _update_play_button(self) -> None:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QUrl, Signal
+from PySide6.QtCore import Qt, QTimer, QUrl, Signal
 from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
 from PySide6.QtMultimediaWidgets import QVideoWidget
 from PySide6.QtWidgets import (
@@ -26,6 +26,11 @@ from app.views.widgets.video_player_helpers import (
 )
 from infrastructure.i18n import t
 
+#: While playing, ``positionChanged`` is re-emitted at most this often;
+#: the media backend ticks several times faster, and every tick fans out
+#: to the group controller's slider and label.
+_POSITION_EMIT_INTERVAL_MS = 100
+
 
 class VideoPlayerWidget(QWidget):
     """Video player widget with play/pause, volume, and progress controls.
@@ -45,6 +50,12 @@ class VideoPlayerWidget(QWidget):
         self._duration = 0
         self._last_position = 0
         self._slider_dragging = False
+        self._pending_position: int | None = None
+
+        # Coalesces positionChanged during playback (see _on_position_changed)
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setInterval(_POSITION_EMIT_INTERVAL_MS)
+        self._emit_timer.timeout.connect(self._flush_position)
 
         # Setup media player
         self._media_player = QMediaPlayer(self)
@@ -214,14 +225,36 @@ class VideoPlayerWidget(QWidget):
     def _on_position_changed(self, position: int) -> None:
         """Handle position change."""
         if not self._slider_dragging:
-            self._progress_slider.setValue(position)
+            # Programmatic move: valueChanged only matters during a user
+            # drag, so keep the per-tick update out of Qt's slot dispatch.
+            blocked = self._progress_slider.blockSignals(True)
+            try:
+                self._progress_slider.setValue(position)
+            finally:
+                self._progress_slider.blockSignals(blocked)
             self._update_current_time(position)
         self._last_position = position
-        self.positionChanged.emit(position)
+        # While playing, the timer emits the latest position; a seek while
+        # paused still goes out at once.
+        if self._emit_timer.isActive():
+            self._pending_position = position
+        else:
+            self.positionChanged.emit(position)
+
+    def _flush_position(self) -> None:
+        """Emit the latest position held back since the last flush."""
+        if self._pending_position is not None:
+            position, self._pending_position = self._pending_position, None
+            self.positionChanged.emit(position)
 
     def _on_state_changed(self, state: QMediaPlayer.PlaybackState) -> None:
         """Handle playback state change."""
         self._update_play_button()
+        if state == QMediaPlayer.PlaybackState.PlayingState:
+            self._emit_timer.start()
+        else:
+            self._emit_timer.stop()
+            self._flush_position()
         self.stateChanged.emit(state)
 
     def _update_current_time(self, position: int) -> None:
@@ -252,7 +285,13 @@ class VideoPlayerWidget(QWidget):
     def set_volume(self, volume: float) -> None:
         """Set volume (0.0 to 1.0)."""
         self._audio_output.setVolume(volume)
-        self._volume_slider.setValue(volume_float_to_slider_int(volume))
+        # Blocked so _on_volume_changed doesn't set the audio a second
+        # time from the slider's rounded integer value.
+        blocked = self._volume_slider.blockSignals(True)
+        try:
+            self._volume_slider.setValue(volume_float_to_slider_int(volume))
+        finally:
+            self._volume_slider.blockSignals(blocked)
 
     def get_position(self) -> int:
         """Get current position in milliseconds."""
@@ -6,10 +6,10 @@ and results used across the infrastructure and UI layers.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteResult:
     """Outcome of a delete operation.
 
@@ -24,7 +24,7 @@ class DeleteResult:
     log_path: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeletePlanGroupSummary:
     """Summary of delete intent for a single group.
 
@@ -41,14 +41,17 @@ class DeletePlanGroupSummary:
     is_full_delete: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeletePlan:
     """Planned delete operation with per-group summaries.
 
     Attributes:
         delete_paths: Paths chosen for deletion (already filtered to skip locked).
         group_summaries: Group-level summaries for confirmation UI.
+        path_to_group: Group number of each selected path, recorded by
+            ``plan_delete`` so the audit log needs no second record walk.
     """
 
     delete_paths: list[str]
     group_summaries: list[DeletePlanGroupSummary]
+    path_to_group: dict[str, int] = field(default_factory=dict)
@@ -6,12 +6,45 @@ per-key ascending/descending ordering without mutating original values.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from operator import attrgetter
 from typing import Any
 
 from core.models import PhotoGroup, PhotoRecord
 
 
+def _field_sort_key(field_name: str, sample: Any, has_none: bool) -> Callable[[PhotoRecord], Any]:
+    """Sort key for one field, given a non-None ``sample`` value (``None``
+    when every value is ``None``) and whether any record holds ``None``.
+
+    Without ``None`` values the key is a plain C-level ``attrgetter``.
+    Otherwise ``None`` substitutes the type-appropriate zero — numeric →
+    0, string → "" — so a field with mixed None and non-None values (e.g.
+    ``score`` on Live Photo MOV passengers + scored rows in the same
+    group) sorts without the float-vs-None TypeError. See #187 PR 5.
+    Other types (dates) sort ``None`` first, as the empty string did.
+    """
+    if not has_none:
+        return attrgetter(field_name)
+    if sample is None or isinstance(sample, (int, float)):
+        fill: Any = 0
+    elif isinstance(sample, str):
+        fill = ""
+    else:
+
+        def _none_first(item: PhotoRecord) -> tuple[bool, Any]:
+            value = getattr(item, field_name, None)
+            return (value is not None, value)
+
+        return _none_first
+
+    def _filled(item: PhotoRecord) -> Any:
+        value = getattr(item, field_name, None)
+        return fill if value is None else value
+
+    return _filled
+
+
 class SortService:
     """Provides sorting utilities for `PhotoGroup` lists."""
 
@@ -28,45 +61,31 @@ class SortService:
 
         # Make ``groups`` materialisable: callers pass a list, but the
         # ``Iterable`` annotation allows generators which we'd otherwise
-        # exhaust during type detection and have nothing left to sort.
+        # exhaust during field detection and have nothing left to sort.
         groups_list = list(groups)
 
-        # Detect each sort field's type from the first non-None value seen
-        # across all items. None values are then substituted with the
-        # type-appropriate zero (numeric → 0, string → "") so a field with
-        # mixed None and non-None values (e.g. ``score`` on Live Photo
-        # MOV passengers + scored rows in the same group) sorts without
-        # the float-vs-tuple TypeError that the previous implementation
-        # produced. See #187 PR 5.
-        field_is_numeric: dict[str, bool] = {}
-        for field_name, _ in sort_keys:
+        # One key function per field, chosen from the first non-None value
+        # across all items and whether any item holds None (see
+        # _field_sort_key).
+        keys: list[tuple[Callable[[PhotoRecord], Any], bool]] = []
+        for field_name, ascending in sort_keys:
+            sample: Any = None
+            has_none = False
             for group in groups_list:
                 for item in group.items:
                     v = getattr(item, field_name, None)
-                    if v is not None:
-                        field_is_numeric[field_name] = isinstance(v, (int, float))
-                        break
-                if field_name in field_is_numeric:
-                    break
-            # All values None for this field → treat as numeric (0
-            # default keeps the sort deterministic).
-            field_is_numeric.setdefault(field_name, True)
+                    if v is None:
+                        has_none = True
+                    elif sample is None:
+                        sample = v
+            keys.append((_field_sort_key(field_name, sample, has_none), ascending))
 
+        # Timsort is stable: sorting by the least significant key first,
+        # then by each more significant one, yields the multi-key order —
+        # with ``reverse`` giving each key its own direction (for strings
+        # too) and no decorated tuple per record.
         for group in groups_list:
-            # Build a decorated list with adjusted values for per-key order
-            decorated: list[tuple[tuple[Any, ...], PhotoRecord]] = []
-            for item in group.items:
-                row: list[Any] = []
-                for field_name, ascending in sort_keys:
-                    value = getattr(item, field_name, None)
-                    if value is None:
-                        value = 0 if field_is_numeric[field_name] else ""
-                    if isinstance(value, (int, float)):
-                        row.append(value if ascending else -value)
-                    else:
-                        # For strings/others, embed a leading flag to control order
-                        row.append((0, str(value)) if ascending else (1, str(value)))
-                decorated.append((tuple(row), item))
-
-            decorated.sort(key=lambda x: x[0])
-            group.items = [it for _, it in decorated]
+            items = list(group.items)
+            for key, ascending in reversed(keys):
+                items.sort(key=key, reverse=not ascending)
+            group.items = items
@@ -7,8 +7,9 @@ an audit CSV log.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
 import os
+from typing import TypeVar
 
 from loguru import logger
 from send2trash import send2trash
@@ -17,9 +18,59 @@ from core.models import PhotoGroup
 from core.services.interfaces import DeletePlan, DeletePlanGroupSummary, DeleteResult
 from infrastructure.logging import write_delete_log
 
+# Files handed to send2trash per call. A Windows shell operation has a
+# fixed per-call cost, so batching amortises it; the cap bounds how much
+# work a failed batch sends back to the one-by-one slow path.
+_RECYCLE_BATCH_SIZE = 500
+
+_T = TypeVar("_T")
+
+
+def recycle_in_batches(
+    items: Sequence[_T],
+    path_of: Callable[[_T], str],
+    batch_trash: Callable[[list[str]], object],
+    trash_one: Callable[[_T], None],
+    on_trashed: Callable[[_T], None],
+) -> None:
+    """Trash ``items`` in chunks of ``_RECYCLE_BATCH_SIZE``.
+
+    Each chunk's paths (``path_of``) go to one ``batch_trash`` call and
+    every item is reported through ``on_trashed``. A lone item, or every
+    item still on disk after a failed batch call, goes to ``trash_one``,
+    which records its own outcome; items the failed batch had already
+    moved count as trashed. Callers pass only paths that exist.
+    """
+    for start in range(0, len(items), _RECYCLE_BATCH_SIZE):
+        chunk = items[start : start + _RECYCLE_BATCH_SIZE]
+        if len(chunk) == 1:
+            trash_one(chunk[0])
+            continue
+        try:
+            batch_trash([path_of(item) for item in chunk])
+        except (UnicodeEncodeError, OSError, RuntimeError) as ex:
+            logger.warning(
+                "Batch recycle of {} files failed, retrying one by one: {}",
+                len(chunk),
+                ex,
+            )
+            for item in chunk:
+                if os.path.exists(path_of(item)):
+                    trash_one(item)
+                else:
+                    # Already moved by the batch call before it failed.
+                    on_trashed(item)
+            continue
+        for item in chunk:
+            on_trashed(item)
+
 
 class DeleteService:
-    """Coordinates delete operations and audit logging."""
+    """Coordinates delete operations and audit logging.
+
+    The Execute Action dialog does not go through this service; it
+    trashes files itself in ``ExecuteActionDialog._delete_files``.
+    """
 
     def __init__(self) -> None:
         self._handle_releaser: Callable[[], None] | None = None
@@ -42,20 +93,49 @@ class DeleteService:
         filtered locked paths at line 50; the silent filter was the
         very asymmetry #182 retires.)
         """
+        if not selected_paths:
+            # Cleared selection: every group is 0-of-N, so skip the
+            # per-record membership scan entirely.
+            return DeletePlan(
+                delete_paths=[],
+                group_summaries=[
+                    DeletePlanGroupSummary(
+                        group_number=g.group_number,
+                        selected_count=0,
+                        total_count=len(g.items),
+                        is_full_delete=False,
+                    )
+                    for g in groups
+                ],
+            )
+
         selected_set = set(selected_paths)
-        per_group_selected: dict[int, int] = {}
-        per_group_total: dict[int, int] = {}
+        summaries: list[DeletePlanGroupSummary] = []
+        path_to_group: dict[str, int] = {}
         leaked_locked: list[str] = []
+        # Single pass: each group's summary is complete once its items
+        # are counted, so it is emitted right away.
         for g in groups:
-            per_group_total[g.group_number] = len(g.items)
+            tot = len(g.items)
             sel_count = 0
             for r in g.items:
                 if r.file_path in selected_set:
                     sel_count += 1
+                    path_to_group[r.file_path] = g.group_number
                     if r.is_locked:
                         leaked_locked.append(r.file_path)
-            per_group_selected[g.group_number] = sel_count
+            summaries.append(
+                DeletePlanGroupSummary(
+                    group_number=g.group_number,
+                    selected_count=sel_count,
+                    total_count=tot,
+                    is_full_delete=(tot > 0 and sel_count == tot),
+                )
+            )
 
+        # The usual case has no leaked locks: copy the selection as-is
+        # rather than set-testing every selected path against nothing.
+        delete_paths: list[str] = list(selected_paths)
         if leaked_locked:
             logger.warning(
                 "plan_delete: {} locked path(s) reached the planner "
@@ -64,28 +144,23 @@ class DeleteService:
                 len(leaked_locked),
                 leaked_locked[:3],
             )
-        leaked_set = set(leaked_locked)
-        delete_paths: list[str] = [
-            p for p in selected_paths if p not in leaked_set
-        ]
+            leaked_set = frozenset(leaked_locked)
+            delete_paths = [p for p in delete_paths if p not in leaked_set]
 
-        summaries: list[DeletePlanGroupSummary] = []
-        for g in groups:
-            sel = per_group_selected.get(g.group_number, 0)
-            tot = per_group_total.get(g.group_number, 0)
-            summaries.append(
-                DeletePlanGroupSummary(
-                    group_number=g.group_number,
-                    selected_count=sel,
-                    total_count=tot,
-                    is_full_delete=(tot > 0 and sel == tot),
-                )
-            )
-
-        return DeletePlan(delete_paths=delete_paths, group_summaries=summaries)
+        return DeletePlan(
+            delete_paths=delete_paths,
+            group_summaries=summaries,
+            path_to_group=path_to_group,
+        )
 
     def delete_to_recycle(self, paths: list[str]) -> DeleteResult:
-        """Send files to recycle bin and report per-path results."""
+        """Send files to recycle bin and report per-path results.
+
+        Existing files go to ``send2trash`` in chunks of
+        ``_RECYCLE_BATCH_SIZE`` through :func:`recycle_in_batches`; a chunk
+        whose batch call fails is retried file by file through
+        :meth:`_recycle_one`.
+        """
         # Release any UI-held file handles (e.g., preview/video) before deleting
         try:
             if self._handle_releaser is not None:
@@ -96,65 +171,64 @@ class DeleteService:
 
         success: list[str] = []
         failed: list[tuple[str, str]] = []
+        pending: list[tuple[str, str]] = []
         for p in paths:
-            try:
-                # Normalize and validate path
-                normalized_path = os.path.normpath(p)
-
-                # Check if file exists and is accessible
-                if not os.path.exists(normalized_path):
-                    logger.error("File does not exist: {}", normalized_path)
-                    failed.append((p, "File does not exist"))
-                    continue
-
-                # Try different approaches for non-ASCII paths
-                # Method 1: Try with normalized path
-                try:
-                    send2trash(normalized_path)
-                    success.append(p)
-                except (UnicodeEncodeError, OSError) as ex:
-                    logger.warning(
-                        "Failed to delete with normalized path {}: {}", normalized_path, ex
-                    )
-                    # Method 2: Try with original path
-                    try:
-                        send2trash(p)
-                        success.append(p)
-                    except (UnicodeEncodeError, OSError) as ex2:
-                        logger.warning("Failed to delete with original path {}: {}", p, ex2)
-                        # Method 3: Try with absolute path
-                        try:
-                            abs_path = os.path.abspath(p)
-                            send2trash(abs_path)
-                            success.append(p)
-                        except (UnicodeEncodeError, OSError) as ex3:
-                            logger.error(
-                                "All delete methods failed for {}: {} / {} / {}",
-                                p,
-                                ex,
-                                ex2,
-                                ex3,
-                            )
-                            failed.append(
-                                (
-                                    p,
-                                    f"Multiple delete failures: {str(ex)}, {str(ex2)}, {str(ex3)}",
-                                )
-                            )
-                    except RuntimeError as ex2:
-                        logger.error("Unexpected error with original path {}: {}", p, ex2)
-                        failed.append((p, f"Unexpected error: {str(ex2)}"))
-                except RuntimeError as ex:
-                    logger.error(
-                        "Unexpected error with normalized path {}: {}", normalized_path, ex
-                    )
-                    failed.append((p, f"Unexpected error: {str(ex)}"))
+            # Normalize and validate path
+            normalized_path = os.path.normpath(p)
+            if not os.path.exists(normalized_path):
+                logger.error("File does not exist: {}", normalized_path)
+                failed.append((p, "File does not exist"))
+                continue
+            pending.append((p, normalized_path))
+
+        def _trash_one(item: tuple[str, str]) -> None:
+            p, normalized_path = item
+            reason = self._recycle_one(p, normalized_path)
+            if reason is None:
+                success.append(p)
+            else:
+                failed.append((p, reason))
 
-            except (UnicodeEncodeError, OSError, RuntimeError) as ex:
-                logger.error("Unexpected error deleting {}: {}", p, ex)
-                failed.append((p, f"Unexpected error: {str(ex)}"))
+        recycle_in_batches(
+            pending,
+            path_of=lambda item: item[1],
+            batch_trash=send2trash,
+            trash_one=_trash_one,
+            on_trashed=lambda item: success.append(item[0]),
+        )
+        logger.info("delete_to_recycle: {} ok, {} failed", len(success), len(failed))
         return DeleteResult(success_paths=success, failed=failed)
 
+    @staticmethod
+    def _recycle_one(p: str, normalized_path: str) -> str | None:
+        """Send one file to the recycle bin; return the failure reason or None.
+
+        Tries the normalized, original and absolute spellings in turn — the
+        slow path for non-ASCII names that a batch call rejected. Spellings
+        identical to one already tried are skipped: for the usual absolute,
+        already-normalized manifest path that is a single attempt instead
+        of three identical failing shell operations.
+        """
+        errors: list[Exception] = []
+        for candidate in dict.fromkeys((normalized_path, p, os.path.abspath(p))):
+            try:
+                send2trash(candidate)
+                return None
+            except (UnicodeEncodeError, OSError) as ex:
+                # Recoverable while another spelling remains; the outcome is
+                # logged once below if every spelling fails.
+                logger.debug("Failed to delete with path {}: {}", candidate, ex)
+                errors.append(ex)
+            except RuntimeError as ex:
+                logger.error("Unexpected error with path {}: {}", candidate, ex)
+                return f"Unexpected error: {str(ex)}"
+        logger.error(
+            "All delete methods failed for {}: {}", p, " / ".join(str(ex) for ex in errors)
+        )
+        if len(errors) == 1:
+            return f"Delete failed: {str(errors[0])}"
+        return "Multiple delete failures: " + ", ".join(str(ex) for ex in errors)
+
     def execute_delete(
         self, groups: Iterable[PhotoGroup], plan: DeletePlan, log_dir: str | None = None
     ) -> DeleteResult:
@@ -167,13 +241,20 @@ class DeleteService:
                 `%LOCALAPPDATA%/PhotoManager/delete_logs`.
         """
         result = self.delete_to_recycle(plan.delete_paths)
-        # Build path -> group mapping, then delegate to the shared audit
-        # writer so this path and the Execute Action dialog (#505) emit
-        # one consistent delete_<ts>.csv format.
-        path_to_group: dict[str, int] = {}
-        for g in groups:
-            for r in g.items:
-                path_to_group[r.file_path] = g.group_number
+        # Map path -> group, then delegate to the shared audit writer so
+        # this path and the Execute Action dialog (#505) emit one
+        # consistent delete_<ts>.csv format. plan_delete already recorded
+        # the mapping; a hand-built plan maps only the paths touched here.
+        path_to_group = plan.path_to_group
+        if not path_to_group:
+            touched = set(result.success_paths)
+            touched.update(p for p, _reason in result.failed)
+            path_to_group = {
+                r.file_path: g.group_number
+                for g in groups
+                for r in g.items
+                if r.file_path in touched
+            }
         rows: list[tuple[int, str, bool, str]] = [
             (path_to_group.get(p, 0), p, True, "") for p in result.success_paths
         ]
@@ -6,10 +6,9 @@ fallback via ctypes for robust HEIC handling on Windows.
 
 from __future__ import annotations
 
-from collections import OrderedDict
 import ctypes
 from ctypes import wintypes
-from dataclasses import dataclass
+from functools import lru_cache
 import hashlib
 import os
 import threading
@@ -18,7 +17,7 @@ from typing import Any
 import uuid
 
 from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QColor, QImage, QImageReader
+from PySide6.QtGui import QColor, QImage, QImageReader, QTransform
 from loguru import logger
 
 # Optional Pillow and HEIF support (top-level to satisfy linting)
@@ -32,12 +31,13 @@ except ImportError:  # pragma: no cover - optional dependency
     ImageOps = None  # type: ignore
 
 try:  # pragma: no cover - optional dependency
-    from pillow_heif import register_heif_opener  # type: ignore
+    from pillow_heif import open_heif, register_heif_opener  # type: ignore
 
     register_heif_opener()
     PIL_HEIF_AVAILABLE = True
 except ImportError:  # pragma: no cover - optional dependency
     PIL_HEIF_AVAILABLE = False
+    open_heif = None  # type: ignore
 
 try:  # pragma: no cover - optional dependency
     import rawpy  # type: ignore
@@ -49,6 +49,23 @@ except ImportError:  # pragma: no cover - optional dependency
     LibRawNoThumbnailError = Exception  # type: ignore
 
 
+# libheif decoded-buffer modes that map onto a QImage format without conversion.
+_HEIF_QIMAGE_FORMATS = {
+    "RGB": QImage.Format_RGB888,
+    "RGBA": QImage.Format_RGBA8888,
+}
+
+# EXIF Orientation → (mirror horizontally first, then rotate clockwise by).
+_EXIF_ORIENTATION_TRANSFORMS = {
+    2: (True, 0),
+    3: (False, 180),
+    4: (True, 180),
+    5: (True, 270),
+    6: (False, 90),
+    7: (True, 90),
+    8: (False, 270),
+}
+
 # Recipe version — bump to invalidate the disk cache namespace.
 PREVIEW_RECIPE_VERSION = "1"
 
@@ -59,6 +76,13 @@ _THUMB_SIDE_THRESHOLD = 256
 _THUMB_CACHE_DEFAULT_BYTES = 64 * 1024 * 1024   # 64 MB
 _PREVIEW_CACHE_DEFAULT_BYTES = 192 * 1024 * 1024  # 192 MB
 
+# Once the thumb tier is full, a new key must be put this many times before
+# it may evict anything (1 = plain LRU). Override: "thumbnail_cache_admit_after".
+_THUMB_ADMIT_AFTER_DEFAULT = 2
+
+# Keys remembered by the admission filter before their counts are halved.
+_ADMISSION_HISTORY_LIMIT = 4096
+
 
 def _probe_total_ram() -> int | None:
     """Return total physical RAM in bytes, or None on any failure.
@@ -125,70 +149,110 @@ def _compute_cache_budgets() -> tuple[int, int]:
     return thumb, preview
 
 
+@lru_cache(maxsize=8192)
 def _compute_cache_key(path: str, size_key: int) -> str:
-    """Compute a stable cache key from path and requested side."""
+    """Compute a stable cache key from path and requested side.
+
+    Memoised: the key depends only on its arguments, and scrolling the
+    grid asks for the same (path, side) pairs over and over. SHA-1 stays
+    so existing disk-cache file names remain valid.
+    """
     sig = f"{path}|{int(size_key)}".encode("utf-8", errors="ignore")
     return hashlib.sha1(sig).hexdigest()
 
 
+def _apply_exif_orientation(qimg: QImage, orientation: int) -> QImage:
+    """Return `qimg` turned upright for an EXIF Orientation value.
+
+    Matches `ImageOps.exif_transpose`, but runs on the already-downscaled
+    `QImage` instead of copying the full-resolution Pillow frame. Mirror
+    and rotation are applied as two plain transforms: a combined matrix
+    is not recognised as a 90° turn and Qt would repaint it into ARGB32.
+    """
+    mirror, degrees = _EXIF_ORIENTATION_TRANSFORMS.get(orientation, (False, 0))
+    if mirror:
+        qimg = qimg.transformed(QTransform().scale(-1, 1))
+    if degrees:
+        qimg = qimg.transformed(QTransform().rotate(degrees))
+    return qimg
+
+
 def _ensure_dir(p: Path) -> None:
     """Create directory `p` if missing (including parents)."""
     p.mkdir(parents=True, exist_ok=True)
 
 
-@dataclass
-class _MemCacheItem:
-    key: str
-    image: QImage
-    byte_size: int
-
-
 class _ByteBudgetLRUCache:
     """LRU cache with a byte-budget capacity instead of item-count capacity.
 
     Evicts the LRU entry whenever the total byte sum would exceed the budget.
 
+    Entries live in a plain dict of ``(image, byte_size)`` tuples: dict
+    insertion order is the recency order, so a hit pops and re-inserts
+    its key and eviction takes the first key.
+
+    With ``admit_after`` > 1 the cache also filters admission: once the
+    budget is full, a key not yet cached must be put that many times
+    before it may evict anything. A one-pass scroll through a large
+    folder then stops flushing thumbnails the user keeps coming back to.
+    Rejected images are still returned by the caller, just not retained.
+
     Thread-safe. ``_ImageTask`` (``app/views/image_tasks.py``) calls
     ``get``/``put`` from QThreadPool workers; ``clear()`` runs on the
-    main thread on manifest unload. Without the lock the OrderedDict
-    mutation in any of the three would race the others (#616).
+    main thread on manifest unload. Without the lock the dict mutation
+    in any of the three would race the others (#616).
     """
 
-    def __init__(self, budget_bytes: int) -> None:
+    def __init__(self, budget_bytes: int, admit_after: int = 1) -> None:
         self._budget = max(1, int(budget_bytes))
-        self._data: OrderedDict[str, _MemCacheItem] = OrderedDict()
+        self._admit_after = max(1, int(admit_after))
+        self._data: dict[str, tuple[QImage, int]] = {}
+        self._seen: dict[str, int] = {}
         self._total_bytes: int = 0
         self._lock = threading.Lock()
 
     def get(self, key: str) -> QImage | None:
         with self._lock:
-            item = self._data.get(key)
-            if not item:
+            entry = self._data.pop(key, None)
+            if entry is None:
                 return None
-            self._data.move_to_end(key)
-            return item.image
+            self._data[key] = entry
+            return entry[0]
 
     def put(self, key: str, image: QImage) -> None:
         byte_size = image.sizeInBytes() if not image.isNull() else 1
         with self._lock:
-            if key in self._data:
-                old = self._data[key]
-                self._total_bytes -= old.byte_size
-                self._data.move_to_end(key)
-                self._data[key] = _MemCacheItem(key, image, byte_size)
-                self._total_bytes += byte_size
-            else:
-                self._data[key] = _MemCacheItem(key, image, byte_size)
-                self._total_bytes += byte_size
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old[1]
+            elif self._total_bytes + byte_size > self._budget and not self._admit(key):
+                return
+            self._data[key] = (image, byte_size)
+            self._total_bytes += byte_size
             # Evict LRU until within budget
             while self._total_bytes > self._budget and len(self._data) > 1:
-                _, evicted = self._data.popitem(last=False)
-                self._total_bytes -= evicted.byte_size
+                _, evicted_size = self._data.pop(next(iter(self._data)))
+                self._total_bytes -= evicted_size
+
+    def _admit(self, key: str) -> bool:
+        """Record a put of uncached `key`; True once it may evict. Caller holds the lock."""
+        if self._admit_after <= 1:
+            return True
+        count = self._seen.get(key, 0) + 1
+        if count >= self._admit_after:
+            self._seen.pop(key, None)
+            return True
+        self._seen[key] = count
+        if len(self._seen) > _ADMISSION_HISTORY_LIMIT:
+            # Age the history so keys from an old scroll stop counting.
+            self._seen = {k: c // 2 for k, c in self._seen.items() if c // 2}
+        return False
 
     def clear(self) -> None:
         """Evict all entries and reset the byte counter (#616)."""
         with self._lock:
             self._data.clear()
+            self._seen.clear()
             self._total_bytes = 0
 
     @property
@@ -226,7 +290,12 @@ class ImageService:
 
         # Byte-budget caches
         thumb_bytes, preview_bytes = _compute_cache_budgets()
-        self._thumb_cache = _ByteBudgetLRUCache(thumb_bytes)
+        admit_after = _THUMB_ADMIT_AFTER_DEFAULT
+        if settings is not None:
+            raw_admit = settings.get("thumbnail_cache_admit_after", admit_after)
+            if isinstance(raw_admit, int) and not isinstance(raw_admit, bool):
+                admit_after = raw_admit
+        self._thumb_cache = _ByteBudgetLRUCache(thumb_bytes, admit_after=admit_after)
         self._preview_cache = _ByteBudgetLRUCache(preview_bytes)
 
         # Optional: Pillow / pillow-heif
@@ -345,18 +414,19 @@ class ImageService:
         if img is not None and not img.isNull():
             return img
 
+        # Decode directly: a missing file just yields a null QImage, so an
+        # exists() probe would only add a stat to every disk-cache hit.
         disk_file = self._versioned_disk_path / f"{key}.jpg"
-        if disk_file.exists():
-            img = QImage(str(disk_file))
-            if not img.isNull():
-                if self._looks_like_placeholder(img):
-                    try:
-                        disk_file.unlink()
-                    except OSError:
-                        pass
-                else:
-                    cache.put(key, img)
-                    return img
+        img = QImage(str(disk_file))
+        if not img.isNull():
+            if self._looks_like_placeholder(img):
+                try:
+                    disk_file.unlink()
+                except OSError:
+                    pass
+            else:
+                cache.put(key, img)
+                return img
 
         # Load from source
         img = self._load_from_source(path, requested_side)
@@ -389,7 +459,9 @@ class ImageService:
         ext = Path(path).suffix.lower()
         # 0) Prefer Pillow-HEIF for HEIC/HEIF when available
         if ext in {".heic", ".heif"} and self._pillow_available and self._pillow_heif_available:
-            img = self._load_via_pillow(path, requested_side)
+            img = self._load_via_heif(path, requested_side)
+            if img is None or img.isNull():
+                img = self._load_via_pillow(path, requested_side)
             if img is not None and not img.isNull():
                 return img
             try:
@@ -424,7 +496,11 @@ class ImageService:
                         reader.setScaledSize(QSize(nw, nh))
                 img = reader.read()
                 if img is not None and not img.isNull():
-                    if requested_side and requested_side > 0:
+                    # setScaledSize already decoded a large source at the
+                    # requested side; only smaller (or unsized) ones rescale.
+                    if requested_side and requested_side > 0 and (
+                        max(img.width(), img.height()) != requested_side
+                    ):
                         img = img.scaled(
                             requested_side,
                             requested_side,
@@ -458,7 +534,11 @@ class ImageService:
                     reader.setScaledSize(QSize(nw, nh))
             img = reader.read()
             if img is not None and not img.isNull():
-                if requested_side and requested_side > 0:
+                # setScaledSize already decoded a large source at the
+                # requested side; only smaller (or unsized) ones rescale.
+                if requested_side and requested_side > 0 and (
+                    max(img.width(), img.height()) != requested_side
+                ):
                     img = img.scaled(
                         requested_side, requested_side, Qt.KeepAspectRatio, Qt.SmoothTransformation
                     )
@@ -473,22 +553,81 @@ class ImageService:
             logger.debug("Shell/WIC thumbnail failed for {}: {}", path, ex)
             return None
 
+    def _load_via_heif(self, path: str, requested_side: int) -> QImage | None:
+        """Decode HEIC/HEIF with libheif straight into a `QImage`.
+
+        The decoded buffer is wrapped as-is (libheif has already applied the
+        irot/imir orientation transforms), so there is no PIL image or
+        `tobytes()` copy in between; a single `copy()` or `scaled()` detaches
+        the result. Returns None for modes Qt cannot wrap directly so the
+        caller can fall back to Pillow.
+
+        When a side is requested and the file embeds a thumbnail at least that
+        large, only the thumbnail is decoded; the full-resolution HEVC frame
+        is never touched.
+        """
+        if not self._pillow_heif_available or open_heif is None:
+            return None
+        try:
+            heif = open_heif(path, convert_hdr_to_8bit=True)
+            source = self._heif_thumbnail_for_side(heif, requested_side) or heif
+            fmt = _HEIF_QIMAGE_FORMATS.get(source.mode)
+            if fmt is None:
+                return None
+            width, height = source.size
+            data = source.data
+            qimg = QImage(data, width, height, source.stride, fmt)
+            if qimg.isNull():
+                return None
+            if requested_side and requested_side > 0 and max(width, height) > requested_side:
+                return qimg.scaled(
+                    requested_side, requested_side, Qt.KeepAspectRatio, Qt.SmoothTransformation
+                )
+            return qimg.copy()
+        except (OSError, ValueError, RuntimeError) as ex:
+            logger.debug("libheif load failed for {}: {}", path, ex)
+            return None
+
+    @staticmethod
+    def _heif_thumbnail_for_side(heif: Any, requested_side: int) -> Any | None:
+        """Return the smallest embedded thumbnail covering `requested_side`.
+
+        `info["thumbnails"]` lists each thumbnail's longest side, so the pick
+        is made without decoding anything. Returns None for full-resolution
+        requests (side 0) or when every thumbnail is too small to avoid
+        upscaling a blurry preview.
+        """
+        if not requested_side or requested_side <= 0:
+            return None
+        boxes = heif.info.get("thumbnails") or []
+        fitting = [(box, index) for index, box in enumerate(boxes) if box >= requested_side]
+        if not fitting:
+            return None
+        _box, index = min(fitting)
+        return heif[heif.primary_index].get_thumbnail(index)
+
     def _load_via_pillow(self, path: str, requested_side: int) -> QImage | None:
         """Load image with Pillow (HEIF supported if pillow-heif is registered)."""
         if not self._pillow_available:
             return None
         try:
-            assert Image is not None and ImageOps is not None
+            assert Image is not None
             with Image.open(path) as im:
+                # Rotate after downscaling: the square thumbnail box is
+                # orientation-agnostic, and turning the small QImage avoids
+                # a full-resolution exif_transpose copy.
                 try:
-                    im = ImageOps.exif_transpose(im)
+                    orientation = im.getexif().get(0x0112, 1)
                 except (OSError, ValueError, AttributeError):
-                    pass
+                    orientation = 1
                 if requested_side and requested_side > 0:
                     resampling = getattr(Image, "Resampling", Image)
                     resample = getattr(resampling, "LANCZOS", getattr(resampling, "BICUBIC", 3))
                     im.thumbnail((requested_side, requested_side), resample)
-                return self._pil_to_qimage(im)
+                qimg = self._pil_to_qimage(im)
+            if qimg is None:
+                return None
+            return _apply_exif_orientation(qimg, orientation)
         except (OSError, ValueError) as ex:
             logger.debug("Pillow load failed for {}: {}", path, ex)
             return None
@@ -27,6 +27,7 @@ from __future__ import annotations
 import os
 import sqlite3
 from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from loguru import logger
@@ -35,6 +36,12 @@ from core.models import PhotoGroup, PhotoRecord
 from infrastructure.utils import get_exif_datetime_original, get_filesystem_creation_datetime
 
 
+#: Threads for the filesystem fallback reads of rows an old manifest has
+#: no cached metadata for. Each read is a stat / EXIF open that spends its
+#: time waiting on the disk (or NAS round-trip) with the GIL released.
+_FS_FALLBACK_WORKERS = 16
+
+
 def _connect(path: str) -> sqlite3.Connection:
     """Open a SQLite connection with performance pragmas.
 
@@ -49,11 +56,12 @@ def _connect(path: str) -> sqlite3.Connection:
     conn.execute("PRAGMA temp_store = MEMORY")
     return conn
 
+# Only the columns ``load`` reads, in the order it unpacks them —
+# rows come back as plain tuples (no ``sqlite3.Row`` name lookups).
 _LOAD_ALL_SQL = """
-SELECT id, source_path, source_label, group_id, hamming_distance, reason,
-       action, executed, user_decision, is_locked,
+SELECT group_id, source_path, action, user_decision, is_locked,
        file_size_bytes, shot_date, creation_date, mtime,
-       pixel_width, pixel_height,
+       hamming_distance, pixel_width, pixel_height,
        phash,
        score
 FROM   migration_manifest
@@ -229,6 +237,16 @@ def _photo_record(
     )
 
 
+def _photo_record_or_none(args: tuple) -> PhotoRecord | None:
+    """:func:`_photo_record` over one row's positional ``args``, logging and
+    skipping a row that fails."""
+    try:
+        return _photo_record(*args)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        logger.warning("Skipping {}: {}", args[0], exc)
+        return None
+
+
 class ManifestRepository:
     """Read all manifest rows; write user decisions back."""
 
@@ -236,8 +254,11 @@ class ManifestRepository:
 
     def ensure_schema(self, manifest_path: str) -> None:
         """Run the lazy ALTER TABLE migrations on the manifest at
-        ``manifest_path``. Idempotent — every ALTER is wrapped in a
-        try/except that silently skips columns that already exist.
+        ``manifest_path``. Idempotent — the current columns are read once
+        with ``PRAGMA table_info`` and only missing ones are ALTERed (each
+        ALTER still tolerates a concurrent writer having added it first).
+        ``load()`` runs this on every open, so an up-to-date manifest costs
+        one PRAGMA instead of a failing ALTER per migration.
 
         Callers that write to columns added by the migration list
         (e.g. ``is_locked``, ``score``, ``user_decision``) MUST call
@@ -260,7 +281,12 @@ class ManifestRepository:
             raise FileNotFoundError(f"Manifest not found: {manifest_path}")
         conn = _connect(manifest_path)
         try:
+            existing = {row[1] for row in conn.execute(
+                "PRAGMA table_info(migration_manifest)"
+            )}
             for col, ddl in _MIGRATIONS:
+                if col in existing:
+                    continue
                 try:
                     conn.execute(
                         f"ALTER TABLE migration_manifest "
@@ -379,7 +405,6 @@ class ManifestRepository:
         # ensure_schema() docstring for the contract.
         self.ensure_schema(manifest_path)
         conn = _connect(manifest_path)
-        conn.row_factory = sqlite3.Row
         try:
             all_rows = conn.execute(_LOAD_ALL_SQL).fetchall()
         finally:
@@ -389,11 +414,18 @@ class ManifestRepository:
         # Orphan-skip must remain here in Python (post-grouping survivor count).
         by_group: dict[str, list] = defaultdict(list)
         for row in all_rows:
-            gid = row["group_id"]
+            gid = row[0]
             if gid:
                 by_group[gid].append(row)
 
         # Assign sequential group_number over sorted group_ids; skip orphaned singles.
+        # Rows with cached metadata are built inline from the row alone.
+        # Rows an older manifest has no cache for stat / EXIF-read the
+        # filesystem — latency-bound calls that overlap across threads —
+        # so only those are handed to the pool, keyed by their slot in
+        # ``records`` to keep row order.
+        records: list[PhotoRecord | None] = []
+        uncached: list[tuple[int, tuple]] = []
         group_number = 0
         for gid in sorted(by_group):
             db_rows = by_group[gid]
@@ -403,32 +435,38 @@ class ManifestRepository:
                 # a post-grouping survivor-count predicate.
                 continue
             group_number += 1
-            for row in db_rows:
-                action: str = row["action"]
-                source_path: str = row["source_path"]
-                user_decision: str = row["user_decision"] or ""
+            for (
+                _gid, source_path, action, user_decision, is_locked,
+                file_size, shot_date, creation_date, mtime,
+                hamming, pixel_width, pixel_height, phash, score,
+            ) in db_rows:
                 read_exif = action == "REVIEW_DUPLICATE"
-                try:
-                    yield _photo_record(
-                        source_path=source_path,
-                        group_number=group_number,
-                        is_mark=False,
-                        is_locked=bool(row["is_locked"]),
-                        action=action,
-                        read_exif=read_exif,
-                        user_decision=user_decision,
-                        db_file_size=row["file_size_bytes"],
-                        db_shot_date=row["shot_date"],
-                        db_creation_date=row["creation_date"],
-                        db_mtime=row["mtime"],
-                        hamming_distance=row["hamming_distance"],
-                        db_pixel_width=row["pixel_width"],
-                        db_pixel_height=row["pixel_height"],
-                        db_phash=row["phash"],
-                        db_score=row["score"],
-                    )
-                except Exception as exc:  # pylint: disable=broad-exception-caught
-                    logger.warning("Skipping {}: {}", source_path, exc)
+                # Positional, in _photo_record's parameter order.
+                args = (
+                    source_path, group_number, False, bool(is_locked), action,
+                    read_exif, user_decision or "", file_size, shot_date,
+                    creation_date, mtime, hamming, pixel_width, pixel_height,
+                    phash, score,
+                )
+                if (
+                    file_size is None
+                    or creation_date is None
+                    or mtime is None
+                    or (shot_date is None and read_exif)
+                ):
+                    uncached.append((len(records), args))
+                    records.append(None)
+                else:
+                    records.append(_photo_record_or_none(args))
+
+        if uncached:
+            with ThreadPoolExecutor(max_workers=_FS_FALLBACK_WORKERS) as pool:
+                built = pool.map(_photo_record_or_none, [args for _i, args in uncached])
+                for (slot, _args), record in zip(uncached, built, strict=True):
+                    records[slot] = record
+        for record in records:
+            if record is not None:
+                yield record
 
     # ------------------------------------------------------------------ save
 
@@ -840,18 +840,27 @@ def _make_row(
 ) -> ManifestRow:
     import os
     from datetime import datetime as _dt
-    from infrastructure.utils import get_filesystem_creation_datetime
 
     path_str = str(hr.record.path)
+    # One stat per row supplies size, mtime and ctime — this runs once per
+    # classified record, so separate getsize/getmtime/getctime calls
+    # tripled the per-file metadata round-trips (costly on NAS sources).
+    _size: Optional[int] = None
+    _mtime: Optional[str] = None
+    _ctime: Optional[_dt] = None
     try:
-        _size: Optional[int] = os.path.getsize(path_str)
+        st = os.stat(path_str)
     except OSError:
-        _size = None
-    try:
-        _mtime: Optional[str] = _dt.fromtimestamp(os.path.getmtime(path_str)).isoformat()
-    except OSError:
-        _mtime = None
-    _ctime = get_filesystem_creation_datetime(path_str)
+        st = None
+    if st is not None:
+        _size = st.st_size
+        try:
+            _mtime = _dt.fromtimestamp(st.st_mtime).isoformat()
+            # Windows: creation time; elsewhere metadata-change time, the
+            # same best-effort value get_filesystem_creation_datetime gives.
+            _ctime = _dt.fromtimestamp(st.st_ctime)
+        except (OSError, ValueError, OverflowError):
+            pass
     _shot: Optional[str] = hr.exif_date.isoformat() if hr.exif_date else None
 
     return ManifestRow(
@@ -395,6 +395,16 @@ def parse_exif_date(raw: str) -> Optional[datetime]:
     # Strip timezone suffix if present ("2024:06:01 12:00:00+09:00" → drop "+09:00")
     raw = raw[:19]
     try:
+        # The zero-padded "YYYY:MM:DD HH:MM:SS" exiftool writes is an ISO
+        # datetime once the date colons become dashes; the C-level
+        # fromisoformat parses it without strptime's per-call walk of the
+        # format string. Any other shape keeps strptime's leniency.
+        if (
+            len(raw) == 19
+            and raw[4] == raw[7] == raw[13] == raw[16] == ":"
+            and raw[10] == " "
+        ):
+            return datetime.fromisoformat(raw.replace(":", "-", 2))
         return datetime.strptime(raw, _EXIF_DATE_FMT)
     except ValueError:
         return None
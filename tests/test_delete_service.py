@@ -68,6 +68,39 @@ class TestPlanDelete:
         assert summary.selected_count == 1
         assert summary.total_count == 2
 
+    def test_groups_are_iterated_once(self):
+        """Failure mode: a second pass over ``groups`` to build summaries —
+        double the record walk, and an empty summary list when the caller
+        hands in a one-shot iterator."""
+        groups = [
+            PhotoGroup(group_number=1, items=[_rec("/a/f1.jpg"), _rec("/a/f2.jpg")]),
+            PhotoGroup(group_number=2, items=[_rec("/b/f3.jpg")]),
+        ]
+        plan = DeleteService().plan_delete(iter(groups), ["/a/f1.jpg", "/b/f3.jpg"])
+        assert [
+            (s.group_number, s.selected_count, s.total_count, s.is_full_delete)
+            for s in plan.group_summaries
+        ] == [(1, 1, 2, False), (2, 1, 1, True)]
+
+    def test_empty_selection_skips_the_record_scan(self):
+        """Failure mode: clearing the selection still walks every record of
+        every group to find that nothing is selected."""
+
+        class _Items(list):
+            def __iter__(self):
+                raise AssertionError("records scanned for an empty selection")
+
+        groups = [
+            PhotoGroup(group_number=1, items=_Items([_rec("/a/f1.jpg"), _rec("/a/f2.jpg")])),
+            PhotoGroup(group_number=2, items=_Items()),
+        ]
+        plan = DeleteService().plan_delete(groups, [])
+        assert plan.delete_paths == []
+        assert [
+            (s.group_number, s.selected_count, s.total_count, s.is_full_delete)
+            for s in plan.group_summaries
+        ] == [(1, 0, 2, False), (2, 0, 0, False)]
+
     def test_unselected_paths_not_in_plan(self):
         groups = [PhotoGroup(group_number=1, items=[
             _rec("/a/f1.jpg"),
@@ -118,10 +151,13 @@ class TestDeleteToRecycle:
         mock_trash.assert_called_once()
         assert str(f) in result.success_paths
 
-    def test_falls_back_to_original_path_when_normalized_fails(self, tmp_path):
+    def test_falls_back_to_original_path_when_normalized_fails(self, tmp_path, monkeypatch):
         """Method 1 (normalized) raises OSError → Method 2 (original path) succeeds."""
         f = tmp_path / "photo.jpg"
         f.write_bytes(b"fake")
+        # "./photo.jpg": normalized, original and absolute spellings all differ.
+        monkeypatch.chdir(tmp_path)
+        p = "./photo.jpg"
         call_count = [0]
 
         def trash_fail_then_succeed(p):
@@ -135,15 +171,17 @@ class TestDeleteToRecycle:
             "infrastructure.delete_service.send2trash",
             side_effect=trash_fail_then_succeed,
         ):
-            result = svc.delete_to_recycle([str(f)])
-        assert str(f) in result.success_paths
+            result = svc.delete_to_recycle([p])
+        assert p in result.success_paths
         assert result.failed == []
         assert call_count[0] == 2
 
-    def test_falls_back_to_absolute_path_when_first_two_fail(self, tmp_path):
+    def test_falls_back_to_absolute_path_when_first_two_fail(self, tmp_path, monkeypatch):
         """Method 1 + 2 raise OSError → Method 3 (absolute path) succeeds."""
         f = tmp_path / "photo.jpg"
         f.write_bytes(b"fake")
+        monkeypatch.chdir(tmp_path)
+        p = "./photo.jpg"
         call_count = [0]
 
         def trash(p):
@@ -156,26 +194,83 @@ class TestDeleteToRecycle:
             "infrastructure.delete_service.send2trash",
             side_effect=trash,
         ):
-            result = svc.delete_to_recycle([str(f)])
-        assert str(f) in result.success_paths
+            result = svc.delete_to_recycle([p])
+        assert p in result.success_paths
         assert call_count[0] == 3
 
-    def test_all_three_methods_failing_records_failure(self, tmp_path):
+    def test_all_three_methods_failing_records_failure(self, tmp_path, monkeypatch):
         """When every fallback path raises, the file is recorded as failed."""
         f = tmp_path / "photo.jpg"
         f.write_bytes(b"fake")
+        monkeypatch.chdir(tmp_path)
+        p = "./photo.jpg"
 
         svc = DeleteService()
         with patch(
             "infrastructure.delete_service.send2trash",
             side_effect=OSError("permanent failure"),
-        ):
-            result = svc.delete_to_recycle([str(f)])
+        ) as mock_trash:
+            result = svc.delete_to_recycle([p])
+        assert mock_trash.call_count == 3
         assert result.success_paths == []
         assert len(result.failed) == 1
-        assert result.failed[0][0] == str(f)
+        assert result.failed[0][0] == p
         assert "Multiple delete failures" in result.failed[0][1]
 
+    def test_identical_spellings_are_tried_once(self, tmp_path):
+        """Failure mode: an absolute, already-normalized path (every manifest
+        path) re-runs the same failing shell operation three times."""
+        f = tmp_path / "photo.jpg"
+        f.write_bytes(b"fake")
+        with patch(
+            "infrastructure.delete_service.send2trash",
+            side_effect=OSError("in use"),
+        ) as mock_trash:
+            result = DeleteService().delete_to_recycle([str(f)])
+        mock_trash.assert_called_once_with(str(f))
+        assert result.failed == [(str(f), "Delete failed: in use")]
+
+    def test_recovered_retry_logs_no_warning(self, tmp_path, monkeypatch, caplog):
+        """Failure mode: a warning per retried spelling floods the log (and
+        pays loguru's formatting cost) for deletes that end up succeeding."""
+        import logging
+
+        from loguru import logger
+
+        (tmp_path / "photo.jpg").write_bytes(b"fake")
+        monkeypatch.chdir(tmp_path)
+        outcomes = iter([OSError("first"), None])
+
+        def trash(_p):
+            err = next(outcomes)
+            if err is not None:
+                raise err
+
+        handler_id = logger.add(caplog.handler, format="{message}", level="DEBUG")
+        try:
+            with patch("infrastructure.delete_service.send2trash", side_effect=trash):
+                with caplog.at_level(logging.DEBUG):
+                    result = DeleteService().delete_to_recycle(["./photo.jpg"])
+        finally:
+            logger.remove(handler_id)
+        assert result.success_paths == ["./photo.jpg"]
+        assert [r.levelno for r in caplog.records if r.levelno >= logging.WARNING] == []
+        assert "delete_to_recycle: 1 ok, 0 failed" in caplog.text
+
+    def test_runtime_error_on_a_later_spelling_is_recorded_not_raised(
+        self, tmp_path, monkeypatch
+    ):
+        (tmp_path / "photo.jpg").write_bytes(b"fake")
+        monkeypatch.chdir(tmp_path)
+        errors = iter([OSError("first"), RuntimeError("kernel said no")])
+
+        def trash(_p):
+            raise next(errors)
+
+        with patch("infrastructure.delete_service.send2trash", side_effect=trash):
+            result = DeleteService().delete_to_recycle(["./photo.jpg"])
+        assert result.failed == [("./photo.jpg", "Unexpected error: kernel said no")]
+
     def test_runtime_error_on_normalized_path_recorded_as_failure(self, tmp_path):
         """RuntimeError on Method 1 short-circuits to failure (no fallback)."""
         f = tmp_path / "photo.jpg"
@@ -192,6 +287,49 @@ class TestDeleteToRecycle:
         assert "Unexpected error" in result.failed[0][1]
 
 
+class TestBatchedRecycle:
+    def _files(self, tmp_path, n):
+        paths = []
+        for i in range(n):
+            f = tmp_path / f"photo{i}.jpg"
+            f.write_bytes(b"fake")
+            paths.append(str(f))
+        return paths
+
+    def test_files_are_trashed_in_chunked_batch_calls(self, tmp_path, monkeypatch):
+        """Failure mode: one send2trash call per file pays the Windows shell
+        operation setup cost N times for an N-file delete."""
+        import infrastructure.delete_service as ds
+
+        monkeypatch.setattr(ds, "_RECYCLE_BATCH_SIZE", 2)
+        paths = self._files(tmp_path, 5)
+        with patch("infrastructure.delete_service.send2trash") as mock_trash:
+            result = DeleteService().delete_to_recycle(paths)
+        assert [c.args[0] for c in mock_trash.call_args_list] == [
+            paths[0:2], paths[2:4], paths[4],
+        ]
+        assert result.success_paths == paths
+        assert result.failed == []
+
+    def test_failed_batch_retries_only_the_files_still_present(self, tmp_path):
+        paths = self._files(tmp_path, 3)
+        per_path: list[str] = []
+
+        def trash(arg):
+            if isinstance(arg, list):
+                Path(arg[0]).unlink()  # shell moved one file before failing
+                raise OSError("batch aborted")
+            per_path.append(arg)
+            if arg == paths[2]:
+                raise RuntimeError("locked")
+
+        with patch("infrastructure.delete_service.send2trash", side_effect=trash):
+            result = DeleteService().delete_to_recycle(paths)
+        assert per_path == [paths[1], paths[2]]
+        assert result.success_paths == [paths[0], paths[1]]
+        assert [p for p, _reason in result.failed] == [paths[2]]
+
+
 # ── execute_delete ─────────────────────────────────────────────────────────
 
 class TestExecuteDelete:
@@ -223,3 +361,42 @@ class TestExecuteDelete:
         result = svc.execute_delete(groups, plan, log_dir=log_dir)
         assert len(result.failed) == 1
         assert Path(result.log_path).exists()
+
+    def test_planned_delete_logs_groups_without_rewalking_records(self, tmp_path):
+        """Failure mode: execute_delete walks every record of every group a
+        second time to rebuild a mapping plan_delete already saw."""
+        import csv
+
+        f = tmp_path / "photo.jpg"
+        f.write_bytes(b"fake")
+        groups = [
+            PhotoGroup(group_number=1, items=[_rec("/other.jpg")]),
+            PhotoGroup(group_number=7, items=[_rec(str(f))]),
+        ]
+        svc = DeleteService()
+        plan = svc.plan_delete(groups, [str(f)])
+        assert plan.path_to_group == {str(f): 7}
+
+        class _NoWalk:
+            def __iter__(self):
+                raise AssertionError("groups re-walked")
+
+        with patch("infrastructure.delete_service.send2trash"):
+            result = svc.execute_delete(_NoWalk(), plan, log_dir=str(tmp_path / "logs"))
+        with open(result.log_path, newline="", encoding="utf-8") as fh:
+            rows = list(csv.reader(fh))
+        assert rows[1][:3] == ["7", str(f), "1"]
+
+    def test_hand_built_plan_maps_only_touched_paths(self, tmp_path):
+        import csv
+
+        from core.services.interfaces import DeletePlan
+
+        groups = [
+            PhotoGroup(group_number=3, items=[_rec("/ghost.jpg"), _rec("/kept.jpg")]),
+        ]
+        plan = DeletePlan(delete_paths=["/ghost.jpg"], group_summaries=[])
+        result = DeleteService().execute_delete(groups, plan, log_dir=str(tmp_path / "logs"))
+        with open(result.log_path, newline="", encoding="utf-8") as fh:
+            rows = list(csv.reader(fh))
+        assert [r[:2] for r in rows[1:]] == [["3", "/ghost.jpg"]]
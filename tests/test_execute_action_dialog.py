@@ -652,6 +652,82 @@ class TestDeleteFile:
         assert row and row[0] == ""
 
 
+class TestDeleteFiles:
+    """Execute trashes a pass's delete rows in batched send2trash calls."""
+
+    def test_paths_are_trashed_in_one_batch_call(self, qapp, tmp_path):
+        from app.views.dialogs.execute_action_dialog import ExecuteActionDialog
+        files = [tmp_path / f"p{i}.jpg" for i in range(3)]
+        for f in files:
+            f.write_bytes(b"x")
+        paths = [str(f) for f in files]
+        dlg = ExecuteActionDialog(
+            [_group(*(_rec(p, "delete") for p in paths))], manifest_path=None
+        )
+
+        with patch("send2trash.send2trash") as mock_trash:
+            dlg._on_execute()
+
+        mock_trash.assert_called_once_with(paths)
+        assert dlg.deleted_paths == paths
+        assert dlg._failed_paths == []
+
+    def test_missing_paths_are_kept_out_of_the_batch(self, qapp, tmp_path):
+        from app.views.dialogs.execute_action_dialog import ExecuteActionDialog
+        f = tmp_path / "here.jpg"
+        f.write_bytes(b"x")
+        gone = str(tmp_path / "gone.jpg")
+        dlg = ExecuteActionDialog([], manifest_path=None)
+
+        with patch("send2trash.send2trash") as mock_trash:
+            dlg._delete_files([str(f), gone])
+
+        mock_trash.assert_called_once_with([str(f)])
+        assert dlg.deleted_paths == [str(f)]
+        assert dlg._missing_paths == [gone]
+
+    def test_failed_batch_falls_back_to_one_by_one(self, qapp, tmp_path):
+        """A rejected batch must not lose per-path outcomes: files the
+        batch already moved count as deleted, the rest retry singly and
+        record their own failure reason."""
+        from app.views.dialogs.execute_action_dialog import ExecuteActionDialog
+        moved = tmp_path / "moved.jpg"
+        stuck = tmp_path / "stuck.jpg"
+        for f in (moved, stuck):
+            f.write_bytes(b"x")
+        dlg = ExecuteActionDialog([], manifest_path=None)
+
+        def trash(arg):
+            if isinstance(arg, list):
+                moved.unlink()
+                raise OSError("batch rejected")
+            raise OSError("in use")
+
+        with patch("send2trash.send2trash", side_effect=trash):
+            dlg._delete_files([str(moved), str(stuck)])
+
+        assert dlg.deleted_paths == [str(moved)]
+        assert [p for p, _ in dlg._failed_paths] == [str(stuck)]
+
+    def test_batch_finalizes_each_deleted_path(self, qapp, tmp_path):
+        from app.views.dialogs.execute_action_dialog import ExecuteActionDialog
+        files = [tmp_path / f"p{i}.jpg" for i in range(2)]
+        for f in files:
+            f.write_bytes(b"x")
+        dlg = ExecuteActionDialog([], manifest_path="/fake/manifest.sqlite")
+
+        with patch("send2trash.send2trash"):
+            with patch(
+                "infrastructure.manifest_repository.ManifestRepository.finalize_outcome"
+            ) as mock_finalize:
+                dlg._delete_files([str(f) for f in files])
+
+        assert [c.args[1] for c in mock_finalize.call_args_list] == [
+            [str(files[0])],
+            [str(files[1])],
+        ]
+
+
 # ── #505 delete audit CSV on the UI delete path ────────────────────────────
 
 
@@ -1482,9 +1558,12 @@ class TestExecuteRequestedLockConfirm:
             # Both files reached send2trash — proves the lock-confirm
             # didn't accidentally short-circuit the unlocked path,
             # and the unlock+execute happened for the locked one.
-            called_paths = {
-                call.args[0] for call in fake_send2trash.call_args_list
-            }
+            # Both rows go out in one batched call; a lone path is passed
+            # bare, so flatten either shape.
+            called_paths: set[str] = set()
+            for call in fake_send2trash.call_args_list:
+                arg = call.args[0]
+                called_paths.update(arg if isinstance(arg, list) else [arg])
             assert str(f_free) in called_paths
             assert str(f_locked) in called_paths
             # Both rows ended up in deleted_paths (post-execute audit).
@@ -628,14 +628,14 @@ class TestSetDecisionToHighlighted:
         assert recs[0].user_decision == ""
 
 
-# ── _get_record_field — Action field mapping ──────────────────────────────────
+# ── _record_field_getter — Action field mapping ───────────────────────────────
 
-class TestGetRecordFieldActionMapping:
-    """_get_record_field("Action", rec) must read user_decision, not action.
+class TestRecordFieldGetterActionMapping:
+    """_record_field_getter("Action") must read user_decision, not action.
 
     The "Action" column in the tree (COL_ACTION=2) displays user_decision.
     Select/Unselect reads the visual tree model so it always matched correctly;
-    Set Action uses _get_record_field which previously mapped to rec.action
+    Set Action uses _record_field_getter which previously mapped to rec.action
     (scanner classification) — causing no matches for values like "delete".
     """
 
@@ -654,20 +654,20 @@ class TestGetRecordFieldActionMapping:
         )
 
     def test_action_field_reads_user_decision(self):
-        from app.views.handlers.file_operations import _get_record_field
+        from app.views.handlers.file_operations import _record_field_getter
         rec = self._make_rec(action="MOVE", user_decision="delete")
-        assert _get_record_field(rec, "Action") == "delete"
+        assert _record_field_getter("Action")(rec) == "delete"
 
     def test_action_field_does_not_read_scanner_action(self):
-        from app.views.handlers.file_operations import _get_record_field
+        from app.views.handlers.file_operations import _record_field_getter
         rec = self._make_rec(action="MOVE", user_decision="delete")
-        assert _get_record_field(rec, "Action") != "MOVE"
+        assert _record_field_getter("Action")(rec) != "MOVE"
 
     def test_action_field_empty_when_undecided(self):
-        from app.views.handlers.file_operations import _get_record_field
+        from app.views.handlers.file_operations import _record_field_getter
         rec = self._make_rec(action="REVIEW_DUPLICATE", user_decision="")
-        # Empty user_decision returns None (falsy guard in _get_record_field)
-        result = _get_record_field(rec, "Action")
+        # Empty user_decision reads as "" (or None for an unset attribute)
+        result = _record_field_getter("Action")(rec)
         assert result == "" or result is None
 
     def test_set_decision_by_regex_matches_user_decision(self, tmp_path):
@@ -2237,7 +2237,7 @@ class TestBuildMatchFn:
         assert total == 100
         assert len(samples) == 50
 
-    def test_uses_get_record_field_for_basename(self):
+    def test_uses_record_field_getter_for_basename(self):
         """File Name field must extract basename, not the full path —
         otherwise users can't write `^IMG` to anchor at the filename
         (the path starts with `/photos/`)."""
@@ -2318,6 +2318,76 @@ class TestBuildMatchFn:
         assert matched == 2
 
 
+# ── regex_matched_paths (shared regex Apply path) ────────────────────────────
+
+class TestRegexMatchedPaths:
+    """Apply (``regex_matched_paths``) and the live preview
+    (``build_match_fn``) both read fields through
+    ``_record_field_getter`` — its per-field rendering is pinned here."""
+
+    def test_reader_renders_every_mapped_field(self):
+        from app.views.handlers.file_operations import (
+            _FIELD_TO_ATTR,
+            _record_field_getter,
+        )
+
+        rec = _rec("/photos/IMG_1.jpg", decision="delete", locked=True)
+        rec.folder_path = "/photos"
+        rec.file_size_bytes = 1234
+        rec.pixel_width, rec.pixel_height = 4000, 3000
+        rec.score = 0.5
+        blank = _rec("/photos/b.jpg")
+        expected = {
+            "File Name": ("IMG_1.jpg", "b.jpg"),
+            "Folder": ("/photos", ""),
+            "Action": ("delete", ""),
+            "Lock": ("Locked", ""),
+            "Size (Bytes)": ("1234", "0"),
+            "Creation Date": (None, None),
+            "Shot Date": (None, None),
+            "Score": ("0.5", None),
+            "Resolution": ("4000×3000", None),
+        }
+        assert set(expected) == set(_FIELD_TO_ATTR)
+        for field, (full, empty) in expected.items():
+            read = _record_field_getter(field)
+            assert read(rec) == full, field
+            assert read(blank) == empty, field
+
+    def test_unknown_field_has_no_reader(self):
+        from app.views.handlers.file_operations import _record_field_getter
+
+        assert _record_field_getter("Group Count") is None
+
+    def test_returns_matches_in_tree_order(self):
+        from app.views.handlers.file_operations import regex_matched_paths
+
+        groups = [
+            PhotoGroup(group_number=1, items=[_rec("/p/IMG_2.jpg"), _rec("/p/x.png")]),
+            PhotoGroup(group_number=2, items=[_rec("/p/img_1.JPG")]),
+        ]
+        assert regex_matched_paths(groups, "File Name", r"^img_") == [
+            "/p/IMG_2.jpg",
+            "/p/img_1.JPG",
+        ]
+
+    def test_unmapped_field_matches_nothing(self):
+        from app.views.handlers.file_operations import regex_matched_paths
+
+        groups = [PhotoGroup(group_number=1, items=[_rec("/a.jpg")])]
+        assert regex_matched_paths(groups, "Group Count", r".*") == []
+
+    def test_invalid_regex_raises(self):
+        import re
+
+        import pytest
+
+        from app.views.handlers.file_operations import regex_matched_paths
+
+        with pytest.raises(re.error):
+            regex_matched_paths([], "File Name", "(unclosed")
+
+
 # ---------------------------------------------------------------------------
 # Lock state — set_locked_state, regex lock action, skip-locked (photo-manager#164)
 # ---------------------------------------------------------------------------
@@ -93,8 +93,12 @@ def test_register_player_connects_all_signal_pairs():
     that motivated this whole work-stream.
     """
     fake_player = MagicMock()
+    fake_player.is_playing.return_value = False
     fake_self = SimpleNamespace(
         _players=[],
+        _connections={},
+        _player_playing={},
+        _playing_count=0,
         _on_player_duration_changed=lambda *a: None,
         _on_player_position_changed=lambda *a: None,
         _on_player_state_changed=lambda *a: None,
@@ -116,9 +120,7 @@ def test_register_player_connects_all_signal_pairs():
     fake_player.positionChanged.connect.assert_called_once_with(
         fake_self._on_player_position_changed
     )
-    fake_player.stateChanged.connect.assert_called_once_with(
-        fake_self._on_player_state_changed
-    )
+    fake_player.stateChanged.connect.assert_called_once()
 
     # Controller → player: 4 broadcast slots wired
     fake_self.playRequested.connect.assert_called_once_with(fake_player.play)
@@ -126,6 +128,17 @@ def test_register_player_connects_all_signal_pairs():
     fake_self.positionRequested.connect.assert_called_once_with(fake_player.set_position)
     fake_self.volumeRequested.connect.assert_called_once_with(fake_player.set_volume)
 
+    # Every connection handle kept for unregister_player
+    assert fake_self._connections[fake_player] == [
+        fake_player.durationChanged.connect.return_value,
+        fake_player.positionChanged.connect.return_value,
+        fake_player.stateChanged.connect.return_value,
+        fake_self.playRequested.connect.return_value,
+        fake_self.pauseRequested.connect.return_value,
+        fake_self.positionRequested.connect.return_value,
+        fake_self.volumeRequested.connect.return_value,
+    ]
+
 
 def test_register_player_is_idempotent():
     """Registering the same player twice → no duplicate in the
@@ -137,6 +150,7 @@ def test_register_player_is_idempotent():
     fake_player = MagicMock()
     fake_self = SimpleNamespace(
         _players=[fake_player],  # already registered
+        _connections={fake_player: []},
         _on_player_duration_changed=lambda *a: None,
         _on_player_position_changed=lambda *a: None,
         _on_player_state_changed=lambda *a: None,
@@ -154,74 +168,81 @@ def test_register_player_is_idempotent():
     fake_self.playRequested.connect.assert_not_called()
 
 
-def test_unregister_player_disconnects_all_signal_pairs():
-    """The disconnect-all symmetric to ``register_player``. Failure
-    mode (same class as register): a refactor adds a new broadcast
-    signal but forgets to ``disconnect`` it here → dead signal
+def test_unregister_player_disconnects_all_signal_pairs(monkeypatch):
+    """The disconnect-all symmetric to ``register_player``: every
+    handle stored at registration is disconnected, and the handles are
+    dropped. Failure mode (same class as register): a refactor adds a
+    new broadcast signal but forgets to keep its handle → dead signal
     connections accumulate as users navigate between groups,
     leaking memory and eventually firing the slot on a deleted
     player (Qt RuntimeError)."""
+    from app.views.widgets import group_media_controller as gmc
+
+    disconnected: list = []
+    monkeypatch.setattr(
+        gmc, "QObject", SimpleNamespace(disconnect=lambda c: disconnected.append(c) or True)
+    )
     fake_player = MagicMock()
+    handles = [object() for _ in range(7)]
     fake_self = SimpleNamespace(
         _players=[fake_player],
-        _on_player_duration_changed=lambda *a: None,
-        _on_player_position_changed=lambda *a: None,
-        _on_player_state_changed=lambda *a: None,
-        playRequested=MagicMock(),
-        pauseRequested=MagicMock(),
-        positionRequested=MagicMock(),
-        volumeRequested=MagicMock(),
+        _connections={fake_player: list(handles)},
+        _player_playing={fake_player: True},
+        _playing_count=1,
     )
 
     GroupMediaController.unregister_player(fake_self, fake_player)
 
     assert fake_self._players == []
+    assert disconnected == handles
+    assert fake_self._connections == {}
+    # A playing player leaving takes its vote with it
+    assert fake_self._player_playing == {}
+    assert fake_self._playing_count == 0
+
+
+def test_unregister_player_with_dead_connections_still_removes(qapp):
+    """A handle whose link is already gone (disconnected earlier, or
+    the player's C++ side deleted first) disconnects as a no-op. The
+    player is still removed and a later register reconnects cleanly.
 
-    # All 3 player-side disconnects called
-    fake_player.durationChanged.disconnect.assert_called_once()
-    fake_player.positionChanged.disconnect.assert_called_once()
-    fake_player.stateChanged.disconnect.assert_called_once()
-
-    # All 4 controller-side disconnects called
-    fake_self.playRequested.disconnect.assert_called_once()
-    fake_self.pauseRequested.disconnect.assert_called_once()
-    fake_self.positionRequested.disconnect.assert_called_once()
-    fake_self.volumeRequested.disconnect.assert_called_once()
-
-
-def test_unregister_player_swallows_disconnect_exceptions():
-    """Disconnect on an already-disconnected signal raises
-    ``TypeError`` or ``RuntimeError`` (depending on PySide6
-    version). The controller must swallow these so a partial
-    re-registration doesn't leave the user unable to clean up the
-    group.
-
-    Failure mode: a refactor that drops the try/except (or narrows
-    the except clauses) would crash ``cleanup()`` on a group
-    navigation, leaving the player widgets stranded with a dead
-    controller.
+    Failure mode: disconnect-by-slot on a broken link raises
+    ``TypeError`` / ``RuntimeError`` depending on the PySide6
+    version, which would crash ``cleanup()`` on a group navigation.
     """
-    fake_player = MagicMock()
-    # Make every disconnect raise — simulates already-disconnected state
-    fake_player.durationChanged.disconnect.side_effect = TypeError("already disconnected")
-    fake_player.positionChanged.disconnect.side_effect = RuntimeError("dead signal")
+    from PySide6.QtCore import QObject as RealQObject
+    from PySide6.QtCore import Signal
 
-    fake_self = SimpleNamespace(
-        _players=[fake_player],
-        _on_player_duration_changed=lambda *a: None,
-        _on_player_position_changed=lambda *a: None,
-        _on_player_state_changed=lambda *a: None,
-        playRequested=MagicMock(),
-        pauseRequested=MagicMock(),
-        positionRequested=MagicMock(),
-        volumeRequested=MagicMock(),
-    )
+    class _Player(RealQObject):
+        durationChanged = Signal(int)
+        positionChanged = Signal(int)
+        stateChanged = Signal(bool)
 
-    # Must not raise
-    GroupMediaController.unregister_player(fake_self, fake_player)
+        def play(self):
+            pass
 
-    # Player still removed despite the disconnect errors
-    assert fake_self._players == []
+        def pause(self):
+            pass
+
+        def set_position(self, _ms):
+            pass
+
+        def set_volume(self, _v):
+            pass
+
+    controller = GroupMediaController(parent=None)
+    try:
+        player = _Player()
+        controller.register_player(player)
+        for conn in controller._connections[player]:
+            RealQObject.disconnect(conn)
+
+        # Must not raise
+        controller.unregister_player(player)
+        assert controller.get_registered_count() == 0
+        assert player not in controller._connections
+    finally:
+        controller.deleteLater()
 
 
 def test_unregister_player_is_noop_for_non_registered():
@@ -491,27 +512,122 @@ def test_on_player_position_changed_skipped_when_playing():
 
 
 def test_on_player_state_changed_updates_is_playing_via_majority_helper():
-    """Player state-change → recount via majority helper → update
-    ``_is_playing`` + refresh button. The integration with
-    ``is_majority_playing`` and the .is_playing() probe per player."""
-    p1 = MagicMock()
+    """Player state-change → adjust the playing count by that one
+    player's transition → update ``_is_playing`` via the majority
+    helper + refresh button."""
+    p1, p2, p3 = MagicMock(), MagicMock(), MagicMock()
     p1.is_playing.return_value = True
-    p2 = MagicMock()
-    p2.is_playing.return_value = True
-    p3 = MagicMock()
-    p3.is_playing.return_value = False
 
     fake_self = SimpleNamespace(
         _players=[p1, p2, p3],
+        _player_playing={p1: False, p2: True, p3: False},
+        _playing_count=1,
         _is_playing=False,
         _update_play_button=MagicMock(),
     )
 
-    GroupMediaController._on_player_state_changed(fake_self, "any_state")
+    GroupMediaController._on_player_state_changed(fake_self, p1, "any_state")
 
     # 2 of 3 playing → majority → True
+    assert fake_self._playing_count == 2
     assert fake_self._is_playing is True
     fake_self._update_play_button.assert_called_once_with()
+    # Only the reporting player is probed
+    p2.is_playing.assert_not_called()
+    p3.is_playing.assert_not_called()
+
+
+def test_on_player_state_changed_repeat_state_does_not_recount():
+    """A player re-reporting the state it is already in (e.g. a
+    buffering blip) must not move the count. Failure mode: counting
+    every ``playing`` signal instead of transitions drifts the count
+    upward until the button sticks on "pause" with nothing playing."""
+    p1, p2 = MagicMock(), MagicMock()
+    p1.is_playing.return_value = True
+
+    fake_self = SimpleNamespace(
+        _players=[p1, p2],
+        _player_playing={p1: True, p2: False},
+        _playing_count=1,
+        _is_playing=False,
+        _update_play_button=MagicMock(),
+    )
+
+    GroupMediaController._on_player_state_changed(fake_self, p1, "any_state")
+
+    assert fake_self._playing_count == 1
+    # 1 of 2 is not a strict majority
+    assert fake_self._is_playing is False
+
+
+def test_state_signal_reaches_handler_with_its_player(qapp):
+    """The per-player stateChanged link passes the emitting player
+    through, so the handler can count that player's transition."""
+    from PySide6.QtCore import QObject, Signal
+
+    class _Player(QObject):
+        durationChanged = Signal(int)
+        positionChanged = Signal(int)
+        stateChanged = Signal(object)
+        playing = False
+
+        def is_playing(self):
+            return self.playing
+
+        def play(self):
+            pass
+
+        def pause(self):
+            pass
+
+        def set_position(self, _ms):
+            pass
+
+        def set_volume(self, _v):
+            pass
+
+    controller = GroupMediaController(parent=None)
+    try:
+        player = _Player()
+        controller.register_player(player)
+        player.playing = True
+        player.stateChanged.emit("playing")
+        assert controller._playing_count == 1
+        assert controller._is_playing is True
+
+        controller.unregister_player(player)
+        assert controller._playing_count == 0
+    finally:
+        controller.deleteLater()
+
+
+def test_register_player_counts_a_player_already_playing():
+    """A player registered while it is already playing is counted, so
+    ``_playing_count`` matches ``sum(p.is_playing())`` from the start.
+
+    Failure mode: the player is seeded as not playing, its later pause
+    drives the count to -1 and the majority vote drifts from reality.
+    """
+    fake_player = MagicMock()
+    fake_player.is_playing.return_value = True
+    fake_self = SimpleNamespace(
+        _players=[],
+        _connections={},
+        _player_playing={},
+        _playing_count=0,
+        _on_player_duration_changed=lambda *a: None,
+        _on_player_position_changed=lambda *a: None,
+        _on_player_state_changed=lambda *a: None,
+        playRequested=MagicMock(),
+        pauseRequested=MagicMock(),
+        positionRequested=MagicMock(),
+        volumeRequested=MagicMock(),
+    )
+
+    GroupMediaController.register_player(fake_self, fake_player)
+
+    assert fake_self._player_playing[fake_player] is True
+    assert fake_self._playing_count == 1
 
 
 # ── _update_play_button / _update_volume_button (helper-backed) ──────────
@@ -112,6 +112,26 @@ class TestByteBudgetLRU:
         cache.put("x", img)
         assert cache.total_bytes >= 0
 
+    def test_re_put_replaces_size_and_promotes_key(self, qapp_m):
+        """Re-putting a key swaps its byte count and makes it MRU.
+
+        Real failure mode: keeping the old size double-counts the entry,
+        and leaving it in place evicts a just-refreshed image first.
+        """
+        small = _make_qimage(1, 1)
+        big = _make_qimage(2, 2)
+        cache = _ByteBudgetLRUCache(budget_bytes=big.sizeInBytes() + 2 * small.sizeInBytes())
+        cache.put("a", small)
+        cache.put("b", small)
+        cache.put("a", big)
+        assert cache.total_bytes == big.sizeInBytes() + small.sizeInBytes()
+
+        cache.put("c", small)
+        assert cache.get("b") is not None
+        cache.put("d", small)
+        assert cache.get("a") is None, "'a' was LRU after 'b' was read"
+        assert cache.get("b") is not None
+
     def test_clear_evicts_all_entries_and_resets_total_bytes(self, qapp_m):
         """clear() must drop every entry AND reset _total_bytes to 0 so the
         budget accountant doesn't drift. #616 — RAM not released across
@@ -187,6 +207,53 @@ class TestByteBudgetLRU:
         assert svc._preview_cache.total_bytes == 0
 
 
+class TestCacheAdmission:
+    def test_one_hit_key_does_not_evict_when_full(self, qapp_m):
+        """A key seen once is not admitted over a full budget.
+
+        Real failure mode: a single pass through a 10k-photo folder flushes
+        every thumbnail the user keeps scrolling back to.
+        """
+        cache = _ByteBudgetLRUCache(budget_bytes=8, admit_after=2)
+        cache.put("hot1", _make_qimage(1, 1))
+        cache.put("hot2", _make_qimage(1, 1))
+
+        cache.put("scan", _make_qimage(1, 1))
+        assert cache.get("scan") is None
+        assert cache.get("hot1") is not None
+        assert cache.get("hot2") is not None
+
+    def test_second_put_admits_and_evicts_lru(self, qapp_m):
+        cache = _ByteBudgetLRUCache(budget_bytes=8, admit_after=2)
+        cache.put("a", _make_qimage(1, 1))
+        cache.put("b", _make_qimage(1, 1))
+        cache.put("c", _make_qimage(1, 1))
+        cache.put("c", _make_qimage(1, 1))
+        assert cache.get("c") is not None
+        assert cache.get("a") is None
+        assert cache.total_bytes == 8
+
+    def test_free_budget_always_admits(self, qapp_m):
+        cache = _ByteBudgetLRUCache(budget_bytes=100, admit_after=3)
+        cache.put("a", _make_qimage(1, 1))
+        assert cache.get("a") is not None
+
+    def test_clear_forgets_admission_history(self, qapp_m):
+        cache = _ByteBudgetLRUCache(budget_bytes=4, admit_after=2)
+        cache.put("a", _make_qimage(1, 1))
+        cache.put("b", _make_qimage(1, 1))
+        cache.clear()
+        cache.put("a", _make_qimage(1, 1))
+        cache.put("b", _make_qimage(1, 1))
+        assert cache.get("b") is None, "history from before clear() must not count"
+
+    def test_admit_after_setting_reaches_thumb_tier_only(self, tmp_path):
+        settings = {"thumbnail_disk_cache_dir": str(tmp_path), "thumbnail_cache_admit_after": 3}
+        svc = ImageService(settings=settings)
+        assert svc._thumb_cache._admit_after == 3
+        assert svc._preview_cache._admit_after == 1
+
+
 # ── DNG embedded JPEG fast path ──────────────────────────────────────────
 
 
@@ -374,6 +441,198 @@ class TestDngEmbeddedJpegFastPath:
 # ── PREVIEW_RECIPE_VERSION disk cache path ───────────────────────────────
 
 
+class TestReaderScaledDecode:
+    """``_load_from_source`` decodes at the requested side via
+    ``QImageReader.setScaledSize`` and does not rescale the result again."""
+
+    def _load(self, tmp_path, monkeypatch, w, h, side):
+        src = tmp_path / f"src_{w}x{h}.jpg"
+        assert _make_qimage(w, h).save(str(src), "JPEG")
+        rescales: list[tuple[int, int]] = []
+
+        class _Tracked(QImage):
+            def scaled(self, *args, **kwargs):
+                rescales.append((self.width(), self.height()))
+                return super().scaled(*args, **kwargs)
+
+        real_reader = svc_mod.QImageReader
+
+        class _Reader:
+            def __init__(self, path):
+                self._r = real_reader(path)
+
+            def __getattr__(self, name):
+                return getattr(self._r, name)
+
+            def read(self):
+                return _Tracked(self._r.read())
+
+        monkeypatch.setattr(svc_mod, "QImageReader", _Reader)
+        svc = ImageService.__new__(ImageService)
+        svc._pillow_available = False
+        svc._pillow_heif_available = False
+        svc._rawpy_available = False
+        return svc._load_from_source(str(src), side), rescales
+
+    def test_large_source_is_not_rescaled_after_scaled_decode(
+        self, qapp_m, tmp_path, monkeypatch
+    ):
+        img, rescales = self._load(tmp_path, monkeypatch, 800, 400, 200)
+        assert (img.width(), img.height()) == (200, 100)
+        assert rescales == []
+
+    def test_small_source_is_still_scaled_up_to_the_side(
+        self, qapp_m, tmp_path, monkeypatch
+    ):
+        img, rescales = self._load(tmp_path, monkeypatch, 100, 50, 200)
+        assert (img.width(), img.height()) == (200, 100)
+        assert rescales == [(100, 50)]
+
+
+@pytest.mark.skipif(not svc_mod.PIL_HEIF_AVAILABLE, reason="pillow-heif not installed")
+class TestHeifDirectDecode:
+    """HEIC decodes through libheif's buffer, not via a PIL image + tobytes()."""
+
+    def _service(self):
+        svc = ImageService.__new__(ImageService)
+        svc._pillow_available = True
+        svc._pillow_heif_available = True
+        svc._rawpy_available = False
+        return svc
+
+    def _write_heic(self, tmp_path, size, exif=None):
+        from PIL import Image
+
+        path = tmp_path / "photo.heic"
+        kwargs = {"exif": exif} if exif is not None else {}
+        Image.new("RGB", size, (255, 0, 0)).save(path, **kwargs)
+        return path
+
+    def test_heic_skips_the_pillow_conversion(self, qapp_m, tmp_path):
+        """Failure mode: routing HEIC back through `_pil_to_qimage` re-adds
+        the full-frame `tobytes()` copy this path exists to avoid."""
+        path = self._write_heic(tmp_path, (64, 32))
+        svc = self._service()
+        with patch.object(svc, "_pil_to_qimage") as pil_convert:
+            img = svc._load_from_source(str(path), 0)
+        pil_convert.assert_not_called()
+        assert (img.width(), img.height()) == (64, 32)
+        assert img.pixelColor(10, 10).red() > 240
+
+    def test_orientation_is_applied_and_side_is_honoured(self, qapp_m, tmp_path):
+        from PIL import Image
+
+        exif = Image.Exif()
+        exif[0x0112] = 6  # rotate 90° CW
+        path = self._write_heic(tmp_path, (64, 32), exif=exif.tobytes())
+        img = self._service()._load_via_heif(str(path), 16)
+        assert (img.width(), img.height()) == (8, 16)
+
+    def _write_heic_with_thumbnails(self, tmp_path, boxes):
+        import pillow_heif
+        from PIL import Image
+
+        path = tmp_path / "thumbs.heic"
+        pillow_heif.from_pillow(Image.new("RGB", (800, 400), (255, 0, 0))).save(
+            path, thumbnails=boxes
+        )
+        return path
+
+    def test_embedded_thumbnail_is_decoded_instead_of_the_primary(
+        self, qapp_m, tmp_path, monkeypatch
+    ):
+        """Failure mode: decoding the full frame for a small preview costs the
+        whole HEVC decode even though a large-enough thumbnail is embedded."""
+        path = self._write_heic_with_thumbnails(tmp_path, [64, 256])
+        wrapped = []
+        real_qimage = svc_mod.QImage
+
+        def _spy(data, width, height, stride, fmt):
+            wrapped.append((width, height))
+            return real_qimage(data, width, height, stride, fmt)
+
+        monkeypatch.setattr(svc_mod, "QImage", _spy)
+        img = self._service()._load_via_heif(str(path), 200)
+        assert wrapped == [(256, 128)]
+        assert (img.width(), img.height()) == (200, 100)
+
+    def test_primary_is_decoded_when_no_thumbnail_is_large_enough(
+        self, qapp_m, tmp_path
+    ):
+        path = self._write_heic_with_thumbnails(tmp_path, [64])
+        svc = self._service()
+        assert svc._load_via_heif(str(path), 300).size().toTuple() == (300, 150)
+        assert svc._load_via_heif(str(path), 0).size().toTuple() == (800, 400)
+
+
+class TestExifOrientationOnQImage:
+    """Pillow loads rotate the downscaled QImage, not the full-res frame."""
+
+    @staticmethod
+    def _pixels(img):
+        return [
+            [img.pixelColor(x, y).red() for x in range(img.width())]
+            for y in range(img.height())
+        ]
+
+    @staticmethod
+    def _source():
+        from PIL import Image
+
+        im = Image.new("RGB", (3, 2))
+        for i, xy in enumerate([(0, 0), (1, 0), (2, 0), (0, 1), (1, 1), (2, 1)]):
+            im.putpixel(xy, (i * 40, 0, 0))
+        return im
+
+    @pytest.mark.parametrize("orientation", range(1, 9))
+    def test_matches_pillow_exif_transpose(self, qapp_m, orientation):
+        from PIL import ImageOps
+
+        src = self._source()
+        exif = src.getexif()
+        exif[0x0112] = orientation
+        src.info["exif"] = exif.tobytes()
+        expected = ImageOps.exif_transpose(src)
+
+        svc = ImageService.__new__(ImageService)
+        img = svc_mod._apply_exif_orientation(svc._pil_to_qimage(src), orientation)
+        assert self._pixels(img) == self._pixels(svc._pil_to_qimage(expected))
+        assert img.format() == QImage.Format_RGB888
+
+    def test_pillow_load_skips_full_resolution_transpose(self, qapp_m, tmp_path):
+        """Failure mode: exif_transpose on the decoded frame copies every
+        full-resolution pixel before thumbnail() throws most of them away."""
+        from PIL import Image
+
+        path = tmp_path / "portrait.jpg"
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        Image.new("RGB", (400, 200), (0, 0, 255)).save(path, exif=exif.tobytes())
+
+        svc = ImageService.__new__(ImageService)
+        svc._pillow_available = True
+        with patch.object(svc_mod.ImageOps, "exif_transpose") as transpose:
+            img = svc._load_via_pillow(str(path), 100)
+        transpose.assert_not_called()
+        assert (img.width(), img.height()) == (50, 100)
+
+
+class TestCacheKeyMemo:
+    def test_repeat_key_is_hashed_once_and_unchanged(self):
+        """A repeated (path, side) lookup reuses the memoised digest.
+
+        Real failure mode: the memo changing the key format would orphan
+        every file already in the disk cache.
+        """
+        _compute_cache_key.cache_clear()
+        expected = hashlib.sha1(b"/fake/memo.jpg|128").hexdigest()
+        with patch.object(svc_mod.hashlib, "sha1", wraps=hashlib.sha1) as sha1:
+            first = _compute_cache_key("/fake/memo.jpg", 128)
+            second = _compute_cache_key("/fake/memo.jpg", 128)
+        assert first == second == expected
+        assert sha1.call_count == 1
+
+
 class TestPreviewRecipeVersion:
     def test_disk_cache_path_under_version_dir(self, tmp_path):
         """The disk cache file must live under the versioned sub-directory.
@@ -406,6 +665,27 @@ class TestPreviewRecipeVersion:
             f"Disk cache file must be written to versioned path {expected_path}"
         )
 
+    def test_disk_hit_decodes_without_exists_probe(self, tmp_path):
+        """A disk-cache hit is served by decoding the file straight away.
+
+        Real failure mode: an exists() probe before the decode adds a stat
+        syscall to every warm-cache thumbnail on a scrolled grid.
+        """
+        svc = ImageService.__new__(ImageService)
+        svc._versioned_disk_path = tmp_path
+        svc._thumb_cache = _ByteBudgetLRUCache(100_000)
+        svc._preview_cache = _ByteBudgetLRUCache(100_000)
+        key = _compute_cache_key("/fake/warm.jpg", 128)
+        cached = QImage(32, 32, QImage.Format_RGB32)
+        cached.fill(0xFF3366CC)
+        assert cached.save(str(tmp_path / f"{key}.jpg"), "JPEG")
+
+        with patch.object(Path, "exists", side_effect=AssertionError("stat")), \
+                patch.object(svc, "_load_from_source") as mock_load:
+            img = svc._get_image("/fake/warm.jpg", 128)
+        mock_load.assert_not_called()
+        assert (img.width(), img.height()) == (32, 32)
+
     def test_legacy_thumbs_wiped_on_first_launch(self, tmp_path):
         """Legacy .jpg files directly under thumbs/ (not under v1/) are
         deleted when ImageService is initialised.
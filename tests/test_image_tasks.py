@@ -240,20 +240,20 @@ class TestRequestGridThumbnail:
 
     def test_returns_token_with_thumb_side(self):
         runner = ImageTaskRunner(service=MagicMock(), receiver=MagicMock())
-        runner._pool = MagicMock()
+        runner._thumb_pool = MagicMock()
 
         token = runner.request_grid_thumbnail("a.jpg", 256)
 
-        assert token == "grid|a.jpg|256"
+        assert token == "grid|0|a.jpg|256"
 
     def test_service_none_returns_token_without_starting_task(self):
         runner = ImageTaskRunner(service=None, receiver=MagicMock())
-        runner._pool = MagicMock()
+        runner._thumb_pool = MagicMock()
 
         token = runner.request_grid_thumbnail("a.jpg", 128)
 
-        assert token == "grid|a.jpg|128"
-        runner._pool.start.assert_not_called()
+        assert token == "grid|0|a.jpg|128"
+        runner._thumb_pool.start.assert_not_called()
 
     def test_dispatches_thumbnail_task_with_is_preview_false(self):
         """Failure mode: a refactor that flipped ``is_preview=True``
@@ -264,14 +264,40 @@ class TestRequestGridThumbnail:
         service = MagicMock()
         receiver = MagicMock()
         runner = ImageTaskRunner(service=service, receiver=receiver)
-        runner._pool = MagicMock()
+        runner._thumb_pool = MagicMock()
 
         runner.request_grid_thumbnail("a.jpg", 128)
 
-        task = runner._pool.start.call_args.args[0]
+        task = runner._thumb_pool.start.call_args.args[0]
         assert task._is_preview is False
         assert task._side == 128
 
+    def test_thumbnails_bypass_the_global_pool(self):
+        """Images go to the capped decode pool, videos to the serial
+        video pool; the global pool stays free for the single preview.
+
+        Failure mode: dispatching a large group's tiles to the global
+        pool starts one decode per core and queues the user's next
+        single-image preview behind all of them."""
+        runner = ImageTaskRunner(service=MagicMock(), receiver=MagicMock())
+        runner._pool = MagicMock()
+        runner._thumb_pool = MagicMock()
+        runner._video_thumb_pool = MagicMock()
+
+        runner.request_grid_thumbnail("a.jpg", 128)
+        runner.request_grid_thumbnail("b.mp4", 128)
+
+        runner._pool.start.assert_not_called()
+        assert runner._thumb_pool.start.call_args.args[0]._path == "a.jpg"
+        assert runner._video_thumb_pool.start.call_args.args[0]._path == "b.mp4"
+
+    def test_pool_thread_caps(self):
+        from app.views.image_tasks import _GRID_THUMB_THREADS
+
+        runner = ImageTaskRunner(service=MagicMock(), receiver=MagicMock())
+        assert 1 <= runner._thumb_pool.maxThreadCount() <= _GRID_THUMB_THREADS
+        assert runner._video_thumb_pool.maxThreadCount() == 1
+
 
 # ── _ResolutionTask + request_resolution (#622 Phase 1) ──────────────────
 
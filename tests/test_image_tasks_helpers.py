@@ -3,14 +3,17 @@
 Covers the token-format helpers extracted from
 :mod:`app.views.image_tasks` (#293). The token is the bridge
 contract between :class:`ImageTaskRunner` (producer) and
-:func:`app.views.preview_pane_helpers.classify_image_token`
-(consumer); both ends must agree on the ``"single|"`` / ``"grid|"``
-prefix or every in-flight image load silently drops.
+``PreviewPane.on_image_loaded`` (consumer, exact-match routing); the
+``"single|"`` / ``"grid|"`` prefixes keep the two token spaces apart.
 """
 
 from __future__ import annotations
 
-from app.views.image_tasks_helpers import make_grid_token, make_single_token
+from app.views.image_tasks_helpers import (
+    make_grid_token,
+    make_single_token,
+    token_side,
+)
 
 
 # ── make_single_token ────────────────────────────────────────────────────
@@ -33,17 +36,15 @@ class TestMakeSingleToken:
     def test_path_with_pipe_passes_through(self):
         """Pipe characters in paths are unusual but not impossible
         (some NAS shares). The token format is what it is — the
-        classifier on the consumer side only checks the first
-        segment, so an embedded pipe is parsed correctly enough
-        for routing. This test pins the verbatim behaviour."""
+        consumer routes by exact match, so an embedded pipe does
+        not affect routing. This test pins the verbatim behaviour."""
         assert make_single_token("a|b.jpg", side=0) == "single|a|b.jpg|0"
 
-    def test_starts_with_single_prefix_for_classifier(self):
-        """The consumer (``classify_image_token``) splits on the
-        first ``|`` and matches the first segment. Failure mode: a
-        refactor that changed the prefix to ``"sgl"`` would break
-        the classifier and every single-preview load would silently
-        drop on arrival."""
+    def test_starts_with_single_prefix(self):
+        """The ``single|`` prefix keeps single tokens out of the grid
+        token space the consumer looks up first. Failure mode: a
+        refactor that dropped the prefixes could let a single token
+        equal a grid token and route a preview into a tile."""
         assert make_single_token("any.jpg").startswith("single|")
 
 
@@ -54,13 +55,12 @@ class TestMakeGridToken:
     """The grid-thumbnail token format."""
 
     def test_format(self):
-        """Three pipe-separated segments: ``grid``, path, side."""
-        assert make_grid_token("photos/a.jpg", 256) == "grid|photos/a.jpg|256"
+        """Four pipe-separated segments: ``grid``, generation, path, side."""
+        assert make_grid_token("photos/a.jpg", 256) == "grid|0|photos/a.jpg|256"
+        assert make_grid_token("photos/a.jpg", 256, 7) == "grid|7|photos/a.jpg|256"
 
-    def test_starts_with_grid_prefix_for_classifier(self):
-        """Same producer/consumer pairing as the single case —
-        ``"grid|"`` is the prefix ``classify_image_token`` matches
-        on."""
+    def test_starts_with_grid_prefix(self):
+        """Same disjointness as the single case, from the grid side."""
         assert make_grid_token("a.jpg", 128).startswith("grid|")
 
     def test_token_differs_from_single_for_same_path(self):
@@ -69,3 +69,20 @@ class TestMakeGridToken:
         which view requested the load. The prefix is the entire
         disambiguator."""
         assert make_single_token("a.jpg", 256) != make_grid_token("a.jpg", 256)
+
+
+# ── token_side ───────────────────────────────────────────────────────────
+
+
+class TestTokenSide:
+    """Inverse of the trailing side segment."""
+
+    def test_round_trips_grid_token(self):
+        assert token_side(make_grid_token("C:/a.jpg", 384)) == 384
+
+    def test_path_with_pipe_still_parses(self):
+        assert token_side(make_grid_token("a|b.jpg", 256)) == 256
+
+    def test_malformed_token_returns_zero(self):
+        assert token_side("grid") == 0
+        assert token_side("grid|a.jpg|big") == 0
@@ -1018,6 +1018,93 @@ class TestLoadFromDB:
         rec = next(r for r in records if r.file_path == str(f))
         assert rec.file_size_bytes == os.path.getsize(str(f))
 
+    def test_filesystem_fallback_reads_overlap_and_keep_row_order(self, tmp_path, monkeypatch):
+        """Old-manifest rows go through the thread pool; records still come
+        back in row order, and a row whose build fails is skipped alone."""
+        import threading
+
+        import infrastructure.manifest_repository as mr
+
+        threads: set[int] = set()
+        real_record = mr._photo_record
+
+        def _record(*args):
+            threads.add(threading.get_ident())
+            if args[0].endswith("bad.jpg"):
+                raise ValueError("unreadable")
+            return real_record(*args)
+
+        monkeypatch.setattr(mr, "_photo_record", _record)
+        names = ["a.jpg", "bad.jpg", "c.jpg", "d.jpg"]
+        db = _make_manifest(tmp_path, [
+            self._row_with_metadata(str(tmp_path / n), group_id="/group/a", file_size_bytes=1)
+            for n in names
+        ], ddl=_DDL_WITH_METADATA)
+
+        records = list(ManifestRepository().load(str(db)))
+
+        assert [Path(r.file_path).name for r in records] == ["a.jpg", "c.jpg", "d.jpg"]
+        assert threading.get_ident() not in threads
+
+    def test_only_uncached_rows_go_to_the_pool(self, tmp_path, monkeypatch):
+        """In a mixed manifest the cached rows are built on the calling
+        thread and only the rows needing a filesystem read are pooled;
+        records still come back in row order."""
+        import threading
+
+        import infrastructure.manifest_repository as mr
+
+        built_on: dict[str, int] = {}
+        real_record = mr._photo_record
+
+        def _record(*args):
+            built_on[Path(args[0]).name] = threading.get_ident()
+            return real_record(*args)
+
+        monkeypatch.setattr(mr, "_photo_record", _record)
+        cached = {
+            "file_size_bytes": 100,
+            "creation_date": "2023-01-01T00:00:00",
+            "mtime": "2023-01-01T00:00:00",
+        }
+        names = ["a.jpg", "b.jpg", "c.jpg", "d.jpg"]
+        db = _make_manifest(tmp_path, [
+            self._row_with_metadata(
+                str(tmp_path / n),
+                group_id="/group/a",
+                **(cached if n in ("a.jpg", "c.jpg") else {"file_size_bytes": 1}),
+            )
+            for n in names
+        ], ddl=_DDL_WITH_METADATA)
+
+        records = list(ManifestRepository().load(str(db)))
+
+        assert [Path(r.file_path).name for r in records] == names
+        main = threading.get_ident()
+        assert built_on["a.jpg"] == main and built_on["c.jpg"] == main
+        assert built_on["b.jpg"] != main and built_on["d.jpg"] != main
+
+    def test_cached_metadata_builds_records_without_a_pool(self, tmp_path, monkeypatch):
+        """A manifest with every field cached never starts worker threads."""
+        import infrastructure.manifest_repository as mr
+
+        def _no_pool(*a, **k):
+            raise AssertionError("thread pool started for a fully cached manifest")
+
+        monkeypatch.setattr(mr, "ThreadPoolExecutor", _no_pool)
+        db = _make_manifest(tmp_path, [
+            self._row_with_metadata(
+                str(tmp_path / n),
+                group_id="/group/a",
+                file_size_bytes=100,
+                creation_date="2023-01-01T00:00:00",
+                mtime="2023-01-01T00:00:00",
+            )
+            for n in ("a.jpg", "b.jpg")
+        ], ddl=_DDL_WITH_METADATA)
+
+        assert len(list(ManifestRepository().load(str(db)))) == 2
+
     def test_load_skips_no_existence_check(self, tmp_path):
         """Nonexistent files must be yielded — existence check moved to execute time."""
         f2 = tmp_path / "real.jpg"
@@ -1674,6 +1761,36 @@ class TestDropMoveDestPathMigration:
             ).fetchone()[0]
         assert count == 3
 
+    def test_current_schema_issues_no_alter(self, tmp_path, monkeypatch):
+        """Failure mode: ``load()`` re-running one failing ALTER TABLE per
+        migration on every open of an already-current manifest."""
+        import infrastructure.manifest_repository as mr
+
+        db = self._old_db(tmp_path)
+        repo = ManifestRepository()
+        repo.ensure_schema(str(db))
+
+        statements: list[str] = []
+        real_connect = mr._connect
+
+        class _Traced:
+            def __init__(self, conn):
+                self._conn = conn
+
+            def execute(self, sql, *args):
+                statements.append(sql)
+                return self._conn.execute(sql, *args)
+
+            def __getattr__(self, name):
+                return getattr(self._conn, name)
+
+        def _traced(path):
+            return _Traced(real_connect(path))
+
+        monkeypatch.setattr(mr, "_connect", _traced)
+        repo.ensure_schema(str(db))
+        assert not [s for s in statements if s.lstrip().upper().startswith("ALTER")]
+
     def test_load_after_migration_yields_grouped_rows(self, tmp_path):
         """End-to-end: load() (which calls ensure_schema) on a legacy DB
         surfaces the migrated group with the survivor row's action now ''."""
@@ -67,6 +67,15 @@ class TestFormatDuration:
     def test_sub_second_truncates(self):
         assert format_duration(999) == "00:00"  # < 1s
 
+    def test_ticks_within_one_second_share_one_format(self):
+        """Positions inside the same second reuse the cached text."""
+        from app.views.media_utils import _format_seconds
+
+        _format_seconds.cache_clear()
+        assert {format_duration(ms) for ms in range(61_000, 62_000, 33)} == {"01:01"}
+        info = _format_seconds.cache_info()
+        assert (info.misses, info.currsize) == (1, 1)
+
 
 class TestNormalizeWindowsPath:
     def test_forward_slashes_become_backslashes(self):
@@ -30,9 +30,9 @@ helper module + one real-construction test + fake-self
   ``compute_grid_geometry``, ``build_info_rows``) are pinned at L1
   via the helper tests + the grid-config tests below; the actual
   ``QGridLayout`` walk + tile placement is covered by L3 (s01).
-* ``resizeEvent`` body — large method whose entire surface is Qt
-  geometry adjustment; covered by L3 (s05 / s39 — preview pane
-  geometry round-trip).
+* ``_on_resize_settled`` geometry itself — Qt geometry adjustment;
+  covered by L3 (s05 / s39 — preview pane geometry round-trip). The
+  debounce and the tile-preserving relayout are pinned below.
 """
 
 from __future__ import annotations
@@ -42,6 +42,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from app.views.image_tasks_helpers import make_grid_token, token_side
 from app.views.preview_pane import PreviewPane
 
 
@@ -158,6 +159,7 @@ def test_on_image_loaded_single_token_with_mismatched_current_is_ignored():
     fake_label = MagicMock()
     fake_self = SimpleNamespace(
         _current_single_token="single|/B.jpg",  # user is on B
+        _grid_labels={},
         _single_label=fake_label,
         _single_pm=None,
         _apply_single_pixmap_fit=MagicMock(),
@@ -184,6 +186,7 @@ def test_on_image_loaded_single_with_none_image_shows_failed():
     fake_label = MagicMock()
     fake_self = SimpleNamespace(
         _current_single_token="single|/A.jpg",
+        _grid_labels={},
         _single_label=fake_label,
         _single_pm=None,
         _apply_single_pixmap_fit=MagicMock(),
@@ -214,7 +217,7 @@ def test_on_image_loaded_grid_with_unknown_token_is_ignored():
     )
 
     # Must not raise
-    PreviewPane.on_image_loaded(fake_self, "grid|/x.jpg", "/x.jpg", MagicMock())
+    PreviewPane.on_image_loaded(fake_self, "grid|0|/x.jpg|128", "/x.jpg", MagicMock())
 
 
 def test_on_image_loaded_unknown_prefix_is_ignored():
@@ -222,9 +225,9 @@ def test_on_image_loaded_unknown_prefix_is_ignored():
     future ``"hover|…"`` route added before the dispatcher knows
     about it) is ignored — no crash, no display side-effect.
 
-    Pinned via the helper-routed classifier so a future refactor
-    that adds a 3rd prefix without updating ``on_image_loaded``
-    fails gracefully.
+    Pinned via the exact-match routing (grid registry, then the
+    current single token) so a future refactor that adds a 3rd
+    prefix without updating ``on_image_loaded`` fails gracefully.
     """
     fake_label = MagicMock()
     fake_self = SimpleNamespace(
@@ -326,11 +329,406 @@ def test_clear_resets_state_on_a_fresh_pane(qapp):
         pane.deleteLater()
 
 
+# ── deferred grid tile construction ──────────────────────────────────────
+
+
+def _grid_runner() -> MagicMock:
+    """Runner stub whose grid tokens are unique per path, like the real
+    ``make_grid_token`` — a bare MagicMock returns one shared token."""
+    runner = MagicMock()
+    runner.request_grid_thumbnail.side_effect = make_grid_token
+    return runner
+
+
+def test_show_grid_builds_visible_tiles_first_then_the_rest(qapp):
+    """``show_grid`` returns after building one viewport's worth of
+    tiles; the remainder lands on later event-loop turns.
+
+    Failure mode: a refactor that drops the deferral rebuilds every
+    tile synchronously (the 500-tile stall), or one that drops the
+    re-scheduling leaves the tail of a large group permanently blank.
+    """
+    pane = PreviewPane(parent=None, task_runner=_grid_runner())
+    try:
+        items = [(f"img{i}.jpg", f"img{i}", "/f", "100") for i in range(200)]
+        pane.show_grid(items)
+        built_now = len(pane._grid_tile_labels)
+        assert 0 < built_now < len(items)
+
+        for _ in range(400):
+            if len(pane._grid_tile_labels) == len(items):
+                break
+            qapp.processEvents()
+        assert len(pane._grid_tile_labels) == len(items)
+    finally:
+        pane.deleteLater()
+
+
+def test_grid_requests_thumbnails_only_for_visible_tiles(qapp, monkeypatch):
+    """Every tile is built, but only the rows in (or just below) the
+    viewport queue a decode; scrolling requests the newly visible ones.
+
+    Failure mode: requesting at build time decodes a whole long group
+    even when the user never scrolls past the first screen.
+    """
+    runner = _grid_runner()
+    pane = PreviewPane(parent=None, task_runner=runner)
+    try:
+        pane.resize(400, 300)
+        monkeypatch.setattr(pane, "_compute_grid_geometry", lambda: (2, 100))
+        pane.show_grid([(f"img{i}.jpg", f"img{i}", "/f", "100") for i in range(60)])
+        for _ in range(100):
+            if len(pane._grid_tile_labels) == 60:
+                break
+            qapp.processEvents()
+        requested = {c.args[0] for c in runner.request_grid_thumbnail.call_args_list}
+        assert "img0.jpg" in requested
+        assert "img59.jpg" not in requested
+        assert pane._grid_tile_tokens[59] == ""
+
+        from app.views import preview_pane as pp
+
+        monkeypatch.setattr(pp, "visible_tile_range", lambda **_kw: (58, 60))
+        pane.preview_area.verticalScrollBar().valueChanged.emit(1)
+        assert pane._grid_tile_tokens[59] == make_grid_token(
+            "img59.jpg", 100, pane._grid_build_generation
+        )
+    finally:
+        pane.deleteLater()
+
+
+def test_grid_tiles_share_a_cached_placeholder_pixmap(qapp, monkeypatch):
+    """Unloaded tiles show one shared gray placeholder, not per-tile
+    "Loading…" text; the cache keeps only a few sides."""
+    from app.views import preview_pane as pp
+
+    pane = PreviewPane(parent=None, task_runner=_grid_runner())
+    try:
+        monkeypatch.setattr(pane, "_compute_grid_geometry", lambda: (2, 120))
+        pane.show_grid([("a.jpg", "a", "/f", "1"), ("b.jpg", "b", "/f", "1")])
+        a, b = pane._grid_tile_labels
+        assert a.text() == "" and b.text() == ""
+        assert a.pixmap().cacheKey() == b.pixmap().cacheKey()
+        assert a.pixmap().cacheKey() == pp._placeholder_pixmap(120).cacheKey()
+
+        for side in range(10, 10 + 2 * pp._PLACEHOLDER_CACHE_MAX):
+            pp._placeholder_pixmap(side)
+        assert len(pp._PLACEHOLDER_CACHE) <= pp._PLACEHOLDER_CACHE_MAX
+    finally:
+        pane.deleteLater()
+
+
+def test_clear_orphans_queued_grid_batches(qapp):
+    """A batch queued before ``clear()`` must not build tiles into the
+    torn-down grid."""
+    pane = PreviewPane(parent=None, task_runner=_grid_runner())
+    try:
+        pane.show_grid([(f"img{i}.jpg", f"img{i}", "/f", "100") for i in range(200)])
+        pane.clear()
+        for _ in range(20):
+            qapp.processEvents()
+        assert pane._grid_labels == {}
+    finally:
+        pane.deleteLater()
+
+
+def test_resize_relayouts_existing_tiles_without_rebuilding(qapp, monkeypatch):
+    """A column-count change re-places the same tile widgets; a tile
+    with a decoded thumbnail is rescaled, not re-requested, when its
+    cell shrinks.
+
+    Failure mode: a resize that tears the grid down re-creates every
+    widget and re-queues one decode per tile on each resize tick.
+    """
+    from PySide6.QtGui import QImage, QResizeEvent
+
+    runner = _grid_runner()
+    pane = PreviewPane(parent=None, task_runner=runner)
+    try:
+        monkeypatch.setattr(pane, "_compute_grid_geometry", lambda: (3, 200))
+        pane.show_grid([(f"img{i}.jpg", f"img{i}", "/f", "100") for i in range(4)])
+        tiles = list(pane._grid_tile_labels)
+        infos = list(pane._grid_info_labels)
+        token0 = pane._grid_tile_tokens[0]
+        image = QImage(200, 150, QImage.Format_RGB32)
+        pane.on_image_loaded(token0, "img0.jpg", image)
+        requests_before = runner.request_grid_thumbnail.call_count
+
+        monkeypatch.setattr(pane, "_compute_grid_geometry", lambda: (2, 180))
+        pane.resizeEvent(QResizeEvent(pane.size(), pane.size()))
+        pane._on_resize_settled()
+
+        assert pane._grid_tile_labels == tiles
+        assert pane._grid_info_labels == infos
+
+        def _pos(widget):
+            return pane._grid_layout.getItemPosition(pane._grid_layout.indexOf(widget))[:2]
+
+        assert [_pos(t) for t in tiles] == [(0, 0), (0, 1), (2, 0), (2, 1)]
+        assert [_pos(t) for t in infos] == [(1, 0), (1, 1), (3, 0), (3, 1)]
+        assert pane._grid_tile_labels[0].width() == 180
+        assert runner.request_grid_thumbnail.call_count == requests_before
+        assert pane._grid_tile_tokens[0] == token0
+    finally:
+        pane.deleteLater()
+
+
+def test_thumbnail_from_a_previous_grid_build_is_dropped(qapp, monkeypatch):
+    """A decode requested before clear() / a re-show carries the old
+    build generation and is discarded before pixmap conversion, even
+    when the new grid requested the same path at the same size.
+
+    Failure mode: without the generation the stale result shares the
+    new tile's token and gets converted and painted a second time.
+    """
+    from PySide6.QtGui import QImage
+
+    from app.views import preview_pane as pp
+
+    runner = _grid_runner()
+    pane = PreviewPane(parent=None, task_runner=runner)
+    try:
+        monkeypatch.setattr(pane, "_compute_grid_geometry", lambda: (2, 200))
+        items = [("a.jpg", "a", "/f", "100")]
+        pane.show_grid(items)
+        stale = pane._grid_tile_tokens[0]
+        pane.clear()
+        pane.show_grid(items)
+        fresh = pane._grid_tile_tokens[0]
+        assert stale != fresh and token_side(stale) == token_side(fresh)
+
+        conversions: list[int] = []
+        real_from_image = pp.QPixmap.fromImage
+        monkeypatch.setattr(
+            pp.QPixmap,
+            "fromImage",
+            staticmethod(lambda img: conversions.append(1) or real_from_image(img)),
+        )
+        pane.on_image_loaded(stale, "a.jpg", QImage(200, 200, QImage.Format_RGB32))
+        assert conversions == []
+        assert fresh not in pane._grid_pixmaps
+
+        pane.on_image_loaded(fresh, "a.jpg", QImage(200, 200, QImage.Format_RGB32))
+        assert conversions == [1]
+        assert fresh in pane._grid_pixmaps
+    finally:
+        pane.deleteLater()
+
+
+def test_resize_redecodes_only_when_cell_outgrows_thumbnail(qapp, monkeypatch):
+    from PySide6.QtGui import QImage, QResizeEvent
+
+    runner = _grid_runner()
+    pane = PreviewPane(parent=None, task_runner=runner)
+    try:
+        monkeypatch.setattr(pane, "_compute_grid_geometry", lambda: (2, 200))
+        pane.show_grid([("a.jpg", "a", "/f", "100")])
+        old_token = pane._grid_tile_tokens[0]
+        pane.on_image_loaded(old_token, "a.jpg", QImage(200, 200, QImage.Format_RGB32))
+
+        monkeypatch.setattr(pane, "_compute_grid_geometry", lambda: (1, 400))
+        pane.resizeEvent(QResizeEvent(pane.size(), pane.size()))
+        pane._on_resize_settled()
+
+        new_token = pane._grid_tile_tokens[0]
+        assert token_side(new_token) == 400
+        assert old_token not in pane._grid_labels
+        assert pane._grid_labels[new_token] is pane._grid_tile_labels[0]
+    finally:
+        pane.deleteLater()
+
+
+def test_resize_burst_is_coalesced_into_one_relayout(qapp, monkeypatch):
+    """A burst of resize events (splitter drag) relayouts the grid once,
+    after the debounce interval — not once per event."""
+    from PySide6.QtGui import QResizeEvent
+
+    pane = PreviewPane(parent=None, task_runner=_grid_runner())
+    try:
+        monkeypatch.setattr(pane, "_compute_grid_geometry", lambda: (3, 200))
+        pane.show_grid([("a.jpg", "a", "/f", "100")])
+        relayouts: list[tuple[int, int]] = []
+        monkeypatch.setattr(pane, "_relayout_grid", lambda c, s: relayouts.append((c, s)))
+        monkeypatch.setattr(pane, "_compute_grid_geometry", lambda: (2, 180))
+
+        for _ in range(10):
+            pane.resizeEvent(QResizeEvent(pane.size(), pane.size()))
+        assert relayouts == []
+        assert pane._resize_timer.isActive()
+
+        pane._resize_timer.timeout.emit()
+        assert relayouts == [(2, 180)]
+    finally:
+        pane.deleteLater()
+
+
+def test_reshowing_a_group_paints_cached_thumbnails_without_requests(qapp, monkeypatch):
+    """Thumbnails decoded for a group are painted synchronously when the
+    group is shown again, even after clear(); nothing is re-queued.
+
+    Failure mode: without the cross-selection cache every return to a
+    group flashes "Loading…" and round-trips each tile through the
+    thread pool again.
+    """
+    from PySide6.QtGui import QImage
+
+    runner = _grid_runner()
+    pane = PreviewPane(parent=None, task_runner=runner)
+    try:
+        monkeypatch.setattr(pane, "_compute_grid_geometry", lambda: (2, 200))
+        items = [("a.jpg", "a", "/f", "100"), ("b.jpg", "b", "/f", "100")]
+        pane.show_grid(items)
+        pane.on_image_loaded(
+            pane._grid_tile_tokens[0], "a.jpg", QImage(200, 150, QImage.Format_RGB32)
+        )
+        pane.clear()
+        runner.request_grid_thumbnail.reset_mock()
+
+        # A few pixels off still lands in the same cache bucket.
+        monkeypatch.setattr(pane, "_compute_grid_geometry", lambda: (2, 205))
+        pane.show_grid(items)
+
+        runner.request_grid_thumbnail.assert_called_once_with(
+            "b.jpg", 205, pane._grid_build_generation
+        )
+        lbl_a = pane._grid_tile_labels[0]
+        assert lbl_a.pixmap() is not None and not lbl_a.pixmap().isNull()
+        assert pane._grid_labels[pane._grid_tile_tokens[0]] is lbl_a
+    finally:
+        pane.deleteLater()
+
+
+def test_grid_tiles_have_no_per_tile_container(qapp):
+    """Thumbnail and info labels sit directly in the grid layout, the
+    info label one grid row below its thumbnail.
+
+    Failure mode: re-introducing a QWidget + QVBoxLayout wrapper per
+    tile doubles the QObjects a large group allocates.
+    """
+    pane = PreviewPane(parent=None, task_runner=_grid_runner())
+    try:
+        pane.show_grid([("a.jpg", "a", "/f", "100")])
+        thumb = pane._grid_tile_labels[0]
+        info = pane._grid_info_labels[0]
+        assert thumb.parentWidget() is pane._grid_container
+        assert info.parentWidget() is pane._grid_container
+        assert info.objectName() == "info_label"
+        layout = pane._grid_layout
+        assert layout.getItemPosition(layout.indexOf(thumb))[:2] == (0, 0)
+        assert layout.getItemPosition(layout.indexOf(info))[:2] == (1, 0)
+    finally:
+        pane.deleteLater()
+
+
+def test_grid_info_html_is_built_once_per_item(qapp, monkeypatch):
+    """Re-showing the same group reuses each tile's info HTML."""
+    from app.views import preview_pane as pp
+
+    renders: list[int] = []
+    real_format = pp.format_info_html
+    monkeypatch.setattr(
+        pp, "format_info_html", lambda rows: renders.append(1) or real_format(rows)
+    )
+    pane = PreviewPane(parent=None, task_runner=_grid_runner())
+    try:
+        monkeypatch.setattr(pane, "_compute_grid_geometry", lambda: (2, 200))
+        items = [("a.jpg", "a", "/f", "100"), ("b.mp4", "b", "/f", "200")]
+        pane.show_grid(items)
+        first = [lbl.text() for lbl in pane._grid_info_labels]
+        pane.show_grid(items)
+        assert len(renders) == 2
+        assert [lbl.text() for lbl in pane._grid_info_labels] == first
+    finally:
+        pane.deleteLater()
+
+
+def test_show_grid_reuses_dims_and_sizes_for_the_same_group(qapp, monkeypatch):
+    """Re-showing the same group reads each image header and stats each
+    video once; a different group starts from empty caches.
+
+    Failure mode: dropping the cache re-opens a QImageReader per image
+    and hits the filesystem per video on every re-selection.
+    """
+    from app.views import preview_pane as pp
+
+    dim_reads: list[str] = []
+    size_reads: list[str] = []
+    monkeypatch.setattr(
+        pp, "_read_image_dims", lambda p: dim_reads.append(p) or (40, 30)
+    )
+    monkeypatch.setattr(
+        pp, "get_file_size_bytes", lambda p: size_reads.append(p) or 10
+    )
+    pane = PreviewPane(parent=None, task_runner=_grid_runner())
+    try:
+        items = [("a.jpg", "a", "/f", "1"), ("b.mp4", "b", "/f", "1")]
+        pane.show_grid(items)
+        pane.show_grid(items)
+        assert dim_reads == ["a.jpg"]
+        assert size_reads == ["b.mp4"]
+        assert pane._grid_items[1][6] == "40*30"
+
+        pane.show_grid([("c.jpg", "c", "/f", "1")])
+        assert dim_reads == ["a.jpg", "c.jpg"]
+        assert set(pane._grid_dims_cache) == {"c.jpg"}
+    finally:
+        pane.deleteLater()
+
+
+def test_show_grid_classifies_each_path_once(qapp, monkeypatch):
+    """``is_video`` runs once per path in ``show_grid``; the sort, the
+    tile build and the info HTML read the ``_grid_is_video`` column."""
+    from app.views import preview_pane as pp
+
+    calls: list[str] = []
+    real_is_video = pp.is_video
+    monkeypatch.setattr(pp, "is_video", lambda p: calls.append(p) or real_is_video(p))
+    pane = PreviewPane(parent=None, task_runner=_grid_runner())
+    try:
+        monkeypatch.setattr(pane, "_compute_grid_geometry", lambda: (2, 200))
+        pane.show_grid([("a.jpg", "a", "/f", "1"), ("b.mp4", "b", "/f", "1")])
+        assert sorted(calls) == ["a.jpg", "b.mp4"]
+        assert pane._grid_is_video == [True, False]
+    finally:
+        pane.deleteLater()
+
+
+def test_show_grid_keeps_parallel_columns_aligned(qapp, monkeypatch):
+    """Videos come first (landscape before portrait, larger first), then
+    images in input order; the path and flag columns follow the same
+    order as the item tuples.
+
+    Failure mode: reordering one column but not the others would pair a
+    tile's thumbnail with another file's info label and video flag.
+    """
+    from app.views import preview_pane as pp
+
+    sizes = {"small.mp4": 10, "big.mp4": 99}
+    monkeypatch.setattr(pp, "get_file_size_bytes", lambda p: sizes[p])
+    monkeypatch.setattr(pp, "_read_image_dims", lambda p: (40, 30))
+    pane = PreviewPane(parent=None, task_runner=_grid_runner())
+    try:
+        monkeypatch.setattr(pane, "_compute_grid_geometry", lambda: (2, 200))
+        pane.show_grid(
+            [
+                ("a.jpg", "a", "/f", "1"),
+                ("small.mp4", "s", "/f", "1"),
+                ("b.jpg", "b", "/f", "1"),
+                ("big.mp4", "g", "/f", "1"),
+            ]
+        )
+        assert pane._grid_paths == ["big.mp4", "small.mp4", "a.jpg", "b.jpg"]
+        assert pane._grid_is_video == [True, True, False, False]
+        assert [it[0] for it in pane._grid_items] == pane._grid_paths
+    finally:
+        pane.deleteLater()
+
+
 # ── _try_group_autoplay (delegation) ─────────────────────────────────────
 
 
 def test_try_group_autoplay_marks_ready_when_all_videos_loaded():
-    """When every video in ``_grid_items`` has a player registered
+    """When every video in ``_grid_paths`` has a player registered
     in ``_grid_video_players``, mark the group as ready and
     register every player with the media controller.
 
@@ -344,10 +742,8 @@ def test_try_group_autoplay_marks_ready_when_all_videos_loaded():
     p2 = MagicMock()
     fake_self = SimpleNamespace(
         # Two video items in the grid
-        _grid_items=[
-            ("a.mp4", "a", "/f", "1024", "", "", ""),
-            ("b.mp4", "b", "/f", "1024", "", "", ""),
-        ],
+        _grid_paths=["a.mp4", "b.mp4"],
+        _grid_is_video=[True, True],
         _grid_all_players_ready=False,
         # Both have players registered
         _grid_video_players={"a.mp4": p1, "b.mp4": p2},
@@ -366,10 +762,8 @@ def test_try_group_autoplay_noop_when_pending_videos_remain():
     don't mark ready, don't register anything."""
     fake_controller = MagicMock()
     fake_self = SimpleNamespace(
-        _grid_items=[
-            ("a.mp4", "a", "/f", "1024", "", "", ""),
-            ("b.mp4", "b", "/f", "1024", "", "", ""),
-        ],
+        _grid_paths=["a.mp4", "b.mp4"],
+        _grid_is_video=[True, True],
         _grid_all_players_ready=False,
         # Only one player registered → b.mp4 is pending
         _grid_video_players={"a.mp4": MagicMock()},
@@ -386,7 +780,8 @@ def test_try_group_autoplay_noop_when_no_grid_items():
     """No grid displayed → no-op. Defends against the very first
     call before any grid is shown."""
     fake_self = SimpleNamespace(
-        _grid_items=[],
+        _grid_paths=[],
+        _grid_is_video=[],
         _grid_all_players_ready=False,
         _grid_video_players={},
         _grid_media_controller=MagicMock(),
@@ -478,6 +873,44 @@ def test_apply_single_pixmap_fit_skips_when_no_pixmap():
     fake_self._single_label.setPixmap.assert_not_called()
 
 
+def test_apply_single_pixmap_fit_skips_when_nothing_changed(qapp, monkeypatch):
+    """Repeated fits at the same width, for the same pixmap, rescale
+    once; a new pixmap or a new width each rescale again.
+
+    Failure mode: every Resize event during a drag re-runs a smooth
+    ``scaledToWidth`` over the full image even though nothing moved.
+    """
+    from PySide6.QtGui import QPixmap
+
+    pane = PreviewPane(parent=None, task_runner=MagicMock())
+    try:
+        fits: list[int] = []
+        real_set = pane._single_label.setPixmap
+        monkeypatch.setattr(
+            pane._single_label, "setPixmap", lambda pm: fits.append(pm.width()) or real_set(pm)
+        )
+        vp_width = [300]
+        monkeypatch.setattr(pane.preview_area.viewport(), "width", lambda: vp_width[0])
+        pane._single_pm = QPixmap(600, 400)
+
+        pane._apply_single_pixmap_fit()
+        pane._apply_single_pixmap_fit()
+        assert len(fits) == 1
+
+        vp_width[0] = 250
+        pane._apply_single_pixmap_fit()
+        assert len(fits) == 2
+
+        pane._single_pm = QPixmap(600, 400)
+        pane._apply_single_pixmap_fit()
+        assert len(fits) == 3
+
+        pane.clear()
+        assert pane._single_fit is None
+    finally:
+        pane.deleteLater()
+
+
 # ── clear (state-reset contract) ─────────────────────────────────────────
 
 
@@ -496,6 +929,8 @@ def test_clear_resets_all_state_attrs(qapp):
     pane = PreviewPane(parent=None, task_runner=fake_runner)
     try:
         # Populate state as if a grid was being shown
+        pane._grid_paths = ["a.jpg"]
+        pane._grid_is_video = [False]
         pane._grid_items = [("a.jpg", "a", "/f", "1024", "", "", "")]
         pane._grid_labels = {"grid|a.jpg": MagicMock()}
         pane._single_pm = MagicMock()
@@ -505,6 +940,8 @@ def test_clear_resets_all_state_attrs(qapp):
         # Every state attr the "is something displayed?" predicates
         # check must be reset.
         assert pane._grid_items == []
+        assert pane._grid_paths == []
+        assert pane._grid_is_video == []
         assert pane._grid_labels == {}
         assert pane._single_pm is None
         assert pane._grid_container is None
@@ -685,16 +1122,15 @@ def test_on_video_tile_clicked_returns_early_when_player_exists():
         _grid_video_players={"/a.mp4": existing_player},
     )
 
-    fake_tile = MagicMock()
     fake_layout = MagicMock()
+    fake_self._grid_layout = fake_layout
     fake_thumb = MagicMock()
 
     PreviewPane._on_video_tile_clicked(
         fake_self,
         path="/a.mp4",
-        tile=fake_tile,
-        layout=fake_layout,
         thumbnail_label=fake_thumb,
+        info_label=MagicMock(),
         name="a.mp4",
         folder="/f",
         size_txt="1024",
@@ -878,6 +1314,60 @@ def test_show_single_video_does_not_auto_play(qapp):
         pane.deleteLater()
 
 
+def test_grid_video_players_are_capped_and_extra_clicks_refused(qapp, monkeypatch):
+    """A tile clicked past GRID_MAX_VIDEO_PLAYERS keeps its thumbnail and
+    the running players are left alone; reaching the cap still counts as
+    "all videos instantiated" for group autoplay.
+
+    Failure mode: every clicked tile keeps its media pipeline and video
+    surface alive until the group changes.
+    """
+    from PySide6.QtWidgets import QWidget
+
+    from app.views import preview_pane as pp
+
+    class _FakePlayer(QWidget):
+        def __init__(self, path, parent=None):
+            super().__init__(parent)
+            self.cleaned = False
+
+        def play(self):
+            pass
+
+        def cleanup(self):
+            self.cleaned = True
+
+    monkeypatch.setattr(pp, "VideoPlayerWidget", _FakePlayer)
+    monkeypatch.setattr(pp, "GRID_MAX_VIDEO_PLAYERS", 2)
+    pane = PreviewPane(parent=None, task_runner=_grid_runner())
+    try:
+        monkeypatch.setattr(pane, "_compute_grid_geometry", lambda: (3, 120))
+        pane.show_grid([(f"v{i}.mp4", f"v{i}", "/f", "1") for i in range(3)])
+        paths = [it[0] for it in pane._grid_items]
+        layout = pane._grid_layout
+
+        def _click(i):
+            pane._on_video_tile_clicked(
+                paths[i], pane._grid_tile_labels[i], pane._grid_info_labels[i],
+                paths[i], "/f", "1",
+            )
+
+        _click(0)
+        first = pane._grid_video_players[paths[0]]
+        assert pane._grid_all_players_ready is False
+        _click(1)
+        assert pane._grid_all_players_ready is True
+        _click(2)
+
+        assert list(pane._grid_video_players) == paths[:2]
+        assert not first.cleaned
+        lbl2 = pane._grid_tile_labels[2]
+        assert layout.indexOf(lbl2) >= 0
+        assert pane._grid_all_players_ready is True
+    finally:
+        pane.deleteLater()
+
+
 # ── async resolution slot + stale-path guard (#622 Phase 1) ──────────────
 
 
@@ -17,16 +17,22 @@ from __future__ import annotations
 import pytest
 
 from app.views.preview_pane_helpers import (
+    BoundedLRUCache,
     aspect_bucket_from_resolution,
     attach_resolutions,
     build_info_rows,
-    classify_image_token,
     compute_fit_width,
     compute_grid_geometry,
+    compute_visible_tile_count,
+    fits_box,
     format_info_html,
     format_resolution_string,
     get_file_size_bytes,
+    needs_grid_relayout,
+    needs_thumbnail_redecode,
     normalize_grid_items,
+    thumb_side_bucket,
+    visible_tile_range,
 )
 
 
@@ -258,16 +264,14 @@ class TestComputeGridGeometry:
     def test_pathological_zero_viewport_returns_fallback(self):
         """Defensive: 0-width viewport (e.g. during a resize event
         before the widget is laid out) returns the (1, min_px)
-        fallback — the iteration breaks on the first column because
-        ``0 // 1 < min_px``. Without the ``max(1, viewport_width)``
-        guard, ``(0 - 0) // 1 == 0`` and the math degenerates."""
+        fallback because the clamped width of 1 is below ``min_px``.
+        Without the ``max(1, viewport_width)`` guard the math
+        degenerates on a zero width."""
         cols, cell = compute_grid_geometry(
             viewport_width=0, thumb_size_max=300, spacing=5, min_px=150
         )
         assert cols == 1
-        # Returns the initial best_cell value (min_px) because
-        # the first iteration's `cell = 1 - 0 = 1` is below min_px,
-        # immediately breaking the loop with no candidates evaluated.
+        # Falls back to min_px: a 1px cell is below the floor.
         assert cell == 150
 
     def test_clamps_cell_to_max_thumb_size(self):
@@ -287,6 +291,182 @@ class TestComputeGridGeometry:
         # The clamp uses 600 — so cell never exceeds 600
         assert cell <= 600
 
+    def test_matches_the_per_column_scan(self):
+        """The closed form returns what the original 1..63-column scan
+        did, across widths 100-10000 and the parameter shapes in use."""
+
+        def _scan(width, max_px, spacing, min_px):
+            width = max(1, width)
+            max_px = max_px if max_px > 0 else 600
+            best_cols, best_cell = 1, min_px
+            for cols in range(1, 64):
+                cell = (width - spacing * (cols - 1)) // cols
+                if cell < min_px:
+                    break
+                cand = min(cell, max_px)
+                if cand >= best_cell:
+                    best_cell, best_cols = cand, cols
+            return best_cols, best_cell
+
+        for max_px, spacing, min_px in (
+            (512, 2, 150), (300, 5, 150), (0, 2, 150), (120, 2, 150), (160, 0, 10),
+        ):
+            for width in range(100, 10001, 7):
+                assert compute_grid_geometry(
+                    viewport_width=width,
+                    thumb_size_max=max_px,
+                    spacing=spacing,
+                    min_px=min_px,
+                ) == _scan(width, max_px, spacing, min_px), (width, max_px, spacing, min_px)
+
+
+# ── fits_box ─────────────────────────────────────────────────────────────
+
+
+class TestFitsBox:
+    def test_decode_at_tile_side_fits(self):
+        assert fits_box(200, 150, 200, 200)
+        assert fits_box(90, 200, 200, 200)
+
+    def test_smaller_image_needs_upscale(self):
+        assert not fits_box(100, 75, 200, 200)
+
+    def test_larger_image_needs_downscale(self):
+        assert not fits_box(400, 300, 200, 200)
+
+    def test_empty_image_never_fits(self):
+        assert not fits_box(0, 0, 200, 200)
+
+
+# ── compute_visible_tile_count ───────────────────────────────────────────
+
+
+class TestComputeVisibleTileCount:
+    """Viewport-height × cell → size of the synchronous tile batch."""
+
+    def test_counts_full_rows_plus_one_lookahead_row(self):
+        """600px viewport, 200px cells, 4px spacing → 2 full rows
+        (204px each) + 1 lookahead row = 3 rows × 3 cols = 9 tiles."""
+        assert compute_visible_tile_count(
+            viewport_height=600, cell_size=200, spacing=4, cols=3
+        ) == 9
+
+    def test_zero_height_viewport_still_builds_one_row(self):
+        """An un-laid-out viewport (height 0) must still build the
+        first row — otherwise nothing paints until the first deferred
+        batch lands."""
+        assert compute_visible_tile_count(
+            viewport_height=0, cell_size=200, spacing=4, cols=2
+        ) == 2
+
+    def test_degenerate_inputs_return_at_least_one(self):
+        """Zero cols / zero cell size don't divide by zero and never
+        return an empty batch (which would stall the deferred loop)."""
+        assert compute_visible_tile_count(
+            viewport_height=-5, cell_size=0, spacing=0, cols=0
+        ) >= 1
+
+
+# ── visible_tile_range ───────────────────────────────────────────────────
+
+
+class TestVisibleTileRange:
+    def test_top_of_grid_includes_lookahead_row(self):
+        # 250px viewport over 100px rows → rows 0..2 visible, row 3 lookahead.
+        assert visible_tile_range(0, 250, 100, 3, 100) == (0, 12)
+
+    def test_scrolled_range_starts_at_first_visible_row(self):
+        assert visible_tile_range(450, 200, 100, 2, 100) == (8, 16)
+
+    def test_clamped_to_tile_count(self):
+        assert visible_tile_range(0, 1000, 100, 4, 10) == (0, 10)
+        assert visible_tile_range(5000, 200, 100, 4, 10) == (10, 10)
+
+    def test_negative_scroll_and_degenerate_sizes(self):
+        assert visible_tile_range(-30, 0, 0, 0, 5) == (0, 2)
+
+
+# ── needs_grid_relayout / needs_thumbnail_redecode ───────────────────────
+
+
+class TestNeedsGridRelayout:
+    """Which resize ticks have to touch the existing tiles."""
+
+    def test_column_change_always_relayouts(self):
+        assert needs_grid_relayout(3, 200, 4, 200) is True
+
+    def test_small_growth_is_skipped(self):
+        assert needs_grid_relayout(3, 200, 3, 215) is False
+        assert needs_grid_relayout(3, 200, 3, 200) is False
+
+    def test_growth_at_threshold_relayouts(self):
+        assert needs_grid_relayout(3, 200, 3, 216) is True
+
+    def test_any_shrink_relayouts(self):
+        """Tiles are fixed-size and the horizontal scrollbar is off —
+        a 1px shrink left in place clips the right column."""
+        assert needs_grid_relayout(3, 200, 3, 199) is True
+
+
+class TestNeedsThumbnailRedecode:
+    """Rescale the cached pixmap unless the upscale would blur."""
+
+    def test_shrink_reuses_pixmap(self):
+        assert needs_thumbnail_redecode(pixmap_side=300, cell_size=200) is False
+
+    def test_mild_growth_reuses_pixmap(self):
+        assert needs_thumbnail_redecode(pixmap_side=200, cell_size=250) is False
+
+    def test_large_growth_redecodes(self):
+        assert needs_thumbnail_redecode(pixmap_side=200, cell_size=251) is True
+
+    def test_empty_pixmap_redecodes(self):
+        assert needs_thumbnail_redecode(pixmap_side=0, cell_size=10) is True
+
+
+# ── thumb_side_bucket / BoundedLRUCache ──────────────────────────────────
+
+
+class TestThumbSideBucket:
+    def test_rounds_to_nearest_step(self):
+        assert thumb_side_bucket(205) == 192
+        assert thumb_side_bucket(223) == 224
+
+    def test_never_below_one_step(self):
+        assert thumb_side_bucket(3) == 32
+        assert thumb_side_bucket(0, step=0) == 1
+
+
+class TestBoundedLRUCache:
+    """Entry- and cost-capped LRU."""
+
+    def test_get_refreshes_recency(self):
+        cache = BoundedLRUCache(max_entries=2, max_cost=100)
+        cache.put("a", 1, cost=1)
+        cache.put("b", 2, cost=1)
+        assert cache.get("a") == 1
+        cache.put("c", 3, cost=1)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+
+    def test_cost_budget_evicts_oldest(self):
+        cache = BoundedLRUCache(max_entries=10, max_cost=10)
+        cache.put("a", 1, cost=6)
+        cache.put("b", 2, cost=6)
+        assert cache.get("a") is None
+        assert len(cache) == 1 and cache.total_cost == 6
+
+    def test_oversized_single_entry_is_kept(self):
+        cache = BoundedLRUCache(max_entries=10, max_cost=10)
+        cache.put("big", 1, cost=50)
+        assert cache.get("big") == 1
+
+    def test_replacing_a_key_updates_cost(self):
+        cache = BoundedLRUCache(max_entries=10, max_cost=100)
+        cache.put("a", 1, cost=30)
+        cache.put("a", 2, cost=10)
+        assert cache.get("a") == 2 and cache.total_cost == 10
+
 
 # ── compute_fit_width ────────────────────────────────────────────────────
 
@@ -317,36 +497,6 @@ class TestComputeFitWidth:
         assert compute_fit_width(pixmap_width=500, viewport_width=1) == 500
 
 
-# ── classify_image_token ─────────────────────────────────────────────────
-
-
-class TestClassifyImageToken:
-    """Token-prefix routing for ``on_image_loaded`` dispatch."""
-
-    def test_single_token_returns_single(self):
-        assert classify_image_token("single|/photos/x.jpg") == "single"
-
-    def test_grid_token_returns_grid(self):
-        assert classify_image_token("grid|/photos/x.jpg") == "grid"
-
-    def test_unknown_token_returns_none(self):
-        """An unrecognised prefix → None (ignore). A new surface
-        added later (e.g. ``"thumbnail|…"``) returns None until
-        ``classify_image_token`` learns about it — the silent-ignore
-        is the right default behaviour (no UI side-effects from
-        unknown payloads)."""
-        assert classify_image_token("thumbnail|/x.jpg") is None
-
-    def test_empty_token_returns_none(self):
-        assert classify_image_token("") is None
-
-    def test_non_string_token_returns_none(self):
-        """Defensive: a None or int token (caller bug) shouldn't
-        crash the slot."""
-        assert classify_image_token(None) is None  # type: ignore[arg-type]
-        assert classify_image_token(42) is None  # type: ignore[arg-type]
-
-
 # ── get_file_size_bytes ──────────────────────────────────────────────────
 
 
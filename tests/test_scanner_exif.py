@@ -64,6 +64,29 @@ class TestParseExifDate:
     def test_invalid_format_returns_none(self):
         assert _parse_exif_date("not-a-date") is None
 
+    def test_fixed_width_fast_path_matches_strptime(self):
+        """The fixed-width shape skips strptime; it must accept and reject
+        exactly what strptime does for that shape."""
+        for raw in (
+            "2024:02:29 23:59:59",
+            "1999:12:31 00:00:00",
+            "2023:02:29 10:00:00",  # not a leap year
+            "2024:13:01 10:00:00",
+            "2024:06:01 24:00:00",
+            "2024:06:01T10:00:00",
+            "2024:0a:01 10:00:00",
+            "2:24:06:01 10:00:00",
+        ):
+            try:
+                expected = datetime.strptime(raw, "%Y:%m:%d %H:%M:%S")
+            except ValueError:
+                expected = None
+            assert _parse_exif_date(raw) == expected, raw
+
+    def test_unpadded_fields_still_parse(self):
+        """Shapes other than fixed-width keep strptime's 1-digit fields."""
+        assert _parse_exif_date("2024:6:1 9:05:00") == datetime(2024, 6, 1, 9, 5, 0)
+
 
 # ── parse_exif_date edge cases (deeper coverage of date-parsing edges) ─────
 
@@ -392,6 +392,40 @@ class TestManifestSchemaColumns:
         result = _make_row(hr, "")
         assert result.file_size_bytes == 500
 
+    def test_make_row_reads_size_and_times_from_one_stat(self, tmp_path, monkeypatch):
+        """Failure mode: separate getsize / getmtime / getctime calls cost
+        three metadata round-trips per scanned file instead of one."""
+        import os
+        from datetime import datetime
+        from unittest.mock import MagicMock
+        from scanner.dedup import _make_row, HashResult
+        f = tmp_path / "photo.jpg"
+        f.write_bytes(b"x" * 42)
+        st = os.stat(f)
+        stats: list[str] = []
+        real_stat = os.stat
+        monkeypatch.setattr(os, "stat", lambda p, *a, **k: stats.append(p) or real_stat(p, *a, **k))
+        hr = HashResult(
+            record=MagicMock(path=f, source_label="jdrive", file_type="jpeg", pair_partner=None),
+            sha256="abc", phash=None, exif_date=None,
+        )
+        result = _make_row(hr, "")
+        assert stats == [str(f)]
+        assert result.file_size_bytes == 42
+        assert result.mtime == datetime.fromtimestamp(st.st_mtime).isoformat()
+        assert result.creation_date == datetime.fromtimestamp(st.st_ctime).isoformat()
+
+    def test_make_row_leaves_metadata_empty_for_a_missing_file(self, tmp_path):
+        from unittest.mock import MagicMock
+        from scanner.dedup import _make_row, HashResult
+        hr = HashResult(
+            record=MagicMock(path=tmp_path / "gone.jpg", source_label="jdrive",
+                             file_type="jpeg", pair_partner=None),
+            sha256="abc", phash=None, exif_date=None,
+        )
+        result = _make_row(hr, "")
+        assert (result.file_size_bytes, result.mtime, result.creation_date) == (None, None, None)
+
     def test_make_row_populates_shot_date_from_exif_date(self, tmp_path):
         from datetime import datetime
         from unittest.mock import MagicMock
@@ -1871,6 +1871,48 @@ class TestThresholdSelectionLogic:
         assert result == []
 
 
+class TestNumericReaders:
+    """Field → reader table the threshold / top-N selectors resolve once."""
+
+    def test_every_numeric_field_has_a_reader(self):
+        from app.views.dialogs.select_dialog import _NUMERIC_FIELDS, _NUMERIC_READERS
+
+        assert set(_NUMERIC_READERS) == set(_NUMERIC_FIELDS)
+
+    def test_unknown_field_or_op_selects_nothing(self, qapp):
+        from app.views.dialogs.select_dialog import (
+            select_paths_by_threshold,
+            select_paths_top_n,
+        )
+
+        g = _make_group([_make_record(file_path="a/1.jpg", file_size_bytes=50)])
+        assert select_paths_by_threshold([g], "File Name", ">", "1") == []
+        assert select_paths_by_threshold([g], "Size (Bytes)", "=~", "1") == []
+        assert select_paths_top_n([g], "File Name", 1, "desc") == []
+
+    def test_every_comparison_op_applies(self, qapp):
+        from app.views.dialogs.select_dialog import (
+            _CMP_FUNCS,
+            select_paths_by_threshold,
+        )
+
+        g = _make_group([
+            _make_record(file_path=f"a/{size}.jpg", file_size_bytes=size)
+            for size in (50, 100, 150)
+        ])
+        expected = {
+            ">": ["a/150.jpg"],
+            ">=": ["a/100.jpg", "a/150.jpg"],
+            "<": ["a/50.jpg"],
+            "<=": ["a/50.jpg", "a/100.jpg"],
+            "==": ["a/100.jpg"],
+            "!=": ["a/50.jpg", "a/150.jpg"],
+        }
+        assert set(expected) == set(_CMP_FUNCS)
+        for op, paths in expected.items():
+            assert select_paths_by_threshold([g], "Size (Bytes)", op, "100") == paths, op
+
+
 class TestTopNSelectionLogic:
     """select_paths_top_n ranks within group, not globally."""
 
@@ -2920,3 +2962,99 @@ class TestD3DeleteConfirm:
         assert len(received) == 1, "Emit must still fire in flat layout"
 
 
+
+
+class TestAsyncPreview:
+    """Large manifests run the live regex preview on a worker thread."""
+
+    def _dialog(self, monkeypatch, match_fn):
+        from app.views.dialogs import select_dialog
+        from app.views.dialogs.select_dialog import ActionDialog
+
+        started = []
+
+        class _Pool:
+            def __init__(self, _parent):
+                pass
+
+            def setMaxThreadCount(self, _n):
+                pass
+
+            def clear(self):
+                started.append("clear")
+
+            def start(self, task):
+                started.append(task)
+
+        monkeypatch.setattr(select_dialog, "_ASYNC_PREVIEW_MIN_RECORDS", 0)
+        monkeypatch.setattr(select_dialog, "QThreadPool", _Pool)
+        dlg = ActionDialog(fields=["File Name"], match_fn=match_fn)
+        started.clear()
+        return dlg, started
+
+    def test_large_manifest_defers_match_to_worker(self, qapp, monkeypatch):
+        calls = []
+
+        def match_fn(f, p):
+            calls.append(p)
+            return (1, 9, [("a.jpg", "a.jpg")])
+
+        dlg, started = self._dialog(monkeypatch, match_fn)
+        calls.clear()
+        dlg.regex.setText("a")
+        dlg._refresh_preview()
+
+        assert calls == [], "UI thread must not run the scan"
+        tasks = [t for t in started if t != "clear"]
+        assert len(tasks) == 1 and dlg._preview_pending
+
+        tasks[0].run()
+        qapp.processEvents()
+        assert calls == ["a"]
+        assert dlg._last_matched_count == 1
+        assert not dlg._preview_pending
+
+    def test_stale_worker_result_is_ignored(self, qapp, monkeypatch):
+        dlg, started = self._dialog(monkeypatch, lambda f, p: (len(p), 9, []))
+        dlg.regex.setText("a")
+        dlg._refresh_preview()
+        dlg.regex.setText("abc")
+        dlg._refresh_preview()
+
+        tasks = [t for t in started if t != "clear"]
+        tasks[1].run()
+        tasks[0].run()  # finishes last but belongs to the older pattern
+        qapp.processEvents()
+        assert dlg._last_matched_count == 3
+
+    def test_superseded_scans_are_cleared_before_each_start(self, qapp, monkeypatch):
+        """Failure mode: every debounced keystroke queued another full
+        scan on the shared global pool, so stale scans piled up and ran
+        concurrently against the UI thread."""
+        dlg, started = self._dialog(monkeypatch, lambda f, p: (0, 9, []))
+        for text in ("a", "ab", "abc"):
+            dlg.regex.setText(text)
+            dlg._refresh_preview()
+
+        assert [t == "clear" for t in started] == [True, False] * 3
+
+    def test_preview_pool_runs_one_scan_at_a_time(self, qapp):
+        from app.views.dialogs.select_dialog import ActionDialog
+
+        dlg = ActionDialog(fields=["File Name"], match_fn=lambda f, p: (0, 0, []))
+        assert dlg._preview_pool.maxThreadCount() == 1
+
+    def test_apply_settles_in_flight_preview(self, qapp, monkeypatch):
+        dlg, started = self._dialog(monkeypatch, lambda f, p: (len(p), 9, []))
+        dlg.regex.setText("abcd")
+        dlg._refresh_preview()
+        assert dlg._preview_pending
+
+        dlg._settle_pending_preview()
+        assert dlg._last_matched_count == 4
+        assert not dlg._preview_pending
+
+        tasks = [t for t in started if t != "clear"]
+        tasks[0].run()  # late worker result must not overwrite
+        qapp.processEvents()
+        assert dlg._last_matched_count == 4
@@ -105,3 +105,34 @@ class TestSortService:
         # No assertion on order — just verify no exception was raised
         # and the items are still present.
         assert len(g.items) == 2
+
+    def test_string_key_descending(self):
+        """A descending text key really descends. The decorated sort
+        tagged every descending string ``(1, s)``, which still ordered
+        them ascending among themselves."""
+        g = _group(_rec("/a.jpg"), _rec("/c.jpg"), _rec("/b.jpg"))
+        SortService().sort([g], [("file_path", False)])
+        assert [r.file_path for r in g.items] == ["/c.jpg", "/b.jpg", "/a.jpg"]
+
+    def test_mixed_directions_per_key(self):
+        # primary: folder desc; tiebreak: size asc
+        g = _group(
+            _rec("/1.jpg", folder="A", size=2),
+            _rec("/2.jpg", folder="B", size=9),
+            _rec("/3.jpg", folder="A", size=1),
+            _rec("/4.jpg", folder="B", size=3),
+        )
+        SortService().sort([g], [("folder_path", False), ("file_size_bytes", True)])
+        assert [r.file_path for r in g.items] == ["/4.jpg", "/2.jpg", "/3.jpg", "/1.jpg"]
+
+    def test_none_dates_sort_first_without_type_error(self):
+        """A date field mixing None and datetimes must not compare the
+        two; None sorts first ascending, as the empty string did."""
+        from datetime import datetime
+
+        a, b, c = _rec("/a.jpg"), _rec("/b.jpg"), _rec("/c.jpg")
+        a.shot_date = datetime(2022, 1, 1)
+        c.shot_date = datetime(2021, 1, 1)
+        g = _group(a, b, c)
+        SortService().sort([g], [("shot_date", True)])
+        assert [r.file_path for r in g.items] == ["/b.jpg", "/c.jpg", "/a.jpg"]
@@ -40,6 +40,8 @@ def _rec(file_path: str = "/photos/a.jpg", **overrides) -> SimpleNamespace:
         creation_date=None,
         pixel_width=None,
         pixel_height=None,
+        phash=None,
+        score=None,
     )
     base.update(overrides)
     return SimpleNamespace(**base)
@@ -208,6 +210,37 @@ class TestSortStateRoundTrip:
         assert col == 5
         assert order == Qt.DescendingOrder
 
+    def test_refresh_sorts_new_proxy_once_by_preserved_state(self, qapp, monkeypatch):
+        """The fresh proxy is sorted exactly once, by the preserved
+        column / order, and sorting is left enabled for header clicks.
+
+        Failure mode: installing the proxy with sorting on sorts it by
+        the header's stale indicator and then again by the preserved
+        state — two full sorts per rebuild on a large manifest."""
+        from app.views.components import tree_controller as tc
+
+        controller, _vm = _build(qapp)
+        controller.update_sort_state(4, Qt.DescendingOrder)
+        sorts: list[int] = []
+        real_build = tc.build_model
+
+        def _counting_build(groups):
+            model, proxy = real_build(groups)
+            proxy.layoutChanged.connect(lambda *_: sorts.append(1))
+            return model, proxy
+
+        monkeypatch.setattr(tc, "build_model", _counting_build)
+        controller.refresh_model([
+            SimpleNamespace(group_number=1, items=[_rec("/photos/a.jpg")]),
+            SimpleNamespace(group_number=2, items=[_rec("/photos/b.jpg")]),
+        ])
+
+        header = controller.tree.header()
+        assert len(sorts) == 1
+        assert header.sortIndicatorSection() == 4
+        assert header.sortIndicatorOrder() == Qt.DescendingOrder
+        assert controller.tree.isSortingEnabled()
+
 
 # ── properties ─────────────────────────────────────────────────────────────
 
@@ -219,6 +252,16 @@ class TestProperties:
         assert controller.model is not None
         assert controller.proxy is not None
 
+    def test_refresh_expands_groups_and_restores_updates(self, qapp):
+        """Every group row is expanded after a rebuild and the viewport
+        repaints again. Failure mode: an exception in the expand/resize
+        batch leaves ``updatesEnabled`` False and the tree goes blank."""
+        controller, view_model = _build(qapp)
+        tree = controller.tree
+        for row in range(view_model.rowCount()):
+            assert tree.isExpanded(view_model.index(row, 0))
+        assert tree.updatesEnabled()
+
 
 # ── header / selection wiring ─────────────────────────────────────────────
 
@@ -507,6 +550,51 @@ class TestUpdateDecisionCells:
         assert action_item.text() == _action_display("")
         assert action_item.data(SORT_ROLE) == 3
 
+    def test_one_role_hinted_data_changed_per_cell(self, qapp):
+        """Text + SORT_ROLE land in a single ``dataChanged`` carrying
+        both role hints, and the cell's flags survive the merge.
+
+        Failure mode: reverting to ``setText`` + ``setData`` doubles
+        the emissions, and each one re-sorts the row under the proxy."""
+        from PySide6.QtCore import Qt
+
+        from app.views.constants import COL_ACTION, COL_GROUP, SORT_ROLE
+
+        controller, _vm = _build(qapp)
+        action_item = controller.model.item(0, COL_GROUP).child(0, COL_ACTION)
+        assert not action_item.isEditable()
+        emitted: list[list[int]] = []
+        controller.model.dataChanged.connect(lambda _tl, _br, roles: emitted.append(list(roles)))
+
+        controller.update_decision_cells([(0, 0, "delete")])
+
+        assert len(emitted) == 1
+        assert set(emitted[0]) >= {int(Qt.DisplayRole), SORT_ROLE}
+        assert not action_item.isEditable()
+
+    def test_bulk_update_emits_one_data_changed_per_group(self, qapp):
+        """A multi-row update folds its per-cell signals into one
+        ``dataChanged`` per group spanning the touched rows.
+
+        Failure mode: emitting per cell makes the proxy re-evaluate and
+        the view repaint once per row of a large bulk selection."""
+        from app.views.constants import COL_ACTION
+
+        controller, _vm = _build(qapp)
+        emitted: list[tuple[int, int, int, int]] = []
+        controller.model.dataChanged.connect(
+            lambda tl, br, _roles: emitted.append(
+                (tl.parent().row(), tl.row(), br.row(), tl.column())
+            )
+        )
+
+        controller.update_decision_cells(
+            [(0, 1, "delete"), (0, 0, "delete"), (1, 0, "delete")]
+        )
+
+        assert sorted(emitted) == [(0, 0, 1, COL_ACTION), (1, 0, 0, COL_ACTION)]
+        assert not controller.model.signalsBlocked()
+
     def test_empty_changes_list_is_noop(self, qapp):
         """No changes → no model mutation, no exception."""
         controller, _vm = _build(qapp)
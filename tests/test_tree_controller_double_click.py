@@ -34,6 +34,8 @@ def _rec(file_path: str) -> SimpleNamespace:
         creation_date=None,
         pixel_width=None,
         pixel_height=None,
+        phash=None,
+        score=None,
     )
 
 
@@ -41,6 +41,8 @@ def _rec(**overrides):
         creation_date=None,
         pixel_width=None,
         pixel_height=None,
+        phash=None,
+        score=None,
     )
     base.update(overrides)
     return SimpleNamespace(**base)
@@ -471,6 +473,200 @@ class TestBuildModel:
         assert model is not None
         assert proxy is None
 
+    def test_unconvertible_date_sorts_as_zero_without_dropping_other_roles(self, qapp):
+        """A date whose ``timestamp()`` raises (naive pre-1970 dates on
+        Windows) sorts as 0; the row's other sort roles are still set.
+
+        Failure mode: with the per-cell guards gone, an unguarded
+        ``timestamp()`` would abort the whole model build.
+        """
+        from app.views.constants import COL_CREATION_DATE, COL_SIZE_BYTES, SORT_ROLE
+
+        class _PreEpoch(datetime):
+            def timestamp(self):
+                raise OSError(22, "Invalid argument")
+
+        old = _PreEpoch(1969, 7, 20)
+        rec = _rec(file_path="/p/a.jpg", creation_date=old, shot_date=old)
+        model, _ = build_model([_group([rec])])
+        group = model.item(0, 0)
+        assert group.child(0, COL_CREATION_DATE).data(SORT_ROLE) == 0
+        assert group.child(0, COL_SIZE_BYTES).data(SORT_ROLE) == 12345
+        assert model.item(0, COL_CREATION_DATE).data(SORT_ROLE) == 0
+
+    def test_per_file_columns_are_derived_once_per_record(self, qapp, monkeypatch):
+        """The group aggregates and the file rows share one name / date
+        derivation per record, and the group keys still agree with the
+        rows they summarise.
+
+        Failure mode: deriving the name separately for the group's
+        min-name key and for each file row doubles the name splits and
+        timestamp conversions done per load.
+        """
+        from app.views import tree_model_builder as tmb
+        from app.views.constants import COL_CREATION_DATE, COL_NAME, SORT_ROLE
+
+        paths: list[str] = []
+        real_basename = tmb.basename
+        monkeypatch.setattr(tmb, "basename", lambda p: paths.append(p) or real_basename(p))
+        stamps: list[object] = []
+        real_stamp = tmb._sort_timestamp
+        monkeypatch.setattr(
+            tmb, "_sort_timestamp", lambda dt: stamps.append(dt) or real_stamp(dt)
+        )
+        recs = [
+            _rec(file_path="/p/B.jpg", creation_date=datetime(2021, 1, 1)),
+            _rec(file_path="/p/a.jpg", creation_date=datetime(2020, 1, 1)),
+            _rec(file_path="/p/c.jpg"),
+        ]
+        model, _ = build_model([_group(recs)])
+        assert sorted(paths) == ["/p/B.jpg", "/p/a.jpg", "/p/c.jpg"]
+        assert len(stamps) == 2 * len(recs)
+        group = model.item(0, 0)
+        assert model.item(0, COL_NAME).data(SORT_ROLE) == "a.jpg"
+        assert group.child(0, COL_NAME).data(SORT_ROLE) == "B.jpg"
+        assert model.item(0, COL_CREATION_DATE).data(SORT_ROLE) == int(
+            datetime(2020, 1, 1).timestamp()
+        )
+        assert group.child(2, COL_CREATION_DATE).data(SORT_ROLE) == 0
+
+    def test_text_columns_sort_case_insensitively_through_the_proxy(self, qapp):
+        """Name / folder SORT_ROLE keeps the original case; the proxy's
+        case-insensitive compare orders groups and rows as if folded.
+
+        Failure mode: a proxy left case-sensitive would sort every
+        upper-case name ahead of every lower-case one.
+        """
+        from PySide6.QtCore import Qt
+
+        from app.views.constants import COL_FOLDER, COL_NAME
+
+        groups = [
+            _group([_rec(file_path="/p/b.jpg", folder_path="/x/beta")], group_number=1),
+            _group([_rec(file_path="/p/A.jpg", folder_path="/x/Gamma")], group_number=2),
+            _group([_rec(file_path="/p/c.jpg", folder_path="/x/alpha")], group_number=3),
+        ]
+        _, proxy = build_model(groups)
+
+        def _order():
+            return [
+                proxy.index(0, COL_NAME, proxy.index(r, 0)).data()
+                for r in range(proxy.rowCount())
+            ]
+
+        proxy.sort(COL_NAME, Qt.AscendingOrder)
+        assert _order() == ["A.jpg", "b.jpg", "c.jpg"]
+        proxy.sort(COL_FOLDER, Qt.AscendingOrder)
+        assert _order() == ["c.jpg", "b.jpg", "A.jpg"]
+
+    def test_action_labels_resolve_once_per_decision(self, qapp, monkeypatch):
+        """Each distinct decision is translated once per build; every row
+        still shows its own label.
+
+        Failure mode: a translator lookup per file row, for a column that
+        takes one of four values.
+        """
+        from app.views import tree_model_builder as tmb
+        from app.views.constants import COL_ACTION
+
+        calls: list[str] = []
+        real_display = tmb._action_display
+        monkeypatch.setattr(
+            tmb, "_action_display", lambda d: calls.append(d) or real_display(d)
+        )
+        decisions = ["delete", "", "delete", "delete", ""]
+        recs = [_rec(file_path=f"/p/{i}.jpg", user_decision=d) for i, d in enumerate(decisions)]
+        model, _ = build_model([_group(recs[:3]), _group(recs[3:], group_number=2)])
+        assert sorted(calls) == ["", "delete"]
+        shown = [
+            model.item(g, 0).child(r, COL_ACTION).text()
+            for g in range(2)
+            for r in range(model.item(g, 0).rowCount())
+        ]
+        assert shown == [real_display(d) for d in decisions]
+
+    def test_shared_timestamps_format_once_per_build(self, qapp):
+        """Rows sharing a timestamp reuse one formatted date text.
+
+        Failure mode: a ``strftime`` per date cell, although the copies in
+        a duplicate group usually carry the same shot date.
+        """
+        from datetime import datetime
+
+        from app.views.constants import COL_CREATION_DATE, COL_SHOT_DATE
+
+        calls: list[datetime] = []
+
+        class _CountingDT(datetime):
+            def strftime(self, fmt):
+                calls.append(self)
+                return super().strftime(fmt)
+
+        shot = _CountingDT(2021, 5, 1, 10, 0, 0)
+        made = _CountingDT(2022, 1, 2, 3, 4, 5)
+        recs = [
+            _rec(file_path=f"/p/{i}.jpg", shot_date=shot, creation_date=made) for i in range(3)
+        ]
+        model, _ = build_model([_group(recs)])
+        assert sorted(calls) == [shot, made]
+        group = model.item(0, 0)
+        assert {group.child(r, COL_SHOT_DATE).text() for r in range(3)} == {
+            "2021-05-01 10:00:00"
+        }
+        assert group.child(2, COL_CREATION_DATE).text() == "2022-01-02 03:04:05"
+
+    def test_every_cell_is_read_only_and_the_template_stays_blank(self, qapp):
+        """Cells are clones of one read-only template: every group and file
+        cell comes out non-editable, and filling a clone's text never
+        reaches the template the next build clones from.
+
+        Failure mode: setting text on the shared template instead of the
+        clone would stamp the last file's value into every blank cell.
+        """
+        from PySide6.QtCore import Qt
+
+        from app.views import tree_model_builder as tmb
+
+        recs = [_rec(file_path="/p/a.jpg"), _rec(file_path="/p/b.jpg")]
+        model, _ = build_model([_group(recs)])
+        group = model.item(0, 0)
+        cells = [model.item(0, c) for c in range(model.columnCount())]
+        cells += [group.child(r, c) for r in range(2) for c in range(model.columnCount())]
+        assert all(not (cell.flags() & Qt.ItemIsEditable) for cell in cells)
+        assert tmb._CELL_TEMPLATE.text() == ""
+        assert tmb._CELL_TEMPLATE.data(tmb.SORT_ROLE) is None
+
+    def test_inserts_each_group_once_with_children_attached(self, qapp, monkeypatch):
+        """Children are appended to the group before it joins the model, so
+        the model sees one insert per group, never one per file.
+
+        Failure mode: appending the group row first turns every child
+        append into a model-level rowsInserted round — one per file.
+        """
+        from PySide6.QtGui import QStandardItemModel
+
+        from app.views import tree_model_builder as tmb
+
+        inserts: list[tuple[bool, int]] = []
+
+        class _CountingModel(QStandardItemModel):
+            def __init__(self, *a, **k):
+                super().__init__(*a, **k)
+                self.rowsInserted.connect(
+                    lambda parent, first, last: inserts.append(
+                        (parent.isValid(), last - first + 1)
+                    )
+                )
+
+        monkeypatch.setattr(tmb, "QStandardItemModel", _CountingModel)
+        groups = [
+            _group([_rec(file_path=f"/p/{g}_{i}.jpg") for i in range(3)], group_number=g)
+            for g in (1, 2)
+        ]
+        model, _ = build_model(groups)
+        assert inserts == [(False, 1), (False, 1)]
+        assert [model.item(r, 0).rowCount() for r in range(model.rowCount())] == [3, 3]
+
 
 # ── _action_display: lock glyph (photo-manager#164) ────────────────────────
 
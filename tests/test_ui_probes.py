@@ -1000,8 +1000,8 @@ def test_probe_scanner_and_infrastructure_popen_declare_creationflags():
 # ── #474 — per-row stat budget in scanner/dedup.py::_make_row ─────────────
 #
 # Context: `_make_row` runs once per classified record in the pass-1/2/3
-# scan loop. It currently issues two `os.path.get*` calls (`getsize` +
-# `getmtime`) plus `get_filesystem_creation_datetime` — documented at
+# scan loop. It currently issues a single `os.stat` for size, mtime and
+# ctime (earlier: `getsize` + `getmtime` + `getctime`) — documented at
 # scanner/dedup.py:113-114 as the intentional scan-time-vs-load-time
 # trade-off ("eliminates all filesystem I/O at load time"). The trade-off
 # is principled but has no automatic guardrail: a future 4th
@@ -77,6 +77,8 @@ def test_video_player_widget_constructs_with_qapp(qapp):
         assert w._duration == 0
         assert w._last_position == 0
         assert w._slider_dragging is False
+        assert w._pending_position is None
+        assert w._emit_timer.isActive() is False
     finally:
         w.cleanup()
         w.deleteLater()
@@ -394,12 +396,18 @@ class TestOnPositionChanged:
             _progress_slider=fake_slider,
             _last_position=0,
             _update_current_time=MagicMock(),
+            _emit_timer=MagicMock(isActive=MagicMock(return_value=False)),
             positionChanged=fake_signal,
         )
 
         VideoPlayerWidget._on_position_changed(fake_self, 7777)
 
         fake_slider.setValue.assert_called_once_with(7777)
+        # Moved with signals blocked, then the previous state restored
+        assert fake_slider.blockSignals.call_args_list[0].args == (True,)
+        assert fake_slider.blockSignals.call_args_list[-1].args == (
+            fake_slider.blockSignals.return_value,
+        )
         fake_self._update_current_time.assert_called_once_with(7777)
         assert fake_self._last_position == 7777
         fake_signal.emit.assert_called_once_with(7777)
@@ -415,6 +423,7 @@ class TestOnPositionChanged:
             _progress_slider=fake_slider,
             _last_position=0,
             _update_current_time=MagicMock(),
+            _emit_timer=MagicMock(isActive=MagicMock(return_value=False)),
             positionChanged=fake_signal,
         )
 
@@ -427,6 +436,46 @@ class TestOnPositionChanged:
         assert fake_self._last_position == 7777
         fake_signal.emit.assert_called_once_with(7777)
 
+    def test_playing_holds_position_for_the_timer(self):
+        """While the coalescing timer runs, each media tick only
+        replaces the pending position; nothing is emitted until the
+        timer flushes. Failure mode: emitting per tick fans every
+        ~30 Hz update out to the group controller's slider + label
+        for every registered player."""
+        fake_signal = MagicMock()
+        fake_self = SimpleNamespace(
+            _slider_dragging=False,
+            _progress_slider=MagicMock(),
+            _last_position=0,
+            _pending_position=None,
+            _update_current_time=MagicMock(),
+            _emit_timer=MagicMock(isActive=MagicMock(return_value=True)),
+            positionChanged=fake_signal,
+        )
+
+        VideoPlayerWidget._on_position_changed(fake_self, 100)
+        VideoPlayerWidget._on_position_changed(fake_self, 133)
+
+        fake_signal.emit.assert_not_called()
+        assert fake_self._pending_position == 133
+        # The player's own slider still follows every tick
+        assert fake_self._progress_slider.setValue.call_count == 2
+
+
+# ── _flush_position ──────────────────────────────────────────────────────
+
+
+class TestFlushPosition:
+    def test_emits_latest_pending_once(self):
+        fake_signal = MagicMock()
+        fake_self = SimpleNamespace(_pending_position=4321, positionChanged=fake_signal)
+
+        VideoPlayerWidget._flush_position(fake_self)
+        VideoPlayerWidget._flush_position(fake_self)
+
+        fake_signal.emit.assert_called_once_with(4321)
+        assert fake_self._pending_position is None
+
 
 # ── _on_state_changed ────────────────────────────────────────────────────
 
@@ -436,18 +485,34 @@ class TestOnStateChanged:
         fake_signal = MagicMock()
         fake_self = SimpleNamespace(
             _update_play_button=MagicMock(),
+            _emit_timer=MagicMock(),
+            _flush_position=MagicMock(),
             stateChanged=fake_signal,
         )
 
-        VideoPlayerWidget._on_state_changed(
-            fake_self, QMediaPlayer.PlaybackState.PlayingState
-        )
+        VideoPlayerWidget._on_state_changed(fake_self, QMediaPlayer.PlaybackState.PlayingState)
 
         fake_self._update_play_button.assert_called_once()
-        fake_signal.emit.assert_called_once_with(
-            QMediaPlayer.PlaybackState.PlayingState
+        fake_self._emit_timer.start.assert_called_once_with()
+        fake_signal.emit.assert_called_once_with(QMediaPlayer.PlaybackState.PlayingState)
+
+    def test_leaving_playback_stops_timer_and_flushes(self):
+        """Pausing stops the coalescing timer and sends the held-back
+        position, so the group controller ends on where the video
+        actually stopped rather than up to one interval earlier."""
+        fake_self = SimpleNamespace(
+            _update_play_button=MagicMock(),
+            _emit_timer=MagicMock(),
+            _flush_position=MagicMock(),
+            stateChanged=MagicMock(),
         )
 
+        VideoPlayerWidget._on_state_changed(fake_self, QMediaPlayer.PlaybackState.PausedState)
+
+        fake_self._emit_timer.stop.assert_called_once_with()
+        fake_self._emit_timer.start.assert_not_called()
+        fake_self._flush_position.assert_called_once_with()
+
 
 # ── _update_current_time ─────────────────────────────────────────────────
 
@@ -545,6 +610,24 @@ class TestPublicAPISetVolume:
         fake_audio.setVolume.assert_called_once_with(0.5)
         fake_slider.setValue.assert_called_once_with(50)
 
+    def test_slider_move_does_not_reset_audio_volume(self, qapp):
+        """The slider is moved with its signals blocked, so
+        ``_on_volume_changed`` doesn't overwrite the exact volume with
+        the slider's rounded integer. The block is lifted afterwards:
+        a user drag still reaches the audio output."""
+        w = VideoPlayerWidget("nonexistent.mp4", parent=None)
+        try:
+            w.set_volume(0.333)
+            assert w._volume_slider.value() == 33
+            assert w._audio_output.volume() == pytest.approx(0.333, abs=1e-3)
+            assert w._volume_slider.signalsBlocked() is False
+
+            w._volume_slider.setValue(80)
+            assert w._audio_output.volume() == pytest.approx(0.8, abs=1e-3)
+        finally:
+            w.cleanup()
+            w.deleteLater()
+
 
 # ── public API: getters ──────────────────────────────────────────────────
 